@@ -1,30 +1,64 @@
 from dotenv import load_dotenv, find_dotenv
-from supabase import create_client, Client
+from supabase import create_client, Client, ClientOptions
+from typing import Dict, Tuple
 import os
+import threading
 import logging
+import httpx
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Default sizes of the connection pool shared by every Supabase request in the
+# process; override per worker with the environment variables of the same name
+SUPABASE_MAX_CONNECTIONS = 40
+SUPABASE_MAX_KEEPALIVE_CONNECTIONS = 20
+SUPABASE_KEEPALIVE_EXPIRY = 60  # Seconds an idle pooled connection is kept open
+SUPABASE_TIMEOUT = 30  # seconds
+
+def _create_http_client() -> httpx.Client:
+    """Create the pooled keep-alive HTTP client Supabase requests go through."""
+    limits = httpx.Limits(
+        max_connections=int(os.getenv("SUPABASE_MAX_CONNECTIONS", SUPABASE_MAX_CONNECTIONS)),
+        max_keepalive_connections=int(os.getenv("SUPABASE_MAX_KEEPALIVE_CONNECTIONS",
+                                                SUPABASE_MAX_KEEPALIVE_CONNECTIONS)),
+        keepalive_expiry=SUPABASE_KEEPALIVE_EXPIRY,
+    )
+    try:
+        return httpx.Client(http2=True, timeout=SUPABASE_TIMEOUT, limits=limits)
+    except ImportError:
+        logger.warning("HTTP/2 support unavailable (install httpx[http2]); falling back to HTTP/1.1.")
+        return httpx.Client(timeout=SUPABASE_TIMEOUT, limits=limits)
+
 class Database:
+    # Clients by (url, key), shared so every Database() reuses the same connections
+    _clients: Dict[Tuple[str, str], Client] = {}
+    _clients_lock = threading.Lock()
+
     def __init__(self):
         dotenv_path = find_dotenv()
         load_dotenv(dotenv_path)
-        
+
         self._url = os.getenv("SUPABASE_URL")
         self._key = os.getenv("SUPABASE_KEY")
-        
+
         if not self._url or not self._key:
             logger.error("Missing Supabase environment variables. Please set SUPABASE_URL and SUPABASE_KEY")
             raise ValueError("Missing Supabase environment variables")
-            
-        # Initialize without proxy for v2.3.5
-        self._client = create_client(
-            supabase_url=self._url,
-            supabase_key=self._key
-        )
-    
+
+        with Database._clients_lock:
+            client = Database._clients.get((self._url, self._key))
+            if client is None:
+                # Initialize without proxy for v2.3.5
+                client = create_client(
+                    supabase_url=self._url,
+                    supabase_key=self._key,
+                    options=ClientOptions(httpx_client=_create_http_client())
+                )
+                Database._clients[(self._url, self._key)] = client
+        self._client = client
+
     @property
     def client(self) -> Client:
-        return self._client
\ No newline at end of file
+        return self._client
@@ -20,6 +20,7 @@ from ..tools.calendar_tools import (
     create_and_send_calendar_event,
     send_calendar_invite,
     create_event_with_attendees,
+    schedule_if_free,
     find_mutual_free_slots
 )
 from ..tools.basic_tools import (
@@ -81,6 +82,7 @@ calendar_agent = Agent(
         "2. For sending invites: use send_calendar_invite(account_id, event_id)"
         "3. For finding mutually available time slots across multiple calendars: use find_mutual_free_slots(primary_account_id, other_account_ids, date, min_duration_minutes)"
         "   This is very useful for scheduling meetings between multiple people"
+        "4. For booking a time only if the calendar is free: use schedule_if_free(account_id, summary, start_time, end_time) instead of calling check_free_busy and then create_calendar_event"
     ),
     tools=[
         # Calendar tools
@@ -90,6 +92,7 @@ calendar_agent = Agent(
         create_calendar_event,
         create_and_send_calendar_event,
         create_event_with_attendees,
+        schedule_if_free,
         update_calendar_event,
         send_calendar_invite,
         delete_calendar_event,
@@ -23,6 +23,9 @@ figma_projects = fetch_figma_context_from_supabase("figma_projects")
 def fetch_file_wrapper(file_id: str):
     return figma_tools.fetch_file(file_id)
 
+def fetch_file_meta_wrapper(file_id: str):
+    return figma_tools.fetch_file_meta(file_id)
+
 def list_projects_wrapper(team_id: Optional[str] = None):
     if team_id is None:
         team_id = figma_tools.get_team_id()
@@ -46,6 +49,9 @@ def export_asset_wrapper(file_id: str, node_id: str, format: str = 'png', scale:
 def fetch_comments_wrapper(file_id: str):
     return figma_tools.fetch_comments(file_id)
 
+def fetch_project_comments_wrapper(project_id: str, limit: int = 5):
+    return figma_tools.fetch_project_comments(project_id, limit)
+
 def post_comment_wrapper(file_id: str, message: str, node_id: Optional[str] = None):
     return figma_tools.post_comment(file_id, message, node_id)
 
@@ -74,6 +80,7 @@ figma_agent = Agent(
     """,
     tools=[
         fetch_file_wrapper,
+        fetch_file_meta_wrapper,
         list_projects_wrapper,
         list_files_wrapper,
         traverse_nodes_wrapper,
@@ -81,6 +88,7 @@ figma_agent = Agent(
         extract_text_and_styles_wrapper,
         export_asset_wrapper,
         fetch_comments_wrapper,
+        fetch_project_comments_wrapper,
         post_comment_wrapper,
         resolve_comment_wrapper,
         compare_versions_wrapper,
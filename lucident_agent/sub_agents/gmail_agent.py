@@ -40,7 +40,9 @@ gmail_agent = Agent(
         "You are a specialized Gmail assistant. Your primary function is to interact with Gmail accounts using the provided tools. "
         "IMPORTANT: You must ALWAYS start by listing available accounts using list_gmail_accounts() before performing any other operations. "
         "After listing accounts, you can proceed with the following steps:"
-        "1. For each account, make a SEPARATE tool call to get_gmail_messages() with the specific account_id"
+        "1. For each account, make a SEPARATE tool call to get_gmail_messages() with the specific account_id. "
+        "It returns only subject, sender, date and snippet by default; pass include_body=True whenever "
+        "you need the email text, e.g. to summarize what the emails say. "
         "2. Provide a clear summary for each account before moving to the next"
         "3. If an account has no emails or returns an error, clearly state that"
         "4. After checking all accounts, provide a final summary"
@@ -0,0 +1,48 @@
+import random
+import pytest
+from ..tools import calendar_tools
+
+# --- Test _merge_busy_intervals ---
+
+def _merge_reference(starts, ends):
+    """Straightforward merge of overlapping or touching intervals, for comparison."""
+    merged = []
+    for start, end in sorted(zip(starts, ends)):
+        if merged and start <= merged[-1][1]:
+            merged[-1][1] = max(merged[-1][1], end)
+        else:
+            merged.append([start, end])
+    return [m[0] for m in merged], [m[1] for m in merged]
+
+def test_merge_busy_intervals_empty():
+    assert calendar_tools._merge_busy_intervals([], []) == ([], [])
+
+def test_merge_busy_intervals_overlapping_and_touching():
+    starts = [300.0, 0.0, 100.0, 500.0]
+    ends = [400.0, 100.0, 200.0, 600.0]
+    # 0-100 touches 100-200; 300-400 and 500-600 stay separate
+    assert calendar_tools._merge_busy_intervals(starts, ends) == ([0.0, 300.0, 500.0], [200.0, 400.0, 600.0])
+
+def test_merge_busy_intervals_contained_interval():
+    assert calendar_tools._merge_busy_intervals([0.0, 10.0], [100.0, 20.0]) == ([0.0], [100.0])
+
+@pytest.mark.parametrize("count", [
+    calendar_tools.VECTORIZED_MERGE_THRESHOLD - 1,
+    calendar_tools.VECTORIZED_MERGE_THRESHOLD,
+    calendar_tools.VECTORIZED_MERGE_THRESHOLD + 1,
+    calendar_tools.VECTORIZED_MERGE_THRESHOLD * 10,
+])
+def test_merge_busy_intervals_matches_reference_around_threshold(count):
+    # Sizes on both sides of the threshold exercise the sweep and the NumPy path
+    rng = random.Random(count)
+    starts = [float(rng.randrange(0, 10_000, 15)) for _ in range(count)]
+    ends = [start + rng.randrange(15, 240, 15) for start in starts]
+    assert calendar_tools._merge_busy_intervals(starts, ends) == _merge_reference(starts, ends)
+
+def test_merge_busy_intervals_paths_agree(monkeypatch):
+    rng = random.Random(7)
+    starts = [float(rng.randrange(0, 5_000, 30)) for _ in range(100)]
+    ends = [start + rng.randrange(30, 180, 30) for start in starts]
+    vectorized = calendar_tools._merge_busy_intervals(starts, ends)
+    monkeypatch.setattr(calendar_tools, "VECTORIZED_MERGE_THRESHOLD", len(starts))
+    assert calendar_tools._merge_busy_intervals(starts, ends) == vectorized
@@ -0,0 +1,33 @@
+import orjson
+from ..tools import gmail_account_manager
+
+TOKEN = {
+    "token": "ya29.a0AfH6SM",
+    "refresh_token": "1//0gXyz",
+    "token_uri": "https://oauth2.googleapis.com/token",
+    "client_id": "123.apps.googleusercontent.com",
+    "client_secret": "GOCSPX-abc",
+    "scopes": ["https://www.googleapis.com/auth/gmail.readonly"],
+    "universe_domain": "googleapis.com",
+    "account": "",
+    "expiry": "2026-10-15T12:00:00Z",
+}
+
+# --- Test token_data encoding ---
+
+def test_encode_token_data_writes_plain_json():
+    token_data = gmail_account_manager._encode_token_data(TOKEN)
+    assert orjson.loads(token_data) == TOKEN
+
+def test_token_data_round_trip():
+    token_data = gmail_account_manager._encode_token_data(TOKEN)
+    assert gmail_account_manager._decode_token_data(token_data) == TOKEN
+
+def test_decode_token_data_legacy_plain_json():
+    # Rows written with json.dumps spacing still parse
+    token_data = '{"token": "ya29.a0AfH6SM", "refresh_token": "1//0gXyz", "scopes": []}'
+    assert gmail_account_manager._decode_token_data(token_data) == {
+        "token": "ya29.a0AfH6SM",
+        "refresh_token": "1//0gXyz",
+        "scopes": [],
+    }
@@ -0,0 +1,70 @@
+import base64
+from ..tools import gmail_tools
+
+def _b64(text: str) -> str:
+    """Encode text the way Gmail returns body data."""
+    return base64.urlsafe_b64encode(text.encode('utf-8')).decode('ascii')
+
+def _part(mime_type: str, text: str = None, parts=None) -> dict:
+    part = {'mimeType': mime_type, 'body': {'data': _b64(text)} if text is not None else {'size': 0}}
+    if parts is not None:
+        part['parts'] = parts
+    return part
+
+# --- Test _extract_headers ---
+
+def test_extract_headers_keeps_first_target_headers():
+    headers = [
+        {'name': 'Received', 'value': 'by mx.google.com'},
+        {'name': 'Subject', 'value': 'Weekly sync'},
+        {'name': 'From', 'value': 'alice@example.com'},
+        {'name': 'Subject', 'value': 'duplicate'},
+        {'name': 'Date', 'value': 'Thu, 15 Oct 2026 09:00:00 +0800'},
+    ]
+    assert gmail_tools._extract_headers(headers) == {
+        'Subject': 'Weekly sync',
+        'From': 'alice@example.com',
+        'Date': 'Thu, 15 Oct 2026 09:00:00 +0800',
+    }
+
+# --- Test _message_body ---
+
+def test_message_body_single_part():
+    assert gmail_tools._message_body(_part('text/plain', 'Hello there')) == 'Hello there'
+
+def test_message_body_multipart_alternative():
+    payload = _part('multipart/alternative', parts=[
+        _part('text/plain', 'Plain body'),
+        _part('text/html', '<p>HTML body</p>'),
+    ])
+    assert gmail_tools._message_body(payload) == 'Plain body'
+
+def test_message_body_nested_multipart():
+    # multipart/mixed > multipart/alternative > text/plain, as sent with attachments
+    payload = _part('multipart/mixed', parts=[
+        _part('multipart/alternative', parts=[
+            _part('text/html', '<p>Nested HTML</p>'),
+            _part('text/plain', 'Nested plain'),
+        ]),
+        _part('application/pdf'),
+    ])
+    assert gmail_tools._message_body(payload) == 'Nested plain'
+
+def test_message_body_skips_empty_text_plain():
+    payload = _part('multipart/mixed', parts=[
+        _part('text/plain'),
+        _part('multipart/related', parts=[_part('text/plain', 'Deeper plain')]),
+    ])
+    assert gmail_tools._message_body(payload) == 'Deeper plain'
+
+def test_message_body_without_text_plain():
+    payload = _part('multipart/alternative', parts=[_part('text/html', '<p>Only HTML</p>')])
+    assert gmail_tools._message_body(payload) == ''
+
+def test_message_body_metadata_only_payload():
+    assert gmail_tools._message_body({'mimeType': 'text/plain', 'headers': []}) == ''
+
+def test_message_body_replaces_invalid_utf8():
+    data = base64.urlsafe_b64encode(b'caf\xe9 ok').decode('ascii')
+    payload = {'mimeType': 'text/plain', 'body': {'data': data}}
+    assert gmail_tools._message_body(payload) == 'caf\ufffd ok'
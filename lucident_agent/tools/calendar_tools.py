@@ -8,19 +8,31 @@ import socket
 import webbrowser
 import logging
 import time
-from typing import Optional, Dict, List, Union, Any, TypedDict, Literal, Tuple
+import random
+import re
+import concurrent.futures
+import functools
+import threading
+from operator import itemgetter
+from typing import Optional, Dict, List, Union, Any, TypedDict, Literal, Tuple, NamedTuple, Sequence
 from zoneinfo import ZoneInfo
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
+from google_auth_httplib2 import AuthorizedHttp
 from googleapiclient.discovery import build
+from googleapiclient.model import JsonModel
 from google_auth_oauthlib.flow import InstalledAppFlow
-from tenacity import retry, stop_after_attempt, wait_exponential
+import orjson
+import numpy as np
+import httpx
+from tenacity import retry, stop_after_attempt, retry_if_exception
 from googleapiclient.errors import HttpError
 from dotenv import load_dotenv
-from supabase import create_client, Client
+from supabase import create_client, Client, PostgrestAPIError
 
 # Import Database class
 from lucident_agent.Database import Database
+from lucident_agent.tools.http_transport import HttpxTransport, get_http_client
 # Import Config class for TIMEZONE
 from lucident_agent.config import Config
 
@@ -40,8 +52,35 @@ SCOPES = [
 # Constants
 DEFAULT_ACCOUNT = 'default'
 MAX_RETRIES = 3
-RATE_LIMIT_DELAY = 1  # seconds
+RATE_LIMIT_PER_SECOND = 10  # Calendar API per-user quota
+RATE_LIMIT_BURST = 20
+RATE_LIMIT_BACKOFF = 60  # seconds to run at a reduced rate after a 429
+MAX_RETRY_DELAY = 30  # seconds
+RETRYABLE_STATUS_CODES = frozenset({408, 429, 500, 502, 503, 504})
+MAX_BATCH_SIZE = 50  # Google caps batch requests at 50 sub-requests
+MAX_WORKERS = 10  # Concurrent Calendar API calls for multi-event/multi-account fan-out
+SERVICE_CACHE_TTL = 50 * 60  # seconds; kept below the 60-minute access token lifetime
+SERVICE_CACHE_MAX_ENTRIES = 64  # Cached Calendar services, oldest evicted first
+FREE_BUSY_CACHE_TTL = 60  # seconds
+WORKING_HOURS_START = datetime.time(9)  # Free-slot search window, in the user's timezone
+WORKING_HOURS_END = datetime.time(17)
+VECTORIZED_MERGE_THRESHOLD = 32  # Busy periods above which merging switches to NumPy
 TIMEZONE = Config.TIMEZONE  # Use timezone from Config class
+UTC = datetime.timezone.utc
+try:
+    USER_TZ = ZoneInfo(TIMEZONE)
+except Exception as tz_err:
+    logger.warning(f"Could not load timezone {TIMEZONE}: {tz_err}. Using UTC.")
+    USER_TZ = UTC
+ONE_MINUTE = datetime.timedelta(minutes=1)
+EVENT_TIME_ZONE = {'timeZone': 'UTC'}  # Default time zone for event start/end, user can override
+DEFAULT_RECURRENCE = ("RRULE:FREQ=DAILY;COUNT=5",)  # Serialized as a JSON array like a list
+RFC3339_UTC_PATTERN = re.compile(r'^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}Z$')
+ISO_DATE_PATTERN = re.compile(r'(\d{4})-(\d{2})-(\d{2})')
+# Non-ISO date formats accepted by the free-slot finders, tried in order
+ALT_DATE_FORMATS = ('%Y-%m-%d', '%m/%d/%Y', '%d/%m/%Y', '%b %d %Y', '%d %b %Y')
+# Server-managed event fields that must never be sent back in an update
+IMMUTABLE_EVENT_FIELDS = frozenset({'id', 'iCalUID', 'etag', 'htmlLink', 'created', 'updated'})
 
 # --- Use Database class for Supabase access ---
 try:
@@ -118,62 +157,67 @@ class CalendarSupabaseManager:
             return None
         try:
             response = self.supabase.table('tokens').select('token_data').eq('user_id', account_id).eq('token_type', 'google_calendar').limit(1).execute()
-            if response.data:
-                token_json = response.data[0]['token_data']
-                credentials_dict = json.loads(token_json)
-                # Ensure necessary keys for refresh are present
-                if 'client_id' not in credentials_dict or 'client_secret' not in credentials_dict:
-                     logger.warning(f"Credentials for {account_id} missing client_id or client_secret. Refresh may fail.")
-                     credentials_dict.setdefault('client_id', GOOGLE_CREDENTIALS['web']['client_id'])
-                     credentials_dict.setdefault('client_secret', GOOGLE_CREDENTIALS['web']['client_secret'])
-                     credentials_dict.setdefault('token_uri', GOOGLE_CREDENTIALS['web']['token_uri'])
-
-                return credentials_dict
-            else:
-                logger.warning(f"No Calendar credentials found in Supabase for account {account_id}.")
-                return None
-        except Exception as e:
-            logger.error(f"Error getting Calendar credentials for {account_id} from Supabase: {e}", exc_info=True)
+        except PostgrestAPIError as e:
+            logger.error(f"Error getting Calendar credentials for {account_id} from Supabase: {e}")
+            return None
+
+        if not response.data:
+            logger.warning(f"No Calendar credentials found in Supabase for account {account_id}.")
+            return None
+
+        try:
+            credentials_dict = orjson.loads(response.data[0]['token_data'])
+        except orjson.JSONDecodeError as e:
+            logger.error(f"Could not parse Calendar token data for {account_id}: {e}")
             return None
 
+        # Ensure necessary keys for refresh are present
+        if 'client_id' not in credentials_dict or 'client_secret' not in credentials_dict:
+             logger.warning(f"Credentials for {account_id} missing client_id or client_secret. Refresh may fail.")
+             credentials_dict.setdefault('client_id', GOOGLE_CREDENTIALS['web']['client_id'])
+             credentials_dict.setdefault('client_secret', GOOGLE_CREDENTIALS['web']['client_secret'])
+             credentials_dict.setdefault('token_uri', GOOGLE_CREDENTIALS['web']['token_uri'])
+
+        return credentials_dict
+
     def get_accounts(self) -> Dict[str, Dict[str, Any]]:
         """Lists all configured Calendar accounts from Supabase."""
         accounts_details = {}
         if not self._check_supabase(): return accounts_details
         try:
             response = self.supabase.table('tokens').select('user_id, token_data').eq('token_type', 'google_calendar').execute()
-            if response.data:
-                for record in response.data:
-                    account_id = record['user_id']
-                    try:
-                        token_data = json.loads(record['token_data'])
-                        # Extract expiry and scopes safely
-                        expiry_str = token_data.get("expiry")
-                        scopes = token_data.get("scopes", [])
-
-                        serializable_expiry = None
-                        if expiry_str and isinstance(expiry_str, str):
-                             try:
-                                 # Validate format but keep the string
-                                 datetime.datetime.fromisoformat(expiry_str.replace('Z', '+00:00'))
-                                 serializable_expiry = expiry_str
-                             except ValueError:
-                                 logger.warning(f"Invalid expiry format for {account_id}: {expiry_str}. Setting expiry to None.")
-                                 serializable_expiry = None
-
-                        accounts_details[account_id] = {
-                            "scopes": scopes,
-                            "expiry": serializable_expiry
-                        }
-                    except json.JSONDecodeError:
-                        logger.error(f"Could not parse token data for account {account_id}. Skipping.")
-                    except Exception as parse_err:
-                        logger.error(f"Error processing account details for {account_id}: {parse_err}")
-            return accounts_details
-        except Exception as e:
-            logger.error(f"Error getting Calendar accounts from Supabase: {e}", exc_info=True)
+        except PostgrestAPIError as e:
+            logger.error(f"Error getting Calendar accounts from Supabase: {e}")
             return {}
 
+        for record in response.data or []:
+            account_id = record['user_id']
+            try:
+                token_data = orjson.loads(record['token_data'])
+            except orjson.JSONDecodeError:
+                logger.error(f"Could not parse token data for account {account_id}. Skipping.")
+                continue
+
+            # Extract expiry and scopes safely
+            expiry_str = token_data.get("expiry")
+            scopes = token_data.get("scopes", [])
+
+            serializable_expiry = None
+            if expiry_str and isinstance(expiry_str, str):
+                 try:
+                     # Validate format but keep the string
+                     _parse_rfc3339(expiry_str)
+                     serializable_expiry = expiry_str
+                 except ValueError:
+                     logger.warning(f"Invalid expiry format for {account_id}: {expiry_str}. Setting expiry to None.")
+                     serializable_expiry = None
+
+            accounts_details[account_id] = {
+                "scopes": scopes,
+                "expiry": serializable_expiry
+            }
+        return accounts_details
+
     def remove_account(self, account_id: str) -> bool:
         """Removes an account from Supabase."""
         if not self._check_supabase(): return False
@@ -183,6 +227,7 @@ class CalendarSupabaseManager:
         try:
             response = self.supabase.table('tokens').delete().eq('user_id', account_id).eq('token_type', 'google_calendar').execute()
             logger.info(f"Removed Calendar account {account_id} from Supabase.")
+            invalidate_calendar_service(account_id)
             # If this was the default account, clear default
             if self.default_account_id == account_id:
                 self.default_account_id = None
@@ -266,42 +311,165 @@ def get_credentials(account_id: str) -> Optional[Credentials]:
         logger.error(f"Error getting or refreshing Calendar credentials for {account_id}: {e}", exc_info=True)
         return None
 
+class OrjsonModel(JsonModel):
+    """JsonModel that (de)serializes request and response bodies with orjson."""
+
+    def serialize(self, body_value):
+        if isinstance(body_value, dict) and "data" not in body_value and self._data_wrapper:
+            body_value = {"data": body_value}
+        serialized = orjson.dumps(body_value).decode("utf-8")
+        # googleapiclient sizes request bodies with len(str), so keep non-ASCII escaped like json.dumps
+        return serialized if serialized.isascii() else json.dumps(body_value)
+
+    def deserialize(self, content):
+        try:
+            body = orjson.loads(content)
+        except orjson.JSONDecodeError:
+            try:
+                return content.decode("utf-8")
+            except AttributeError:
+                return content
+        if self._data_wrapper and "data" in body:
+            body = body["data"]
+        return body
+
+# Built services keyed by account_id. They run over the thread-safe shared httpx
+# transport, so one service per account serves every thread.
+_service_cache: Dict[str, Tuple[Any, float]] = {}
+_service_cache_lock = threading.Lock()
+
 def build_calendar_service(account_id: str) -> Optional[Any]:
-    """Build a Calendar API service using credentials for the given account."""
+    """Build a Calendar API service using credentials for the given account.
+
+    Services are cached per account for SERVICE_CACHE_TTL seconds so back-to-back
+    tool calls skip the credential lookup and service construction.
+    """
+    with _service_cache_lock:
+        cached = _service_cache.get(account_id)
+    if cached and cached[1] > time.monotonic():
+        logger.debug(f"Using cached Calendar service for account {account_id}.")
+        return cached[0]
+
     try:
         creds = get_credentials(account_id)
         if not creds:
             logger.error(f"Could not get valid credentials for Calendar account {account_id}.")
             return None
         
-        service = build("calendar", "v3", credentials=creds)
+        # static_discovery uses the discovery document bundled with the client library
+        http = AuthorizedHttp(creds, http=HttpxTransport(get_http_client()))
+        service = build("calendar", "v3", http=http, static_discovery=True, cache_discovery=False,
+                        model=OrjsonModel())
+        with _service_cache_lock:
+            _service_cache.pop(account_id, None)
+            while len(_service_cache) >= SERVICE_CACHE_MAX_ENTRIES:
+                del _service_cache[next(iter(_service_cache))]
+            _service_cache[account_id] = (service, time.monotonic() + SERVICE_CACHE_TTL)
         logger.info(f"Successfully built Calendar service for account {account_id}.")
         return service
     except Exception as e:
         logger.error(f"Error building Calendar service for account {account_id}: {e}", exc_info=True)
         return None
 
-@retry(stop=stop_after_attempt(MAX_RETRIES), wait=wait_exponential(multiplier=1, min=2, max=10))
-def execute_with_retry(request_fn):
-    """Execute an API request with retry and rate limit handling."""
+def invalidate_calendar_service(account_id: str) -> None:
+    """Drop cached Calendar services for an account so the next call rebuilds them."""
+    with _service_cache_lock:
+        _service_cache.pop(account_id, None)
+
+def _is_retryable_error(exc: BaseException) -> bool:
+    """Return True for transient errors (rate limits, server errors, timeouts) worth retrying."""
+    if isinstance(exc, HttpError):
+        if exc.resp.status in RETRYABLE_STATUS_CODES:
+            return True
+        # Calendar reports per-user rate limits as 403 rateLimitExceeded/userRateLimitExceeded
+        return exc.resp.status == 403 and b'ratelimitexceeded' in (exc.content or b'').lower()
+    # Calls go through httpx, whose network errors are not builtin ConnectionError/TimeoutError
+    return isinstance(exc, (TimeoutError, ConnectionError, httpx.TransportError))
+
+def _retry_delay(retry_state) -> float:
+    """Full jittered exponential backoff, honoring Retry-After on 429 responses."""
+    delay = min(MAX_RETRY_DELAY, 2 ** (retry_state.attempt_number - 1) * (1 + random.random() * 0.5))
+    exc = retry_state.outcome.exception()
+    if isinstance(exc, HttpError) and exc.resp.status == 429:
+        retry_after = exc.resp.get('retry-after', '')
+        if retry_after.isdigit():
+            delay = max(delay, int(retry_after))
+    return delay
+
+class TokenBucket:
+    """Thread-safe token bucket that paces requests locally instead of letting the server reject them.
+
+    On a 429 the refill rate is halved for RATE_LIMIT_BACKOFF seconds, then restored.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        self.base_rate = rate
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.throttled_until = 0.0
+        self.lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        if self.throttled_until and now >= self.throttled_until:
+            self.rate = self.base_rate
+            self.throttled_until = 0.0
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def acquire(self, tokens: int = 1) -> None:
+        """Take tokens, sleeping until the bucket has refilled enough to cover them."""
+        with self.lock:
+            self._refill(time.monotonic())
+            # Reserve the tokens up front (possibly going negative) so waiting callers queue fairly
+            self.tokens -= tokens
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+        if wait:
+            time.sleep(wait)
+
+    def throttle(self) -> None:
+        """Halve the refill rate after the server reported a rate limit."""
+        with self.lock:
+            now = time.monotonic()
+            self._refill(now)
+            self.rate = max(self.rate / 2, 1.0)
+            self.throttled_until = now + RATE_LIMIT_BACKOFF
+
+_rate_limiters: Dict[str, TokenBucket] = {}
+_rate_limiters_lock = threading.Lock()
+
+def _get_rate_limiter(account_id: str) -> TokenBucket:
+    """Return the token bucket for an account, creating it on first use."""
+    with _rate_limiters_lock:
+        bucket = _rate_limiters.get(account_id)
+        if bucket is None:
+            bucket = _rate_limiters[account_id] = TokenBucket(RATE_LIMIT_PER_SECOND, RATE_LIMIT_BURST)
+        return bucket
+
+@retry(stop=stop_after_attempt(MAX_RETRIES), wait=_retry_delay, retry=retry_if_exception(_is_retryable_error), reraise=True)
+def execute_with_retry(request_fn, account_id: str = DEFAULT_ACCOUNT, cost: int = 1):
+    """Execute an API request, retrying only transient errors with jittered backoff.
+
+    Requests are paced by the account's token bucket; ``cost`` is the number of
+    quota units the request consumes (e.g. the size of a batch).
+    Terminal errors (400, 401, 404, non-rate-limit 403, ...) are raised immediately.
+    """
+    bucket = _get_rate_limiter(account_id)
+    bucket.acquire(cost)
     try:
-        response = request_fn.execute()
-        time.sleep(RATE_LIMIT_DELAY)  # Basic rate limiting
-        return response
+        return request_fn.execute()
     except HttpError as e:
-        if e.resp.status in [403, 429]:  # Rate limit errors
-            logger.warning(f"Rate limit hit: {e}, retrying with exponential backoff...")
-            time.sleep(RATE_LIMIT_DELAY * 2)  # Additional delay on rate limit
-            raise  # Let retry handle it
-        elif e.resp.status in [401, 400]:  # Auth errors
-            logger.error(f"Authentication error: {e}")
-            raise  # Don't retry auth errors
+        if e.resp.status == 429:
+            bucket.throttle()
+        if _is_retryable_error(e):
+            logger.warning(f"Transient Calendar API error {e.resp.status}: {e}, retrying with backoff...")
         else:
             logger.error(f"HTTP Error during Calendar API call: {e}")
-            raise  # Let retry handle it
-    except Exception as e:
-        logger.error(f"Unexpected error during Calendar API call: {e}")
-        raise  # Let retry handle it
+        raise
+
+# Same pacing and error handling, but a single attempt: for requests unsafe to re-send
+execute_once = execute_with_retry.retry_with(stop=stop_after_attempt(1))
 
 # --- Type Definitions ---
 class CalendarAccountResponse(TypedDict):
@@ -321,6 +489,69 @@ class CalendarEvent(TypedDict):
     reminders: Optional[Dict[str, Any]]
     recurrence: Optional[List[str]]
 
+class Attendee(NamedTuple):
+    """Compact attendee record; converted to the API's attendee dict only when the event body is built."""
+    email: str
+    optional: bool = False
+
+    def to_api(self) -> Dict[str, Any]:
+        if self.optional:
+            return {'email': self.email, 'optional': True}
+        return {'email': self.email}
+
+# --- Error Responses ---
+MISSING_PARAMS_MESSAGE = "Missing required event parameters."
+MISSING_PARAMS_ERROR = "Summary, start time, and end time are required."
+AUTH_ERROR = "Could not authenticate with Calendar API."
+NOT_FOUND_ERROR = "The specified event does not exist."
+
+def _err_auth(account_id: str) -> CalendarAccountResponse:
+    """Response for when the Calendar service could not be built for an account."""
+    return CalendarAccountResponse(
+        status="error",
+        message=f"Failed to build Calendar service for account {account_id}.",
+        error_message=AUTH_ERROR,
+        data=None
+    )
+
+def _err_not_found(event_id: str) -> CalendarAccountResponse:
+    """Response for an event ID that does not exist."""
+    return CalendarAccountResponse(
+        status="error",
+        message=f"Event {event_id} not found.",
+        error_message=NOT_FOUND_ERROR,
+        data=None
+    )
+
+def _err_missing_params() -> CalendarAccountResponse:
+    """Response for an event missing its summary, start or end time."""
+    return CalendarAccountResponse(
+        status="error",
+        message=MISSING_PARAMS_MESSAGE,
+        error_message=MISSING_PARAMS_ERROR,
+        data=None
+    )
+
+def _err_http(account_id: str, e: HttpError) -> CalendarAccountResponse:
+    """Response for a Calendar API HttpError. Drops the cached service on 401 so the next call rebuilds it."""
+    if e.resp.status == 401:
+        invalidate_calendar_service(account_id)
+    return CalendarAccountResponse(
+        status="error",
+        message=f"Error accessing Calendar API for account {account_id}.",
+        error_message=str(e),
+        data=None
+    )
+
+def _err_unexpected(account_id: str, action: str, e: Exception) -> CalendarAccountResponse:
+    """Response for an unexpected error while `action` (e.g. "listing Calendar events") for an account."""
+    return CalendarAccountResponse(
+        status="error",
+        message=f"Unexpected error {action} for account {account_id}.",
+        error_message=str(e),
+        data=None
+    )
+
 # --- Main Calendar Functions ---
 def list_calendar_accounts() -> CalendarAccountResponse:
     """List all configured Google Calendar accounts."""
@@ -593,12 +824,7 @@ def list_calendar_events(account_id: str, timeMin: Optional[str] = None, timeMax
     try:
         service = build_calendar_service(account_id)
         if not service:
-            return CalendarAccountResponse(
-                status="error",
-                message=f"Failed to build Calendar service for account {account_id}.",
-                error_message="Could not authenticate with Calendar API.",
-                data=None
-            )
+            return _err_auth(account_id)
         
         # Set default time range if not provided (today to next 7 days)
         now = datetime.datetime.utcnow()
@@ -615,7 +841,7 @@ def list_calendar_events(account_id: str, timeMin: Optional[str] = None, timeMax
             maxResults=maxResults,
             singleEvents=True,
             orderBy='startTime'
-        ))
+        ), account_id)
         
         events = events_result.get('items', [])
         return CalendarAccountResponse(
@@ -626,102 +852,88 @@ def list_calendar_events(account_id: str, timeMin: Optional[str] = None, timeMax
         )
     except HttpError as e:
         logger.error(f"HTTP error listing Calendar events for {account_id}: {e}", exc_info=True)
-        return CalendarAccountResponse(
-            status="error",
-            message=f"Error accessing Calendar API for account {account_id}.",
-            error_message=str(e),
-            data=None
-        )
+        return _err_http(account_id, e)
     except Exception as e:
         logger.error(f"Unexpected error listing Calendar events for {account_id}: {e}", exc_info=True)
-        return CalendarAccountResponse(
-            status="error",
-            message=f"Unexpected error listing Calendar events for account {account_id}.",
-            error_message=str(e),
-            data=None
-        )
+        return _err_unexpected(account_id, "listing Calendar events", e)
 
-def create_calendar_event(account_id: str, summary: str, description: Optional[str] = None, 
-                         location: Optional[str] = None, start_time: Optional[str] = None, end_time: Optional[str] = None,
-                         attendees: Optional[List[Dict[str, str]]] = None, 
-                         reminders: Optional[Dict[str, Any]] = None,
-                         recurrence: Optional[List[str]] = None) -> CalendarAccountResponse:
-    """Create a new event in the user's primary calendar."""
-    logger.info(f"Creating calendar event for account {account_id}")
-    
+def _build_event_body(summary: str, start_time: str, end_time: str, description: Optional[str] = None,
+                      location: Optional[str] = None,
+                      attendees: Optional[List[Union[Dict[str, str], Attendee]]] = None,
+                      reminders: Optional[Dict[str, Any]] = None,
+                      recurrence: Optional[Sequence[str]] = None) -> Dict[str, Any]:
+    """Build an event resource, including optional fields only when provided."""
+    event = {
+        'summary': summary,
+        'start': {'dateTime': start_time, **EVENT_TIME_ZONE},
+        'end': {'dateTime': end_time, **EVENT_TIME_ZONE},
+    }
+    if description:
+        event['description'] = description
+    if location:
+        event['location'] = location
+    if attendees:
+        event['attendees'] = [
+            attendee.to_api() if isinstance(attendee, Attendee) else attendee for attendee in attendees
+        ]
+    if recurrence:
+        event['recurrence'] = recurrence
+    if reminders:
+        event['reminders'] = reminders
+    return event
+
+def _insert_event(account_id: str, summary: str, start_time: Optional[str], end_time: Optional[str],
+                  success_message: str, action: str, **event_fields: Any) -> CalendarAccountResponse:
+    """Validate, build and insert an event in the primary calendar, sending updates to attendees.
+
+    `action` describes the operation for log and error messages (e.g. "creating Calendar event").
+    """
     try:
         service = build_calendar_service(account_id)
         if not service:
-            return CalendarAccountResponse(
-                status="error",
-                message=f"Failed to build Calendar service for account {account_id}.",
-                error_message="Could not authenticate with Calendar API.",
-                data=None
-            )
+            return _err_auth(account_id)
         
         # Validate required parameters
         if not summary or not start_time or not end_time:
-            return CalendarAccountResponse(
-                status="error",
-                message="Missing required event parameters.",
-                error_message="Summary, start time, and end time are required.",
-                data=None
-            )
+            return _err_missing_params()
         
-        # Build the event object
-        event = {
-            'summary': summary,
-            'start': {
-                'dateTime': start_time,
-                'timeZone': 'UTC',  # Default to UTC, user can override
-            },
-            'end': {
-                'dateTime': end_time,
-                'timeZone': 'UTC',  # Default to UTC, user can override
-            },
-        }
-        
-        # Add optional fields if provided
-        if description:
-            event['description'] = description
-        if location:
-            event['location'] = location
-        if attendees:
-            event['attendees'] = attendees
-        if recurrence:
-            event['recurrence'] = recurrence
-        if reminders:
-            event['reminders'] = reminders
+        event = _build_event_body(summary, start_time, end_time, **event_fields)
         
         # Execute the API call with retry logic
         created_event = execute_with_retry(service.events().insert(
             calendarId='primary',
             body=event,
             sendUpdates='all'  # Send notifications to attendees
-        ))
+        ), account_id)
+        _invalidate_free_busy(account_id)
         
         return CalendarAccountResponse(
             status="success",
-            message=f"Event '{summary}' created successfully.",
+            message=success_message,
             error_message=None,
             data={"event": created_event}
         )
     except HttpError as e:
-        logger.error(f"HTTP error creating Calendar event for {account_id}: {e}", exc_info=True)
-        return CalendarAccountResponse(
-            status="error",
-            message=f"Error accessing Calendar API for account {account_id}.",
-            error_message=str(e),
-            data=None
-        )
+        logger.error(f"HTTP error {action} for {account_id}: {e}", exc_info=True)
+        return _err_http(account_id, e)
     except Exception as e:
-        logger.error(f"Unexpected error creating Calendar event for {account_id}: {e}", exc_info=True)
-        return CalendarAccountResponse(
-            status="error",
-            message=f"Unexpected error creating Calendar event for account {account_id}.",
-            error_message=str(e),
-            data=None
-        )
+        logger.error(f"Unexpected error {action} for {account_id}: {e}", exc_info=True)
+        return _err_unexpected(account_id, action, e)
+
+def create_calendar_event(account_id: str, summary: str, description: Optional[str] = None, 
+                         location: Optional[str] = None, start_time: Optional[str] = None, end_time: Optional[str] = None,
+                         attendees: Optional[List[Dict[str, str]]] = None, 
+                         reminders: Optional[Dict[str, Any]] = None,
+                         recurrence: Optional[List[str]] = None) -> CalendarAccountResponse:
+    """Create a new event in the user's primary calendar."""
+    logger.info(f"Creating calendar event for account {account_id}")
+    return _insert_event(
+        account_id, summary, start_time, end_time,
+        success_message=f"Event '{summary}' created successfully.",
+        action="creating Calendar event",
+        description=description, location=location, attendees=attendees,
+        reminders=reminders, recurrence=recurrence
+    )
 
 def create_and_send_calendar_event(account_id: str, summary: str, description: Optional[str] = None, 
                          location: Optional[str] = None, start_time: Optional[str] = None, end_time: Optional[str] = None,
@@ -731,128 +943,96 @@ def create_and_send_calendar_event(account_id: str, summary: str, description: O
     """Create a new event in the user's primary calendar and automatically send invites to attendees.
     This combines event creation and invitation in one operation."""
     logger.info(f"Creating calendar event with automatic invite sending for account {account_id}")
-    
-    try:
-        service = build_calendar_service(account_id)
-        if not service:
-            return CalendarAccountResponse(
-                status="error",
-                message=f"Failed to build Calendar service for account {account_id}.",
-                error_message="Could not authenticate with Calendar API.",
-                data=None
-            )
-        
-        # Validate required parameters
-        if not summary or not start_time or not end_time:
-            return CalendarAccountResponse(
-                status="error",
-                message="Missing required event parameters.",
-                error_message="Summary, start time, and end time are required.",
-                data=None
-            )
-        
-        # Build the event object
-        event = {
-            'summary': summary,
-            'start': {
-                'dateTime': start_time,
-                'timeZone': 'UTC',  # Default to UTC, user can override
-            },
-            'end': {
-                'dateTime': end_time,
-                'timeZone': 'UTC',  # Default to UTC, user can override
-            },
-        }
-        
-        # Add optional fields if provided
-        if description:
-            event['description'] = description
-        if location:
-            event['location'] = location
-        if attendees:
-            event['attendees'] = attendees
-        if recurrence:
-            event['recurrence'] = recurrence
-        if reminders:
-            event['reminders'] = reminders
-        
-        # Execute the API call with retry logic - explicitly setting sendUpdates to 'all' to send invites
-        created_event = execute_with_retry(service.events().insert(
-            calendarId='primary',
-            body=event,
-            sendUpdates='all'  # Always send notifications to attendees
-        ))
-        
-        return CalendarAccountResponse(
-            status="success",
-            message=f"Event '{summary}' created and invites sent successfully.",
-            error_message=None,
-            data={"event": created_event}
-        )
-    except HttpError as e:
-        logger.error(f"HTTP error creating Calendar event for {account_id}: {e}", exc_info=True)
-        return CalendarAccountResponse(
-            status="error",
-            message=f"Error accessing Calendar API for account {account_id}.",
-            error_message=str(e),
-            data=None
-        )
-    except Exception as e:
-        logger.error(f"Unexpected error creating Calendar event for {account_id}: {e}", exc_info=True)
-        return CalendarAccountResponse(
-            status="error",
-            message=f"Unexpected error creating Calendar event for account {account_id}.",
-            error_message=str(e),
-            data=None
-        )
+    return _insert_event(
+        account_id, summary, start_time, end_time,
+        success_message=f"Event '{summary}' created and invites sent successfully.",
+        action="creating Calendar event",
+        description=description, location=location, attendees=attendees,
+        reminders=reminders, recurrence=recurrence
+    )
+
+def create_calendar_events(events: List[Dict[str, Any]]) -> CalendarAccountResponse:
+    """Create several events concurrently, possibly across different accounts.
+
+    Args:
+        events: List of keyword-argument dicts for create_calendar_event. Each dict
+            must include "account_id" plus the usual event fields.
+
+    Returns:
+        CalendarAccountResponse with one create_calendar_event result per input, in order.
+    """
+    logger.info(f"Creating {len(events)} calendar events concurrently")
+
+    results: List[Optional[CalendarAccountResponse]] = [None] * len(events)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        future_to_index = {executor.submit(create_calendar_event, **event): index for index, event in enumerate(events)}
+
+        for future in concurrent.futures.as_completed(future_to_index):
+            index = future_to_index[future]
+            try:
+                results[index] = future.result()
+            except Exception as exc:
+                logger.error(f"Creating calendar event {index} generated an exception: {exc}", exc_info=True)
+                results[index] = CalendarAccountResponse(
+                    status="error",
+                    message=f"Failed to create calendar event {index}.",
+                    error_message=str(exc),
+                    data=None
+                )
+
+    failed = sum(1 for result in results if result['status'] == 'error')
+    return CalendarAccountResponse(
+        status="success" if not failed else "error",
+        message=f"Created {len(events) - failed} of {len(events)} calendar events.",
+        error_message=f"{failed} events could not be created." if failed else None,
+        data={"results": results}
+    )
+
+def update_calendar_event(account_id: str, event_id: str, updates: Dict[str, Any],
+                          force_full_update: bool = False) -> CalendarAccountResponse:
+    """Update an existing event in the user's primary calendar.
 
-def update_calendar_event(account_id: str, event_id: str, updates: Dict[str, Any]) -> CalendarAccountResponse:
-    """Update an existing event in the user's primary calendar."""
+    Only the fields in `updates` are sent (PATCH). Set `force_full_update` to fetch
+    the event, merge the updates and send the whole event back (PUT) instead.
+    """
     logger.info(f"Updating calendar event {event_id} for account {account_id}")
     
     try:
         service = build_calendar_service(account_id)
         if not service:
-            return CalendarAccountResponse(
-                status="error",
-                message=f"Failed to build Calendar service for account {account_id}.",
-                error_message="Could not authenticate with Calendar API.",
-                data=None
-            )
+            return _err_auth(account_id)
         
-        # First get the existing event
+        # Skip immutable fields
+        filtered_updates = {key: value for key, value in updates.items() if key not in IMMUTABLE_EVENT_FIELDS}
+
         try:
-            event = execute_with_retry(service.events().get(
-                calendarId='primary',
-                eventId=event_id
-            ))
+            if force_full_update:
+                # Read-modify-write: get the existing event and send it back in full
+                event = execute_with_retry(service.events().get(
+                    calendarId='primary',
+                    eventId=event_id
+                ), account_id)
+                event.update(filtered_updates)
+                updated_event = execute_with_retry(service.events().update(
+                    calendarId='primary',
+                    eventId=event_id,
+                    body=event,
+                    sendUpdates='all'  # Send notifications to attendees
+                ), account_id)
+                _invalidate_free_busy(account_id)
+            else:
+                updated_event = execute_with_retry(service.events().patch(
+                    calendarId='primary',
+                    eventId=event_id,
+                    body=filtered_updates,
+                    sendUpdates='all'  # Send notifications to attendees
+                ), account_id)
+                _invalidate_free_busy(account_id)
         except HttpError as e:
             if e.resp.status == 404:
-                return CalendarAccountResponse(
-                    status="error",
-                    message=f"Event {event_id} not found.",
-                    error_message="The specified event does not exist.",
-                    data=None
-                )
+                return _err_not_found(event_id)
             raise
         
-        # Update the event with the provided updates
-        for key, value in updates.items():
-            if key in ['start', 'end'] and 'dateTime' in value:
-                # Handle special case for start/end time
-                event[key] = value
-            elif key not in ['id', 'iCalUID', 'etag', 'htmlLink', 'created', 'updated']:
-                # Skip immutable fields
-                event[key] = value
-        
-        # Execute the API call with retry logic
-        updated_event = execute_with_retry(service.events().update(
-            calendarId='primary',
-            eventId=event_id,
-            body=event,
-            sendUpdates='all'  # Send notifications to attendees
-        ))
-        
         return CalendarAccountResponse(
             status="success",
             message=f"Event {event_id} updated successfully.",
@@ -861,20 +1041,10 @@ def update_calendar_event(account_id: str, event_id: str, updates: Dict[str, Any
         )
     except HttpError as e:
         logger.error(f"HTTP error updating Calendar event for {account_id}: {e}", exc_info=True)
-        return CalendarAccountResponse(
-            status="error",
-            message=f"Error accessing Calendar API for account {account_id}.",
-            error_message=str(e),
-            data=None
-        )
+        return _err_http(account_id, e)
     except Exception as e:
         logger.error(f"Unexpected error updating Calendar event for {account_id}: {e}", exc_info=True)
-        return CalendarAccountResponse(
-            status="error",
-            message=f"Unexpected error updating Calendar event for account {account_id}.",
-            error_message=str(e),
-            data=None
-        )
+        return _err_unexpected(account_id, "updating Calendar event", e)
 
 def delete_calendar_event(account_id: str, event_id: str) -> CalendarAccountResponse:
     """Delete an event from the user's primary calendar."""
@@ -883,19 +1053,15 @@ def delete_calendar_event(account_id: str, event_id: str) -> CalendarAccountResp
     try:
         service = build_calendar_service(account_id)
         if not service:
-            return CalendarAccountResponse(
-                status="error",
-                message=f"Failed to build Calendar service for account {account_id}.",
-                error_message="Could not authenticate with Calendar API.",
-                data=None
-            )
+            return _err_auth(account_id)
         
         # Execute the API call with retry logic
         execute_with_retry(service.events().delete(
             calendarId='primary',
             eventId=event_id,
             sendUpdates='all'  # Send notifications to attendees
-        ))
+        ), account_id)
+        _invalidate_free_busy(account_id)
         
         return CalendarAccountResponse(
             status="success",
@@ -905,27 +1071,12 @@ def delete_calendar_event(account_id: str, event_id: str) -> CalendarAccountResp
         )
     except HttpError as e:
         if e.resp.status == 404:
-            return CalendarAccountResponse(
-                status="error",
-                message=f"Event {event_id} not found.",
-                error_message="The specified event does not exist.",
-                data=None
-            )
+            return _err_not_found(event_id)
         logger.error(f"HTTP error deleting Calendar event for {account_id}: {e}", exc_info=True)
-        return CalendarAccountResponse(
-            status="error",
-            message=f"Error accessing Calendar API for account {account_id}.",
-            error_message=str(e),
-            data=None
-        )
+        return _err_http(account_id, e)
     except Exception as e:
         logger.error(f"Unexpected error deleting Calendar event for {account_id}: {e}", exc_info=True)
-        return CalendarAccountResponse(
-            status="error",
-            message=f"Unexpected error deleting Calendar event for account {account_id}.",
-            error_message=str(e),
-            data=None
-        )
+        return _err_unexpected(account_id, "deleting Calendar event", e)
 
 def format_event_with_link(event: Dict[str, Any]) -> Dict[str, Any]:
     """
@@ -935,14 +1086,16 @@ def format_event_with_link(event: Dict[str, Any]) -> Dict[str, Any]:
         event (Dict[str, Any]): The calendar event data.
         
     Returns:
-        Dict[str, Any]: The event data with a formatted link added.
+        Dict[str, Any]: The event data with a formatted link added. When the event
+        has no htmlLink the input dict itself is returned, so callers must not
+        mutate the result.
     """
-    formatted_event = event.copy()
-    
-    # Extract the htmlLink if it exists
-    if 'htmlLink' in event:
-        formatted_event['link'] = event['htmlLink']
+    link = event.get('htmlLink')
+    if link is None:
+        return event
     
+    formatted_event = dict(event)
+    formatted_event['link'] = link
     return formatted_event
 
 def get_calendar_event(account_id: str, event_id: str) -> CalendarAccountResponse:
@@ -952,19 +1105,14 @@ def get_calendar_event(account_id: str, event_id: str) -> CalendarAccountRespons
     try:
         service = build_calendar_service(account_id)
         if not service:
-            return CalendarAccountResponse(
-                status="error",
-                message=f"Failed to build Calendar service for account {account_id}.",
-                error_message="Could not authenticate with Calendar API.",
-                data=None
-            )
+            return _err_auth(account_id)
         
         # Execute the API call with retry logic
         try:
             event = execute_with_retry(service.events().get(
                 calendarId='primary',
                 eventId=event_id
-            ))
+            ), account_id)
             
             # Format the event to include the link
             formatted_event = format_event_with_link(event)
@@ -977,29 +1125,92 @@ def get_calendar_event(account_id: str, event_id: str) -> CalendarAccountRespons
             )
         except HttpError as e:
             if e.resp.status == 404:
-                return CalendarAccountResponse(
-                    status="error",
-                    message=f"Event {event_id} not found.",
-                    error_message="The specified event does not exist.",
-                    data=None
-                )
+                return _err_not_found(event_id)
             raise
     except HttpError as e:
         logger.error(f"HTTP error getting Calendar event for {account_id}: {e}", exc_info=True)
-        return CalendarAccountResponse(
-            status="error",
-            message=f"Error accessing Calendar API for account {account_id}.",
-            error_message=str(e),
-            data=None
-        )
+        return _err_http(account_id, e)
     except Exception as e:
         logger.error(f"Unexpected error getting Calendar event for {account_id}: {e}", exc_info=True)
+        return _err_unexpected(account_id, "getting Calendar event", e)
+
+def batch_calendar_events(account_id: str, ops: List[Tuple[str, Dict[str, Any]]]) -> CalendarAccountResponse:
+    """Run several event operations against the primary calendar in batched HTTP requests.
+
+    Args:
+        account_id: The Calendar account to act on.
+        ops: List of (operation, payload) tuples. Operation is one of "insert",
+            "update", "delete" or "get". For "insert" the payload is the event body;
+            for the others it must contain "event_id", and "update" also takes the
+            replacement event under "body".
+
+    Returns:
+        CalendarAccountResponse with one result per operation, in the order given.
+    """
+    logger.info(f"Running {len(ops)} batched calendar operations for account {account_id}")
+
+    try:
+        service = build_calendar_service(account_id)
+        if not service:
+            return _err_auth(account_id)
+
+        results: Dict[str, Dict[str, Any]] = {}
+
+        def callback(request_id, response, exception):
+            if exception:
+                results[request_id] = {"status": "error", "error_message": str(exception)}
+            else:
+                results[request_id] = {"status": "success", "event": response}
+
+        events = service.events()
+        for chunk_start in range(0, len(ops), MAX_BATCH_SIZE):
+            batch = service.new_batch_http_request(callback=callback)
+            queued_ops = set()
+            queued_count = 0
+            for index, (operation, payload) in enumerate(ops[chunk_start:chunk_start + MAX_BATCH_SIZE], start=chunk_start):
+                if operation == 'insert':
+                    request = events.insert(calendarId='primary', body=payload, sendUpdates='all')
+                elif operation == 'update':
+                    request = events.update(calendarId='primary', eventId=payload['event_id'],
+                                            body=payload['body'], sendUpdates='all')
+                elif operation == 'delete':
+                    request = events.delete(calendarId='primary', eventId=payload['event_id'], sendUpdates='all')
+                elif operation == 'get':
+                    request = events.get(calendarId='primary', eventId=payload['event_id'])
+                else:
+                    results[str(index)] = {"status": "error", "error_message": f"Unsupported operation '{operation}'."}
+                    continue
+                batch.add(request, request_id=str(index))
+                queued_ops.add(operation)
+                queued_count += 1
+
+            if queued_count:  # Skip empty batches (e.g. every op in the chunk was invalid)
+                if 'insert' in queued_ops:
+                    # Re-sending a batch would duplicate its inserts, so send it only once
+                    execute_once(batch, account_id, cost=queued_count)
+                else:
+                    execute_with_retry(batch, account_id, cost=queued_count)
+                if queued_ops != {'get'}:
+                    _invalidate_free_busy(account_id)
+
+        ordered_results = []
+        for index, (operation, _) in enumerate(ops):
+            result = results.get(str(index), {"status": "error", "error_message": "No response received."})
+            ordered_results.append({"index": index, "operation": operation, **result})
+        failed = sum(1 for result in ordered_results if result["status"] == "error")
+
         return CalendarAccountResponse(
-            status="error",
-            message=f"Unexpected error getting Calendar event for account {account_id}.",
-            error_message=str(e),
-            data=None
+            status="success" if not failed else "error",
+            message=f"Completed {len(ops) - failed} of {len(ops)} batched calendar operations.",
+            error_message=f"{failed} batched operations failed." if failed else None,
+            data={"results": ordered_results}
         )
+    except HttpError as e:
+        logger.error(f"HTTP error running batched Calendar operations for {account_id}: {e}", exc_info=True)
+        return _err_http(account_id, e)
+    except Exception as e:
+        logger.error(f"Unexpected error running batched Calendar operations for {account_id}: {e}", exc_info=True)
+        return _err_unexpected(account_id, "running batched Calendar operations", e)
 
 def quick_add_calendar_event(account_id: str, text: str) -> CalendarAccountResponse:
     """Quickly add an event to the user's primary calendar using natural language text."""
@@ -1008,19 +1219,15 @@ def quick_add_calendar_event(account_id: str, text: str) -> CalendarAccountRespo
     try:
         service = build_calendar_service(account_id)
         if not service:
-            return CalendarAccountResponse(
-                status="error",
-                message=f"Failed to build Calendar service for account {account_id}.",
-                error_message="Could not authenticate with Calendar API.",
-                data=None
-            )
+            return _err_auth(account_id)
         
         # Execute the API call with retry logic
         created_event = execute_with_retry(service.events().quickAdd(
             calendarId='primary',
             text=text,
             sendUpdates='all'  # Send notifications to attendees
-        ))
+        ), account_id)
+        _invalidate_free_busy(account_id)
         
         return CalendarAccountResponse(
             status="success",
@@ -1030,182 +1237,113 @@ def quick_add_calendar_event(account_id: str, text: str) -> CalendarAccountRespo
         )
     except HttpError as e:
         logger.error(f"HTTP error quick-adding Calendar event for {account_id}: {e}", exc_info=True)
-        return CalendarAccountResponse(
-            status="error",
-            message=f"Error accessing Calendar API for account {account_id}.",
-            error_message=str(e),
-            data=None
-        )
+        return _err_http(account_id, e)
     except Exception as e:
         logger.error(f"Unexpected error quick-adding Calendar event for {account_id}: {e}", exc_info=True)
-        return CalendarAccountResponse(
-            status="error",
-            message=f"Unexpected error quick-adding Calendar event for account {account_id}.",
-            error_message=str(e),
-            data=None
-        )
+        return _err_unexpected(account_id, "quick-adding Calendar event", e)
 
 def add_event_with_recurrence(account_id: str, summary: str, description: Optional[str] = None,
                             location: Optional[str] = None, start_time: Optional[str] = None, end_time: Optional[str] = None,
                             attendees: Optional[List[Dict[str, str]]] = None,
-                            recurrence_pattern: str = "RRULE:FREQ=DAILY;COUNT=5") -> CalendarAccountResponse:
-    """Add a recurring event to the user's primary calendar."""
+                            recurrence_pattern: Optional[str] = None) -> CalendarAccountResponse:
+    """Add a recurring event to the user's primary calendar.
+
+    recurrence_pattern is an RFC 5545 RRULE; defaults to "RRULE:FREQ=DAILY;COUNT=5".
+    """
     logger.info(f"Adding recurring calendar event for account {account_id}")
-    
-    try:
-        service = build_calendar_service(account_id)
-        if not service:
-            return CalendarAccountResponse(
-                status="error",
-                message=f"Failed to build Calendar service for account {account_id}.",
-                error_message="Could not authenticate with Calendar API.",
-                data=None
-            )
-        
-        # Validate required parameters
-        if not summary or not start_time or not end_time:
-            return CalendarAccountResponse(
-                status="error",
-                message="Missing required event parameters.",
-                error_message="Summary, start time, and end time are required.",
-                data=None
-            )
-        
-        # Build the event object
-        event = {
-            'summary': summary,
-            'start': {
-                'dateTime': start_time,
-                'timeZone': 'UTC',  # Default to UTC, user can override
-            },
-            'end': {
-                'dateTime': end_time,
-                'timeZone': 'UTC',  # Default to UTC, user can override
-            },
-            'recurrence': [recurrence_pattern],
-        }
-        
-        # Add optional fields if provided
-        if description:
-            event['description'] = description
-        if location:
-            event['location'] = location
-        if attendees:
-            event['attendees'] = attendees
-        
-        # Execute the API call with retry logic
-        created_event = execute_with_retry(service.events().insert(
-            calendarId='primary',
-            body=event,
-            sendUpdates='all'  # Send notifications to attendees
-        ))
-        
-        return CalendarAccountResponse(
-            status="success",
-            message=f"Recurring event '{summary}' created successfully.",
-            error_message=None,
-            data={"event": created_event}
-        )
-    except HttpError as e:
-        logger.error(f"HTTP error creating recurring Calendar event for {account_id}: {e}", exc_info=True)
-        return CalendarAccountResponse(
-            status="error",
-            message=f"Error accessing Calendar API for account {account_id}.",
-            error_message=str(e),
-            data=None
-        )
-    except Exception as e:
-        logger.error(f"Unexpected error creating recurring Calendar event for {account_id}: {e}", exc_info=True)
-        return CalendarAccountResponse(
-            status="error",
-            message=f"Unexpected error creating recurring Calendar event for account {account_id}.",
-            error_message=str(e),
-            data=None
-        )
+    return _insert_event(
+        account_id, summary, start_time, end_time,
+        success_message=f"Recurring event '{summary}' created successfully.",
+        action="creating recurring Calendar event",
+        description=description, location=location, attendees=attendees,
+        recurrence=DEFAULT_RECURRENCE if recurrence_pattern is None else (recurrence_pattern,)
+    )
+
+@functools.lru_cache(maxsize=64)
+def _build_reminders(reminder_minutes: Tuple[int, ...]) -> Dict[str, Any]:
+    """Build popup reminder overrides, shared between calls with the same minutes.
+
+    The returned dict is cached, so callers must treat it as read-only. It stays a
+    plain dict (not a MappingProxyType) because the request body is serialized as JSON.
+    """
+    return {
+        'useDefault': False,
+        'overrides': [{'method': 'popup', 'minutes': minute} for minute in reminder_minutes]
+    }
 
 def add_event_with_reminders(account_id: str, summary: str, description: Optional[str] = None,
                            location: Optional[str] = None, start_time: Optional[str] = None, end_time: Optional[str] = None,
                            attendees: Optional[List[Dict[str, str]]] = None,
-                           reminder_minutes: List[int] = [10, 30]) -> CalendarAccountResponse:
+                           reminder_minutes: Sequence[int] = (10, 30)) -> CalendarAccountResponse:
     """Add an event with custom reminders to the user's primary calendar."""
     logger.info(f"Adding calendar event with reminders for account {account_id}")
     
+    reminders = _build_reminders(tuple(reminder_minutes))
+    
+    return _insert_event(
+        account_id, summary, start_time, end_time,
+        success_message=f"Event '{summary}' with reminders created successfully.",
+        action="creating Calendar event with reminders",
+        description=description, location=location, attendees=attendees,
+        reminders=reminders
+    )
+
+if sys.version_info >= (3, 11):
+    def _parse_rfc3339(value: str) -> datetime.datetime:
+        """Parse an RFC3339/ISO timestamp; fromisoformat accepts a trailing 'Z' natively."""
+        return datetime.datetime.fromisoformat(value)
+else:
+    def _parse_rfc3339(value: str) -> datetime.datetime:
+        """Parse an RFC3339/ISO timestamp, rewriting a trailing 'Z' for older fromisoformat."""
+        return datetime.datetime.fromisoformat(value[:-1] + '+00:00' if value.endswith('Z') else value)
+
+def _format_busy_period(period: Dict[str, str]) -> Dict[str, Any]:
+    """Add human-readable timestamps and a duration to a free/busy API busy period."""
     try:
-        service = build_calendar_service(account_id)
-        if not service:
-            return CalendarAccountResponse(
-                status="error",
-                message=f"Failed to build Calendar service for account {account_id}.",
-                error_message="Could not authenticate with Calendar API.",
-                data=None
-            )
-        
-        # Validate required parameters
-        if not summary or not start_time or not end_time:
-            return CalendarAccountResponse(
-                status="error",
-                message="Missing required event parameters.",
-                error_message="Summary, start time, and end time are required.",
-                data=None
-            )
-        
-        # Build the reminders
-        reminders = {
-            'useDefault': False,
-            'overrides': [{'method': 'popup', 'minutes': minute} for minute in reminder_minutes]
-        }
-        
-        # Build the event object
-        event = {
-            'summary': summary,
-            'start': {
-                'dateTime': start_time,
-                'timeZone': 'UTC',  # Default to UTC, user can override
-            },
-            'end': {
-                'dateTime': end_time,
-                'timeZone': 'UTC',  # Default to UTC, user can override
-            },
-            'reminders': reminders,
-        }
-        
-        # Add optional fields if provided
-        if description:
-            event['description'] = description
-        if location:
-            event['location'] = location
-        if attendees:
-            event['attendees'] = attendees
-        
-        # Execute the API call with retry logic
-        created_event = execute_with_retry(service.events().insert(
-            calendarId='primary',
-            body=event,
-            sendUpdates='all'  # Send notifications to attendees
-        ))
-        
-        return CalendarAccountResponse(
-            status="success",
-            message=f"Event '{summary}' with reminders created successfully.",
-            error_message=None,
-            data={"event": created_event}
-        )
-    except HttpError as e:
-        logger.error(f"HTTP error creating Calendar event with reminders for {account_id}: {e}", exc_info=True)
-        return CalendarAccountResponse(
-            status="error",
-            message=f"Error accessing Calendar API for account {account_id}.",
-            error_message=str(e),
-            data=None
-        )
-    except Exception as e:
-        logger.error(f"Unexpected error creating Calendar event with reminders for {account_id}: {e}", exc_info=True)
-        return CalendarAccountResponse(
-            status="error",
-            message=f"Unexpected error creating Calendar event with reminders for account {account_id}.",
-            error_message=str(e),
-            data=None
-        )
+        start = period['start']
+        end = period['end']
+    except KeyError:
+        # Malformed period; pass through whatever the API sent
+        return {"start": period.get('start', ''), "end": period.get('end', '')}
+
+    try:
+        start_dt = _parse_rfc3339(start)
+        end_dt = _parse_rfc3339(end)
+    except ValueError:
+        # If we can't parse the date, just use the original
+        return {"start": start, "end": end}
+
+    return {
+        "start": start,
+        "end": end,
+        "formatted_start": f"{start_dt.year:04d}-{start_dt.month:02d}-{start_dt.day:02d} {start_dt.hour:02d}:{start_dt.minute:02d}",
+        "formatted_end": f"{end_dt.year:04d}-{end_dt.month:02d}-{end_dt.day:02d} {end_dt.hour:02d}:{end_dt.minute:02d}",
+        "duration_minutes": (end_dt - start_dt) // ONE_MINUTE
+    }
+
+def _process_calendar(cal_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Format one calendar's busy periods from a free/busy API response."""
+    try:
+        busy_periods = cal_data['busy']
+    except KeyError:
+        busy_periods = ()
+    return {
+        # Format the busy periods with more human-readable timestamps
+        "busy_periods": [_format_busy_period(period) for period in busy_periods],
+        "total_busy_periods": len(busy_periods)
+    }
+
+def _to_rfc3339_utc(value: str) -> str:
+    """Normalize an ISO timestamp to RFC3339 UTC ('...Z'); naive inputs are treated as UTC.
+
+    Raises ValueError if the value is not a valid ISO timestamp.
+    """
+    if RFC3339_UTC_PATTERN.match(value):
+        return value  # Already in the format the API expects
+    value_dt = _parse_rfc3339(value)
+    if value_dt.tzinfo is None:
+        value_dt = value_dt.replace(tzinfo=UTC)
+    return value_dt.astimezone(UTC).isoformat().replace('+00:00', 'Z')
 
 def check_free_busy(account_id: str, time_min: str, time_max: str, 
                    calendar_ids: Optional[List[str]] = None) -> CalendarAccountResponse:
@@ -1216,12 +1354,8 @@ def check_free_busy(account_id: str, time_min: str, time_max: str,
         # Validate and format date inputs
         try:
             # Ensure time_min and time_max are in RFC3339 format
-            time_min_dt = datetime.datetime.fromisoformat(time_min.replace('Z', '+00:00'))
-            time_max_dt = datetime.datetime.fromisoformat(time_max.replace('Z', '+00:00'))
-            
-            # Convert to RFC3339 format with 'Z' for UTC
-            time_min = time_min_dt.strftime('%Y-%m-%dT%H:%M:%S%z').replace('+0000', 'Z')
-            time_max = time_max_dt.strftime('%Y-%m-%dT%H:%M:%S%z').replace('+0000', 'Z')
+            time_min = _to_rfc3339_utc(time_min)
+            time_max = _to_rfc3339_utc(time_max)
             
             logger.info(f"Using time range: {time_min} to {time_max}")
         except ValueError as e:
@@ -1235,12 +1369,7 @@ def check_free_busy(account_id: str, time_min: str, time_max: str,
         
         service = build_calendar_service(account_id)
         if not service:
-            return CalendarAccountResponse(
-                status="error",
-                message=f"Failed to build Calendar service for account {account_id}.",
-                error_message="Could not authenticate with Calendar API.",
-                data=None
-            )
+            return _err_auth(account_id)
         
         # If no calendar IDs provided, use the primary calendar
         if not calendar_ids:
@@ -1258,7 +1387,7 @@ def check_free_busy(account_id: str, time_min: str, time_max: str,
         
         # Execute the API call with retry logic
         try:
-            freebusy = execute_with_retry(service.freebusy().query(body=body))
+            freebusy = execute_with_retry(service.freebusy().query(body=body), account_id)
             logger.info(f"Successfully retrieved free/busy data")
             
             # Check if the expected response format is received
@@ -1271,19 +1400,20 @@ def check_free_busy(account_id: str, time_min: str, time_max: str,
                     data={"raw_response": freebusy}
                 )
             
-            # Look for errors in the response
-            has_errors = False
+            # Collect errors and format busy periods in a single pass over the calendars
             error_messages = []
+            processed_calendars = {}
             
-            for cal_id, cal_data in freebusy.get('calendars', {}).items():
+            for cal_id, cal_data in freebusy['calendars'].items():
                 if 'errors' in cal_data:
-                    has_errors = True
                     for error in cal_data['errors']:
                         err_msg = f"Calendar {cal_id}: {error.get('reason', 'Unknown error')}"
                         error_messages.append(err_msg)
                         logger.error(err_msg)
+                elif not error_messages:
+                    processed_calendars[cal_id] = _process_calendar(cal_data)
             
-            if has_errors:
+            if error_messages:
                 return CalendarAccountResponse(
                     status="error",
                     message="Errors occurred when retrieving free/busy information",
@@ -1297,45 +1427,9 @@ def check_free_busy(account_id: str, time_min: str, time_max: str,
                     "start": time_min,
                     "end": time_max
                 },
-                "calendars": {}
+                "calendars": processed_calendars
             }
             
-            for cal_id, cal_data in freebusy.get('calendars', {}).items():
-                busy_periods = cal_data.get('busy', [])
-                
-                # Format the busy periods with more human-readable timestamps
-                formatted_busy = []
-                for period in busy_periods:
-                    start = period.get('start', '')
-                    end = period.get('end', '')
-                    
-                    try:
-                        start_dt = datetime.datetime.fromisoformat(start.replace('Z', '+00:00'))
-                        end_dt = datetime.datetime.fromisoformat(end.replace('Z', '+00:00'))
-                        
-                        formatted_start = start_dt.strftime('%Y-%m-%d %H:%M')
-                        formatted_end = end_dt.strftime('%Y-%m-%d %H:%M')
-                        duration_mins = int((end_dt - start_dt).total_seconds() / 60)
-                        
-                        formatted_busy.append({
-                            "start": start,
-                            "end": end,
-                            "formatted_start": formatted_start,
-                            "formatted_end": formatted_end,
-                            "duration_minutes": duration_mins
-                        })
-                    except ValueError:
-                        # If we can't parse the date, just use the original
-                        formatted_busy.append({
-                            "start": start,
-                            "end": end
-                        })
-                
-                processed_data['calendars'][cal_id] = {
-                    "busy_periods": formatted_busy,
-                    "total_busy_periods": len(busy_periods)
-                }
-            
             return CalendarAccountResponse(
                 status="success",
                 message="Free/busy information retrieved successfully.",
@@ -1352,105 +1446,187 @@ def check_free_busy(account_id: str, time_min: str, time_max: str,
             )
     except HttpError as e:
         logger.error(f"HTTP error checking free/busy status for {account_id}: {e}", exc_info=True)
-        return CalendarAccountResponse(
-            status="error",
-            message=f"Error accessing Calendar API for account {account_id}.",
-            error_message=str(e),
-            data=None
-        )
+        return _err_http(account_id, e)
     except Exception as e:
         logger.error(f"Unexpected error checking free/busy status for {account_id}: {e}", exc_info=True)
-        return CalendarAccountResponse(
-            status="error",
-            message=f"Unexpected error checking free/busy status for account {account_id}.",
-            error_message=str(e),
-            data=None
-        )
+        return _err_unexpected(account_id, "checking free/busy status", e)
+
+# Successful check_free_busy results keyed by (account_id, time_min, time_max), with expiry time
+_free_busy_cache: Dict[Tuple[str, str, str], Tuple[CalendarAccountResponse, float]] = {}
+_free_busy_cache_lock = threading.Lock()
+
+def _cached_free_busy(account_id: str, time_min: str, time_max: str) -> CalendarAccountResponse:
+    """check_free_busy for the primary calendar, reusing results younger than FREE_BUSY_CACHE_TTL.
+
+    Only successful responses are cached; event writes drop the account's entries.
+    """
+    cache_key = (account_id, time_min, time_max)
+    with _free_busy_cache_lock:
+        cached = _free_busy_cache.get(cache_key)
+    if cached and cached[1] > time.monotonic():
+        logger.debug("Using cached free/busy data for account %s.", account_id)
+        return cached[0]
+
+    result = check_free_busy(account_id, time_min, time_max)
+    if result['status'] == 'success':
+        with _free_busy_cache_lock:
+            _free_busy_cache[cache_key] = (result, time.monotonic() + FREE_BUSY_CACHE_TTL)
+    return result
+
+def _invalidate_free_busy(account_id: str) -> None:
+    """Drop cached free/busy results for an account after its events change."""
+    with _free_busy_cache_lock:
+        for cache_key in [key for key in _free_busy_cache if key[0] == account_id]:
+            del _free_busy_cache[cache_key]
+
+def _build_free_slots(slot_starts: List[float], slot_ends: List[float], slot_durations: List[int],
+                      date_str: str) -> List[Dict[str, Any]]:
+    """Materialize free-slot dicts, shown in the user's timezone, from parallel slot lists.
+
+    The sweeps only record timestamps and durations; dicts are built once, for the
+    slots actually returned. The date and timezone parts of the description are shared.
+    """
+    prefix = date_str + " from "
+    suffix = " minutes) " + TIMEZONE
+    free_slots = []
+    for start_ts, end_ts, duration_minutes in zip(slot_starts, slot_ends, slot_durations):
+        start = datetime.datetime.fromtimestamp(start_ts, USER_TZ)
+        end = datetime.datetime.fromtimestamp(end_ts, USER_TZ)
+        formatted_start = start.strftime('%H:%M')
+        formatted_end = end.strftime('%H:%M')
+        free_slots.append({
+            'start': start.isoformat(),
+            'end': end.isoformat(),
+            'formatted_start': formatted_start,
+            'formatted_end': formatted_end,
+            'duration_minutes': duration_minutes,
+            'date': date_str,
+            'timezone': TIMEZONE,
+            'description': prefix + formatted_start + " to " + formatted_end + " (" + str(duration_minutes) + suffix
+        })
+    return free_slots
+
+def _full_day_free_slots(working_hours_start_ts: float, working_hours_end_ts: float,
+                         min_duration_minutes: int, date_str: str) -> List[Dict[str, Any]]:
+    """The free slots for a day with no busy periods: all of working hours, if long enough."""
+    duration_minutes = int((working_hours_end_ts - working_hours_start_ts) / 60)
+    if duration_minutes < min_duration_minutes:
+        return []
+    return _build_free_slots([working_hours_start_ts], [working_hours_end_ts], [duration_minutes], date_str)
+
+def _merge_busy_intervals(starts: List[float], ends: List[float]) -> Tuple[List[float], List[float]]:
+    """Merge overlapping or touching (start, end) timestamp intervals, returned in start order.
+
+    Large inputs (many accounts) are merged with NumPy; small ones keep the plain sweep.
+    """
+    if len(starts) > VECTORIZED_MERGE_THRESHOLD:
+        starts_arr = np.asarray(starts, dtype=np.float64)
+        ends_arr = np.asarray(ends, dtype=np.float64)
+        order = np.lexsort((ends_arr, starts_arr))
+        starts_arr = starts_arr[order]
+        running_end = np.maximum.accumulate(ends_arr[order])
+        # A merged period starts wherever a start lies beyond every end seen so far
+        first = np.flatnonzero(np.concatenate(([True], starts_arr[1:] > running_end[:-1])))
+        last = np.append(first[1:] - 1, len(starts_arr) - 1)
+        return starts_arr[first].tolist(), running_end[last].tolist()
+
+    # Sweep the periods in start order, extending the current merged period in place
+    merged_starts = []
+    merged_ends = []
+    for start_ts, end_ts in sorted(zip(starts, ends), key=itemgetter(0)):
+        if merged_ends and start_ts <= merged_ends[-1]:
+            if end_ts > merged_ends[-1]:
+                merged_ends[-1] = end_ts
+        else:
+            merged_starts.append(start_ts)
+            merged_ends.append(end_ts)
+    return merged_starts, merged_ends
+
+def _parse_user_date(date: str) -> datetime.datetime:
+    """Parse a user-supplied date into midnight of that day in the user's timezone.
+
+    Plain ISO dates (YYYY-MM-DD) are matched with a precompiled pattern and ISO
+    datetimes go through fromisoformat; strptime is only tried for ALT_DATE_FORMATS.
+    Raises ValueError if the date matches none of them.
+    """
+    iso_match = ISO_DATE_PATTERN.fullmatch(date)
+    if iso_match:
+        year, month, day = iso_match.groups()
+        return datetime.datetime(int(year), int(month), int(day), tzinfo=USER_TZ)
+    if 'T' in date:
+        # Full datetime provided; keep only its calendar date
+        date_obj = _parse_rfc3339(date)
+        return datetime.datetime(date_obj.year, date_obj.month, date_obj.day, tzinfo=USER_TZ)
+    for fmt in ALT_DATE_FORMATS:
+        try:
+            return datetime.datetime.strptime(date, fmt).replace(tzinfo=USER_TZ)
+        except ValueError:
+            continue
+    raise ValueError(f"Could not parse date '{date}' with any known format")
+
+@functools.lru_cache(maxsize=64)
+def _working_hours_window(day: datetime.date) -> Tuple[float, float, str, str]:
+    """Start and end of working hours on a day in the user's timezone.
+
+    Returns them as POSIX timestamps and as RFC3339 UTC ('...Z') strings.
+    """
+    start = datetime.datetime.combine(day, WORKING_HOURS_START, USER_TZ).astimezone(UTC)
+    end = datetime.datetime.combine(day, WORKING_HOURS_END, USER_TZ).astimezone(UTC)
+    return (start.timestamp(), end.timestamp(),
+            start.strftime('%Y-%m-%dT%H:%M:%SZ'), end.strftime('%Y-%m-%dT%H:%M:%SZ'))
+
+def _outside_working_hours(period: Dict[str, str], working_hours_start_z: str, working_hours_end_z: str) -> bool:
+    """Whether a busy period with RFC3339 UTC bounds lies entirely outside working hours.
+
+    UTC 'Z' timestamps sort chronologically as strings, so this needs no parsing.
+    Periods with other offsets return False and are left to the full parse.
+    """
+    start = period['start']
+    end = period['end']
+    if end[-1:] != 'Z' or start[-1:] != 'Z':
+        return False
+    return end <= working_hours_start_z or start >= working_hours_end_z
+
+def _resolve_date_window(date: str) -> Tuple[datetime.datetime, str, str]:
+    """Resolve a user date ("today" or a parsed date) to its day window.
+
+    Returns midnight in the user's timezone plus the RFC3339 UTC bounds of that
+    day (00:00:00 to 23:59:59) for the free/busy API.
+    Raises ValueError if the date cannot be parsed.
+    """
+    if date.lower() == "today":
+        # Use the user's timezone from config
+        date_obj = datetime.datetime.now(USER_TZ).replace(hour=0, minute=0, second=0, microsecond=0)
+        logger.info("Using today's date in timezone %s: %s", TIMEZONE, date_obj)
+    else:
+        date_obj = _parse_user_date(date)
+        logger.info("Parsed date input '%s' as %s", date, date_obj)
+    
+    utc_date_obj = date_obj.astimezone(UTC)
+    time_min = utc_date_obj.isoformat().replace('+00:00', 'Z')
+    time_max = (utc_date_obj + datetime.timedelta(days=1, seconds=-1)).isoformat().replace('+00:00', 'Z')
+    return date_obj, time_min, time_max
 
 def find_free_slots(account_id: str, date: str, min_duration_minutes: int = 30) -> CalendarAccountResponse:
     """Find free time slots in the user's calendar for a given date."""
-    logger.info(f"Finding free slots for account {account_id} on {date}")
+    logger.info("Finding free slots for account %s on %s", account_id, date)
     
     try:
-        # Handle "today" specially
-        if date.lower() == "today":
-            try:
-                # Use the user's timezone from config
-                user_tz = ZoneInfo(TIMEZONE)
-                date_obj = datetime.datetime.now(user_tz).replace(hour=0, minute=0, second=0, microsecond=0)
-                logger.info(f"Using today's date in timezone {TIMEZONE}: {date_obj.isoformat()}")
-            except Exception as e:
-                logger.error(f"Error getting today's date with timezone {TIMEZONE}: {e}")
-                return CalendarAccountResponse(
-                    status="error",
-                    message="Error determining today's date with your timezone.",
-                    error_message=f"Failed to use timezone {TIMEZONE}: {e}",
-                    data=None
-                )
-        else:
-            # Parse the date string into datetime
-            try:
-                # Handle different date formats
-                # Try ISO format first (YYYY-MM-DD)
-                if 'T' in date:
-                    # Full datetime provided
-                    date_obj = datetime.datetime.fromisoformat(date.replace('Z', '+00:00'))
-                else:
-                    # Just date provided
-                    date_obj = datetime.datetime.strptime(date, '%Y-%m-%d')
-                
-                # Set time to 00:00:00 and make timezone-aware
-                try:
-                    user_tz = ZoneInfo(TIMEZONE)
-                    # First make naive by removing tzinfo if present
-                    naive_date = date_obj.replace(tzinfo=None, hour=0, minute=0, second=0, microsecond=0)
-                    # Then add proper timezone
-                    date_obj = naive_date.replace(tzinfo=user_tz)
-                    logger.info(f"Made date timezone-aware with {TIMEZONE}: {date_obj.isoformat()}")
-                except Exception as tz_err:
-                    logger.warning(f"Could not apply timezone {TIMEZONE} to date: {tz_err}. Using UTC.")
-                    date_obj = date_obj.replace(hour=0, minute=0, second=0, microsecond=0, tzinfo=datetime.timezone.utc)
-                
-                logger.info(f"Parsed date input '{date}' as {date_obj.isoformat()}")
-            except ValueError:
-                # Try other common formats if ISO format fails
-                try:
-                    for fmt in ['%m/%d/%Y', '%d/%m/%Y', '%b %d %Y', '%d %b %Y']:
-                        try:
-                            date_obj = datetime.datetime.strptime(date, fmt)
-                            # Make timezone-aware
-                            try:
-                                user_tz = ZoneInfo(TIMEZONE)
-                                date_obj = date_obj.replace(hour=0, minute=0, second=0, microsecond=0, tzinfo=user_tz)
-                            except Exception:
-                                date_obj = date_obj.replace(hour=0, minute=0, second=0, microsecond=0, tzinfo=datetime.timezone.utc)
-                                
-                            logger.info(f"Parsed date input '{date}' using format {fmt} as {date_obj.isoformat()}")
-                            break
-                        except ValueError:
-                            continue
-                    else:  # No break, all formats failed
-                        raise ValueError(f"Could not parse date '{date}' with any known format")
-                except Exception as parse_err:
-                    logger.error(f"Failed to parse date: {parse_err}")
-                    return CalendarAccountResponse(
-                        status="error",
-                        message="Invalid date format.",
-                        error_message=f"Date must be in ISO format (YYYY-MM-DD) or another common format: {parse_err}",
-                        data=None
-                    )
-        
-        # Set time range for the given date (from 00:00 to 23:59)
-        # Ensure UTC format with Z suffix for the Google Calendar API
-        # First convert to UTC for the API
-        utc_date_obj = date_obj.astimezone(datetime.timezone.utc)
-        time_min = utc_date_obj.isoformat().replace('+00:00', 'Z')
-        time_max = (utc_date_obj + datetime.timedelta(days=1, seconds=-1)).isoformat().replace('+00:00', 'Z')
+        try:
+            date_obj, time_min, time_max = _resolve_date_window(date)
+        except ValueError as parse_err:
+            logger.error(f"Failed to parse date: {parse_err}")
+            return CalendarAccountResponse(
+                status="error",
+                message="Invalid date format.",
+                error_message=f"Date must be in ISO format (YYYY-MM-DD) or another common format: {parse_err}",
+                data=None
+            )
         
-        logger.info(f"Using time range: {time_min} to {time_max}")
+        logger.info("Using time range: %s to %s", time_min, time_max)
         
         # Get the free/busy information
-        free_busy_result = check_free_busy(account_id, time_min, time_max)
+        free_busy_result = _cached_free_busy(account_id, time_min, time_max)
         if free_busy_result['status'] != 'success':
             logger.error(f"Failed to get free/busy information: {free_busy_result['error_message']}")
             return free_busy_result
@@ -1478,7 +1654,7 @@ def find_free_slots(account_id: str, date: str, min_duration_minutes: int = 30)
                         'end': period['end']
                     })
             
-            logger.info(f"Found {len(busy_periods)} busy periods on {date}")
+            logger.info("Found %s busy periods on %s", len(busy_periods), date)
         except (KeyError, TypeError) as e:
             logger.error(f"Error processing free/busy result: {e}", exc_info=True)
             logger.error(f"Free/busy result structure: {free_busy_result}")
@@ -1489,70 +1665,56 @@ def find_free_slots(account_id: str, date: str, min_duration_minutes: int = 30)
                 data={"raw_response": free_busy_result}
             )
         
-        # Define working hours (9 AM to 5 PM by default) in user's timezone
-        working_hours_start = date_obj.replace(hour=9, minute=0, second=0)
-        working_hours_end = date_obj.replace(hour=17, minute=0, second=0)
-        
-        # Find free slots within working hours, considering busy periods
-        free_slots = []
-        current_time = working_hours_start
-        
-        # Sort busy periods by start time
-        busy_periods.sort(key=lambda x: x['start'])
+        # Working hours as POSIX timestamps; only emitted slots are converted back to datetimes
+        working_hours_start_ts, working_hours_end_ts, working_hours_start_z, working_hours_end_z = \
+            _working_hours_window(date_obj.date())
+        date_str = date_obj.strftime('%Y-%m-%d')
         
-        # Iterate through busy periods to find gaps
+        # Parse each busy period overlapping working hours once into (start, end) timestamps
+        busy_intervals = []
         for busy in busy_periods:
+            if _outside_working_hours(busy, working_hours_start_z, working_hours_end_z):
+                continue
             try:
-                # Parse the UTC times from API and convert to user's timezone for proper merging
-                busy_start = datetime.datetime.fromisoformat(busy['start'].replace('Z', '+00:00'))
-                busy_end = datetime.datetime.fromisoformat(busy['end'].replace('Z', '+00:00'))
-                
-                # Convert to the user's timezone for proper display and calculations
-                try:
-                    user_tz = ZoneInfo(TIMEZONE)
-                    busy_start = busy_start.astimezone(user_tz)
-                    busy_end = busy_end.astimezone(user_tz)
-                except Exception as tz_err:
-                    logger.warning(f"Could not convert time to timezone {TIMEZONE}: {tz_err}. Using UTC.")
-                
+                busy_intervals.append((_parse_rfc3339(busy['start']).timestamp(), _parse_rfc3339(busy['end']).timestamp()))
+            except ValueError as e:
+                logger.warning("Error parsing busy period dates: %s, skipping period: %s", e, busy)
+        
+        if not busy_intervals:
+            # Nothing busy during working hours, so there is nothing to sweep
+            free_slots = _full_day_free_slots(working_hours_start_ts, working_hours_end_ts,
+                                              min_duration_minutes, date_str)
+        else:
+            # Sort busy periods by start timestamp only
+            busy_intervals.sort(key=itemgetter(0))
+            
+            # Find free slots within working hours, considering busy periods
+            slot_starts, slot_ends, slot_durations = [], [], []
+            current_time = working_hours_start_ts
+            
+            # Iterate through busy periods to find gaps
+            for busy_start, busy_end in busy_intervals:
                 # Check if there's a free slot before this busy period
                 if current_time < busy_start:
-                    duration = int((busy_start - current_time).total_seconds() / 60)
+                    duration = int((busy_start - current_time) / 60)
                     if duration >= min_duration_minutes:
-                        free_slots.append({
-                            'start': current_time.isoformat(),
-                            'end': busy_start.isoformat(),
-                            'formatted_start': current_time.strftime('%H:%M'),
-                            'formatted_end': busy_start.strftime('%H:%M'),
-                            'duration_minutes': duration,
-                            'timezone': TIMEZONE
-                        })
-                
+                        slot_starts.append(current_time)
+                        slot_ends.append(busy_start)
+                        slot_durations.append(duration)
+            
                 # Move current time to the end of this busy period
-                current_time = max(current_time, busy_end)
-            except ValueError as e:
-                logger.warning(f"Error parsing busy period dates: {e}, skipping period: {busy}")
-                continue
-        
-        # Check if there's a free slot after the last busy period until end of working hours
-        if current_time < working_hours_end:
-            duration = int((working_hours_end - current_time).total_seconds() / 60)
-            if duration >= min_duration_minutes:
-                free_slots.append({
-                    'start': current_time.isoformat(),
-                    'end': working_hours_end.isoformat(),
-                    'formatted_start': current_time.strftime('%H:%M'),
-                    'formatted_end': working_hours_end.strftime('%H:%M'),
-                    'duration_minutes': duration,
-                    'timezone': TIMEZONE
-                })
-        
-        # Add formatted date to each slot for clearer output
-        date_str = date_obj.strftime('%Y-%m-%d')
-        for slot in free_slots:
-            slot['date'] = date_str
-            # Add a user-friendly description
-            slot['description'] = f"{date_str} from {slot['formatted_start']} to {slot['formatted_end']} ({slot['duration_minutes']} minutes) {TIMEZONE}"
+                if busy_end > current_time:
+                    current_time = busy_end
+            
+            # Check if there's a free slot after the last busy period until end of working hours
+            if current_time < working_hours_end_ts:
+                duration = int((working_hours_end_ts - current_time) / 60)
+                if duration >= min_duration_minutes:
+                    slot_starts.append(current_time)
+                    slot_ends.append(working_hours_end_ts)
+                    slot_durations.append(duration)
+            
+            free_slots = _build_free_slots(slot_starts, slot_ends, slot_durations, date_str)
         
         return CalendarAccountResponse(
             status="success",
@@ -1563,17 +1725,16 @@ def find_free_slots(account_id: str, date: str, min_duration_minutes: int = 30)
                 "free_slots": free_slots,
                 "min_duration_minutes": min_duration_minutes,
                 "working_hours": {
-                    "start": working_hours_start.strftime('%H:%M'),
-                    "end": working_hours_end.strftime('%H:%M')
+                    "start": WORKING_HOURS_START.strftime('%H:%M'),
+                    "end": WORKING_HOURS_END.strftime('%H:%M')
                 },
                 "timezone": TIMEZONE
             }
         )
     except Exception as e:
-        # Improved error handling
-        import traceback
-        tb_str = traceback.format_exc()
-        logger.error(f"Unexpected error finding free slots for {account_id}: {e}\n{tb_str}")
+        # Only pay for formatting the traceback when debug logging is on
+        logger.error("Unexpected error finding free slots for %s: %s", account_id, e,
+                     exc_info=logger.isEnabledFor(logging.DEBUG))
         
         # Create a more descriptive error message
         error_details = f"Time zone issue: {e}" if "zone" in str(e).lower() else f"Error: {e}"
@@ -1604,54 +1765,29 @@ def create_event_with_attendees(account_id: str, summary: str, attendee_emails:
     logger.info(f"Creating calendar event with attendees for account {account_id}")
     
     # Properly format the attendees list - this is critical for invites to work
-    formatted_attendees = [{'email': email.strip()} for email in attendee_emails]
+    formatted_attendees = [Attendee(email.strip()) for email in attendee_emails]
     logger.info(f"Formatted attendees: {formatted_attendees}")
     
     try:
         service = build_calendar_service(account_id)
         if not service:
-            return CalendarAccountResponse(
-                status="error",
-                message=f"Failed to build Calendar service for account {account_id}.",
-                error_message="Could not authenticate with Calendar API.",
-                data=None
-            )
+            return _err_auth(account_id)
         
         # Validate required parameters
         if not summary or not start_time or not end_time:
-            return CalendarAccountResponse(
-                status="error",
-                message="Missing required event parameters.",
-                error_message="Summary, start time, and end time are required.",
-                data=None
-            )
-        
-        # Build the event object
-        event = {
-            'summary': summary,
-            'start': {
-                'dateTime': start_time,
-                'timeZone': 'UTC',  # Default to UTC, user can override
-            },
-            'end': {
-                'dateTime': end_time,
-                'timeZone': 'UTC',  # Default to UTC, user can override
-            },
-            'attendees': formatted_attendees,  # Properly formatted attendees list
-        }
+            return _err_missing_params()
         
-        # Add optional fields if provided
-        if description:
-            event['description'] = description
-        if location:
-            event['location'] = location
+        # Build the event object with the properly formatted attendees list
+        event = _build_event_body(summary, start_time, end_time, description=description,
+                                  location=location, attendees=formatted_attendees)
         
         # Execute the API call with retry logic - explicitly setting sendUpdates to 'all' to send invites
         created_event = execute_with_retry(service.events().insert(
             calendarId='primary',
             body=event,
             sendUpdates='all'  # Always send notifications to attendees
-        ))
+        ), account_id)
+        _invalidate_free_busy(account_id)
         
         # Verify attendees were properly included
         if 'attendees' in created_event:
@@ -1673,20 +1809,90 @@ def create_event_with_attendees(account_id: str, summary: str, attendee_emails:
             )
     except HttpError as e:
         logger.error(f"HTTP error creating Calendar event with attendees for {account_id}: {e}", exc_info=True)
-        return CalendarAccountResponse(
-            status="error",
-            message=f"Error accessing Calendar API for account {account_id}.",
-            error_message=str(e),
-            data=None
-        )
+        return _err_http(account_id, e)
     except Exception as e:
         logger.error(f"Unexpected error creating Calendar event with attendees for {account_id}: {e}", exc_info=True)
+        return _err_unexpected(account_id, "creating Calendar event with attendees", e)
+
+def schedule_if_free(account_id: str, summary: str, start_time: str, end_time: str,
+                     attendees: Optional[List[Dict[str, str]]] = None, description: Optional[str] = None,
+                     location: Optional[str] = None) -> CalendarAccountResponse:
+    """Create an event only if the primary calendar is free for the requested time.
+
+    The free/busy check and the insert go out back to back on the same service,
+    so the insert reuses the connection the check just warmed up.
+    """
+    logger.info(f"Scheduling event if free for account {account_id}")
+    
+    if not summary or not start_time or not end_time:
+        return _err_missing_params()
+    
+    try:
+        try:
+            time_min = _to_rfc3339_utc(start_time)
+            time_max = _to_rfc3339_utc(end_time)
+        except ValueError as e:
+            return CalendarAccountResponse(
+                status="error",
+                message="Invalid date format provided.",
+                error_message=f"Dates must be in ISO format (YYYY-MM-DDTHH:MM:SS[.mmmmmm][+HH:MM]): {e}",
+                data=None
+            )
+        
+        service = build_calendar_service(account_id)
+        if not service:
+            return _err_auth(account_id)
+        
+        freebusy = execute_with_retry(service.freebusy().query(body={
+            "timeMin": time_min,
+            "timeMax": time_max,
+            "items": [{"id": "primary"}]
+        }), account_id)
+        
+        try:
+            cal_data = freebusy['calendars']['primary']
+        except KeyError:
+            cal_data = {}
+        if 'errors' in cal_data:
+            reasons = "; ".join(error.get('reason', 'Unknown error') for error in cal_data['errors'])
+            return CalendarAccountResponse(
+                status="error",
+                message="Could not check availability before scheduling.",
+                error_message=f"Calendar primary: {reasons}",
+                data=None
+            )
+        
+        busy = _process_calendar(cal_data)
+        if busy["total_busy_periods"]:
+            logger.info(f"Not scheduling '{summary}' for {account_id}: {busy['total_busy_periods']} conflicting busy periods")
+            return CalendarAccountResponse(
+                status="error",
+                message="The requested time is not free.",
+                error_message=f"The calendar has {busy['total_busy_periods']} conflicting busy period(s) in that time range.",
+                data=busy
+            )
+        
+        event = _build_event_body(summary, start_time, end_time, description=description,
+                                  location=location, attendees=attendees)
+        created_event = execute_with_retry(service.events().insert(
+            calendarId='primary',
+            body=event,
+            sendUpdates='all'  # Send notifications to attendees
+        ), account_id)
+        _invalidate_free_busy(account_id)
+        
         return CalendarAccountResponse(
-            status="error",
-            message=f"Unexpected error creating Calendar event with attendees for account {account_id}.",
-            error_message=str(e),
-            data=None
+            status="success",
+            message=f"Time was free; event '{summary}' created successfully.",
+            error_message=None,
+            data={"event": created_event}
         )
+    except HttpError as e:
+        logger.error(f"HTTP error scheduling Calendar event for {account_id}: {e}", exc_info=True)
+        return _err_http(account_id, e)
+    except Exception as e:
+        logger.error(f"Unexpected error scheduling Calendar event for {account_id}: {e}", exc_info=True)
+        return _err_unexpected(account_id, "scheduling Calendar event", e)
 
 def find_mutual_free_slots(primary_account_id: str, other_account_ids: List[str], 
                           date: str, min_duration_minutes: int = 120,
@@ -1703,98 +1909,41 @@ def find_mutual_free_slots(primary_account_id: str, other_account_ids: List[str]
     Returns:
         CalendarAccountResponse with mutual free slots
     """
-    logger.info(f"Finding mutual free slots for {primary_account_id} and {other_account_ids} on {date}")
+    logger.info("Finding mutual free slots for %s and %s on %s", primary_account_id, other_account_ids, date)
     
     try:
-        # Handle "today" specially
-        if date.lower() == "today":
-            try:
-                # Use the user's timezone from config
-                user_tz = ZoneInfo(TIMEZONE)
-                date_obj = datetime.datetime.now(user_tz).replace(hour=0, minute=0, second=0, microsecond=0)
-                logger.info(f"Using today's date in timezone {TIMEZONE}: {date_obj.isoformat()}")
-            except Exception as e:
-                logger.error(f"Error getting today's date with timezone {TIMEZONE}: {e}")
-                return CalendarAccountResponse(
-                    status="error",
-                    message="Error determining today's date with your timezone.",
-                    error_message=f"Failed to use timezone {TIMEZONE}: {e}",
-                    data=None
-                )
-        else:
-            # Parse the date string into datetime
-            try:
-                # Handle different date formats
-                if 'T' in date:
-                    # Full datetime provided
-                    date_obj = datetime.datetime.fromisoformat(date.replace('Z', '+00:00'))
-                else:
-                    # Just date provided
-                    date_obj = datetime.datetime.strptime(date, '%Y-%m-%d')
-                
-                # Set time to 00:00:00 and make timezone-aware
-                try:
-                    user_tz = ZoneInfo(TIMEZONE)
-                    # First make naive by removing tzinfo if present
-                    naive_date = date_obj.replace(tzinfo=None, hour=0, minute=0, second=0, microsecond=0)
-                    # Then add proper timezone
-                    date_obj = naive_date.replace(tzinfo=user_tz)
-                    logger.info(f"Made date timezone-aware with {TIMEZONE}: {date_obj.isoformat()}")
-                except Exception as tz_err:
-                    logger.warning(f"Could not apply timezone {TIMEZONE} to date: {tz_err}. Using UTC.")
-                    date_obj = date_obj.replace(hour=0, minute=0, second=0, microsecond=0, tzinfo=datetime.timezone.utc)
-                
-                logger.info(f"Parsed date input '{date}' as {date_obj.isoformat()}")
-            except ValueError:
-                # Try other common formats if ISO format fails
-                try:
-                    for fmt in ['%m/%d/%Y', '%d/%m/%Y', '%b %d %Y', '%d %b %Y']:
-                        try:
-                            date_obj = datetime.datetime.strptime(date, fmt)
-                            # Make timezone-aware
-                            try:
-                                user_tz = ZoneInfo(TIMEZONE)
-                                date_obj = date_obj.replace(hour=0, minute=0, second=0, microsecond=0, tzinfo=user_tz)
-                            except Exception:
-                                date_obj = date_obj.replace(hour=0, minute=0, second=0, microsecond=0, tzinfo=datetime.timezone.utc)
-                                
-                            logger.info(f"Parsed date input '{date}' using format {fmt} as {date_obj.isoformat()}")
-                            break
-                        except ValueError:
-                            continue
-                    else:  # No break, all formats failed
-                        raise ValueError(f"Could not parse date '{date}' with any known format")
-                except Exception as parse_err:
-                    logger.error(f"Failed to parse date: {parse_err}")
-                    return CalendarAccountResponse(
-                        status="error",
-                        message="Invalid date format.",
-                        error_message=f"Date must be in ISO format (YYYY-MM-DD) or another common format: {parse_err}",
-                        data=None
-                    )
-        
-        # Set time range for the given date (from 00:00 to 23:59)
-        # Ensure UTC format with Z suffix for the Google Calendar API
-        # First convert to UTC for the API
-        utc_date_obj = date_obj.astimezone(datetime.timezone.utc)
-        time_min = utc_date_obj.isoformat().replace('+00:00', 'Z')
-        time_max = (utc_date_obj + datetime.timedelta(days=1, seconds=-1)).isoformat().replace('+00:00', 'Z')
+        try:
+            date_obj, time_min, time_max = _resolve_date_window(date)
+        except ValueError as parse_err:
+            logger.error(f"Failed to parse date: {parse_err}")
+            return CalendarAccountResponse(
+                status="error",
+                message="Invalid date format.",
+                error_message=f"Date must be in ISO format (YYYY-MM-DD) or another common format: {parse_err}",
+                data=None
+            )
         
-        logger.info(f"Using time range: {time_min} to {time_max}")
+        logger.info("Using time range: %s to %s", time_min, time_max)
         
         # Get all account IDs to check
         all_account_ids = [primary_account_id] + other_account_ids
         
-        # Define working hours (9 AM to 5 PM by default) in user's timezone
-        working_hours_start = date_obj.replace(hour=9, minute=0, second=0)
-        working_hours_end = date_obj.replace(hour=17, minute=0, second=0)
+        # Working hours as POSIX timestamps; only emitted slots are converted back to datetimes
+        working_hours_start_ts, working_hours_end_ts, working_hours_start_z, working_hours_end_z = \
+            _working_hours_window(date_obj.date())
+        date_str = date_obj.strftime('%Y-%m-%d')
         
         # Collect busy periods for all accounts
         all_busy_periods = {}
         
-        for account_id in all_account_ids:
-            # Get the free/busy information
-            free_busy_result = check_free_busy(account_id, time_min, time_max)
+        # Query every account concurrently; each one needs its own credentials, so they
+        # cannot share a single freebusy request
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(all_account_ids))) as executor:
+            free_busy_results = list(executor.map(
+                lambda account_id: _cached_free_busy(account_id, time_min, time_max), all_account_ids
+            ))
+        
+        for account_id, free_busy_result in zip(all_account_ids, free_busy_results):
             if free_busy_result['status'] != 'success':
                 logger.error(f"Failed to get free/busy information for {account_id}: {free_busy_result.get('error_message')}")
                 return CalendarAccountResponse(
@@ -1811,7 +1960,7 @@ def find_mutual_free_slots(primary_account_id: str, other_account_ids: List[str]
                 primary_calendar = calendars.get('primary', {})
                 
                 if not primary_calendar:
-                    logger.warning(f"Primary calendar data not found for {account_id}")
+                    logger.warning("Primary calendar data not found for %s", account_id)
                     return CalendarAccountResponse(
                         status="error",
                         message=f"Could not find calendar data for {account_id}",
@@ -1828,7 +1977,7 @@ def find_mutual_free_slots(primary_account_id: str, other_account_ids: List[str]
                         })
                 
                 all_busy_periods[account_id] = busy_periods
-                logger.info(f"Found {len(busy_periods)} busy periods for {account_id} on {date}")
+                logger.info("Found %s busy periods for %s on %s", len(busy_periods), account_id, date)
             except (KeyError, TypeError) as e:
                 logger.error(f"Error processing free/busy result for {account_id}: {e}", exc_info=True)
                 return CalendarAccountResponse(
@@ -1838,140 +1987,104 @@ def find_mutual_free_slots(primary_account_id: str, other_account_ids: List[str]
                     data=None
                 )
         
-        # Create a combined list of all busy periods
-        combined_busy_periods = []
+        # Parse every busy period overlapping working hours once into parallel start/end timestamp lists
+        busy_starts = []
+        busy_ends = []
         
         for account_id, busy_periods in all_busy_periods.items():
             for period in busy_periods:
+                if _outside_working_hours(period, working_hours_start_z, working_hours_end_z):
+                    continue
                 try:
-                    # Parse the UTC times from API and convert to user's timezone for proper merging
-                    start_dt = datetime.datetime.fromisoformat(period['start'].replace('Z', '+00:00'))
-                    end_dt = datetime.datetime.fromisoformat(period['end'].replace('Z', '+00:00'))
-                    
-                    # Convert to the user's timezone for proper display and calculations
-                    try:
-                        user_tz = ZoneInfo(TIMEZONE)
-                        start_dt = start_dt.astimezone(user_tz)
-                        end_dt = end_dt.astimezone(user_tz)
-                    except Exception as tz_err:
-                        logger.warning(f"Could not convert time to timezone {TIMEZONE}: {tz_err}. Using UTC.")
-                    
-                    combined_busy_periods.append((start_dt, end_dt))
+                    start_ts = _parse_rfc3339(period['start']).timestamp()
+                    end_ts = _parse_rfc3339(period['end']).timestamp()
                 except ValueError as e:
-                    logger.warning(f"Error parsing busy period dates for {account_id}: {e}")
+                    logger.warning("Error parsing busy period dates for %s: %s", account_id, e)
                     continue
+                busy_starts.append(start_ts)
+                busy_ends.append(end_ts)
         
-        # Sort combined busy periods by start time
-        combined_busy_periods.sort(key=lambda x: x[0])
+        if not busy_starts:
+            # Everyone is free for the whole working day; skip merging and sweeping
+            limited_slots = _full_day_free_slots(working_hours_start_ts, working_hours_end_ts,
+                                                 min_duration_minutes, date_str)[:max_slots]
+            return CalendarAccountResponse(
+                status="success",
+                message=f"Found {len(limited_slots)} mutual free slots of at least {min_duration_minutes} minutes on {date}.",
+                error_message=None,
+                data={
+                    "date": date_str,
+                    "mutual_free_slots": limited_slots,
+                    "min_duration_minutes": min_duration_minutes,
+                    "accounts_checked": all_account_ids,
+                    "working_hours": {
+                        "start": WORKING_HOURS_START.strftime('%H:%M'),
+                        "end": WORKING_HOURS_END.strftime('%H:%M')
+                    },
+                    "timezone": TIMEZONE
+                }
+            )
         
-        # Merge overlapping busy periods
-        if combined_busy_periods:
-            merged_busy_periods = [combined_busy_periods[0]]
-            
-            for current_start, current_end in combined_busy_periods[1:]:
-                prev_start, prev_end = merged_busy_periods[-1]
-                
-                # If current period overlaps with previous period
-                if current_start <= prev_end:
-                    # Merge by updating end time of previous period if needed
-                    merged_busy_periods[-1] = (prev_start, max(prev_end, current_end))
-                else:
-                    # No overlap, add as a new period
-                    merged_busy_periods.append((current_start, current_end))
-        else:
-            merged_busy_periods = []
+        merged_starts, merged_ends = _merge_busy_intervals(busy_starts, busy_ends)
         
-        # Find free slots between busy periods, within working hours
-        free_slots = []
-        current_time = working_hours_start
+        # Find free slots between busy periods, within working hours. Slots come out in
+        # chronological order, so stop as soon as max_slots have been found
+        slot_starts, slot_ends, slot_durations = [], [], []
+        current_time = working_hours_start_ts
         
-        # Add working_hours_start as current_time
-        for busy_start, busy_end in merged_busy_periods:
+        for busy_start, busy_end in zip(merged_starts, merged_ends):
+            if len(slot_starts) >= max_slots:
+                break
             # Only consider busy periods that overlap with working hours
-            if busy_end > working_hours_start and busy_start < working_hours_end:
+            if busy_end > working_hours_start_ts and busy_start < working_hours_end_ts:
                 # Adjust busy_start and busy_end to be within working hours
-                busy_start = max(busy_start, working_hours_start)
-                busy_end = min(busy_end, working_hours_end)
+                busy_start = max(busy_start, working_hours_start_ts)
+                busy_end = min(busy_end, working_hours_end_ts)
                 
                 # Check if there's a free slot before this busy period
                 if current_time < busy_start:
-                    duration_minutes = int((busy_start - current_time).total_seconds() / 60)
+                    duration_minutes = int((busy_start - current_time) / 60)
                     
                     if duration_minutes >= min_duration_minutes:
-                        # Use user's timezone for display
-                        free_slots.append({
-                            'start': current_time.isoformat(),
-                            'end': busy_start.isoformat(),
-                            'formatted_start': current_time.strftime('%H:%M'),
-                            'formatted_end': busy_start.strftime('%H:%M'),
-                            'duration_minutes': duration_minutes,
-                            'date': date_obj.strftime('%Y-%m-%d'),
-                            'timezone': TIMEZONE
-                        })
+                        slot_starts.append(current_time)
+                        slot_ends.append(busy_start)
+                        slot_durations.append(duration_minutes)
                 
                 # Move current time to the end of this busy period
-                current_time = max(current_time, busy_end)
+                if busy_end > current_time:
+                    current_time = busy_end
         
         # Check for a final free slot after the last busy period
-        if current_time < working_hours_end:
-            duration_minutes = int((working_hours_end - current_time).total_seconds() / 60)
+        if len(slot_starts) < max_slots and current_time < working_hours_end_ts:
+            duration_minutes = int((working_hours_end_ts - current_time) / 60)
             
             if duration_minutes >= min_duration_minutes:
-                free_slots.append({
-                    'start': current_time.isoformat(),
-                    'end': working_hours_end.isoformat(),
-                    'formatted_start': current_time.strftime('%H:%M'),
-                    'formatted_end': working_hours_end.strftime('%H:%M'),
-                    'duration_minutes': duration_minutes,
-                    'date': date_obj.strftime('%Y-%m-%d'),
-                    'timezone': TIMEZONE
-                })
+                slot_starts.append(current_time)
+                slot_ends.append(working_hours_end_ts)
+                slot_durations.append(duration_minutes)
         
-        # If no merged busy periods within working hours, the entire working day is free
-        if not merged_busy_periods:
-            duration_minutes = int((working_hours_end - working_hours_start).total_seconds() / 60)
-            if duration_minutes >= min_duration_minutes:
-                free_slots.append({
-                    'start': working_hours_start.isoformat(),
-                    'end': working_hours_end.isoformat(),
-                    'formatted_start': working_hours_start.strftime('%H:%M'),
-                    'formatted_end': working_hours_end.strftime('%H:%M'),
-                    'duration_minutes': duration_minutes,
-                    'date': date_obj.strftime('%Y-%m-%d'),
-                    'timezone': TIMEZONE
-                })
-        
-        # Sort free slots by start time and limit to requested number
-        free_slots.sort(key=lambda x: x['start'])
-        limited_slots = free_slots[:max_slots]
-        
-        # Create user-friendly description of each slot
-        for slot in limited_slots:
-            start_time = slot['formatted_start']
-            end_time = slot['formatted_end']
-            slot['description'] = f"{slot['date']} from {start_time} to {end_time} ({slot['duration_minutes']} minutes) {TIMEZONE}"
+        limited_slots = _build_free_slots(slot_starts, slot_ends, slot_durations, date_str)
         
         return CalendarAccountResponse(
             status="success",
             message=f"Found {len(limited_slots)} mutual free slots of at least {min_duration_minutes} minutes on {date}.",
             error_message=None,
             data={
-                "date": date_obj.strftime('%Y-%m-%d'),
+                "date": date_str,
                 "mutual_free_slots": limited_slots,
                 "min_duration_minutes": min_duration_minutes,
                 "accounts_checked": all_account_ids,
                 "working_hours": {
-                    "start": working_hours_start.strftime('%H:%M'),
-                    "end": working_hours_end.strftime('%H:%M')
+                    "start": WORKING_HOURS_START.strftime('%H:%M'),
+                    "end": WORKING_HOURS_END.strftime('%H:%M')
                 },
                 "timezone": TIMEZONE
             }
         )
     except Exception as e:
-        # Improved error handling
-        import traceback
-        tb_str = traceback.format_exc()
-        logger.error(f"Unexpected error finding mutual free slots: {e}\n{tb_str}")
+        # Only pay for formatting the traceback when debug logging is on
+        logger.error("Unexpected error finding mutual free slots: %s", e,
+                     exc_info=logger.isEnabledFor(logging.DEBUG))
         
         # Create a more descriptive error message
         error_details = f"Time zone issue: {e}" if "zone" in str(e).lower() else f"Error: {e}"
@@ -1,17 +1,61 @@
 import os
-import json
+import orjson
+import msgpack
+import sqlite3
 import logging
-from typing import Dict, Optional, List
+import functools
+import threading
+import time
+from dataclasses import dataclass, field, fields
+from typing import Dict, Optional, List, Tuple, Iterable
 from lucident_agent.Database import Database
+from .figma_oauth import FIGMA_TOKEN_URL, build_oauth_url, exchange_code_for_token
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-TOKEN_FILE = 'figma_tokens.json'
+TOKEN_DB = 'figma_tokens.db'
+TOKEN_FILE = 'figma_tokens.json'  # Legacy JSON store, imported into TOKEN_DB once
+
+@dataclass(slots=True)
+class FigmaToken:
+    """In-memory Figma OAuth token record for one user."""
+    access_token: Optional[str] = field(default=None, repr=False)
+    refresh_token: Optional[str] = field(default=None, repr=False)
+    expires_at: Optional[str] = None
+    client_id: Optional[str] = None
+    client_secret: Optional[str] = field(default=None, repr=False)
+    scopes: Optional[str] = None
+    token_type: Optional[str] = None
+    token_uri: Optional[str] = None
+    redirect_uri: Optional[str] = None
+    # Stored keys without a field of their own (e.g. user_id, expires_in), written back unchanged
+    extra: Dict = field(default_factory=dict, repr=False)
+
+    @classmethod
+    def from_dict(cls, token_dict: Dict) -> 'FigmaToken':
+        """Build a record from stored token data, keeping unknown keys in extra."""
+        known = {name: value for name, value in token_dict.items() if name in _TOKEN_FIELDS}
+        extra = {name: value for name, value in token_dict.items() if name not in _TOKEN_FIELDS}
+        return cls(**known, extra=extra)
+
+    def to_dict(self) -> Dict:
+        return {**self.extra, **{name: getattr(self, name) for name in _TOKEN_FIELD_NAMES}}
+
+    def get(self, key: str, default=None):
+        """Dict-style read access for callers that still treat tokens as dicts."""
+        if key in _TOKEN_FIELDS:
+            return getattr(self, key, default)
+        return self.extra.get(key, default)
+
+# Field names in declaration order, so to_dict keeps a stable key order
+_TOKEN_FIELD_NAMES = tuple(f.name for f in fields(FigmaToken) if f.name != 'extra')
+_TOKEN_FIELDS = frozenset(_TOKEN_FIELD_NAMES)
 
 class FigmaAccountManager:
     def __init__(self):
         self.use_supabase = True
+        self._db: Optional[sqlite3.Connection] = None
+        self._db_lock = threading.Lock()
         self._init_supabase()
         self.accounts = self._load_accounts()
 
@@ -23,12 +67,12 @@ class FigmaAccountManager:
             logger.error(f"Error initializing Supabase: {e}")
             self.use_supabase = False
 
-    def _load_accounts(self) -> Dict[str, Dict]:
+    def _load_accounts(self) -> Dict[str, FigmaToken]:
         if self.use_supabase:
             return self._load_from_supabase()
-        return self._load_from_file()
+        return self._load_from_local()
 
-    def _load_from_supabase(self) -> Dict[str, Dict]:
+    def _load_from_supabase(self) -> Dict[str, FigmaToken]:
         accounts = {}
         try:
             response = self.supabase.table('tokens').select('*').eq('token_type', 'figma').execute()
@@ -37,58 +81,106 @@ class FigmaAccountManager:
                 token_data = record.get('token_data')
                 if token_data:
                     try:
-                        token_dict = json.loads(token_data) if isinstance(token_data, str) else token_data
+                        token_dict = orjson.loads(token_data) if isinstance(token_data, (str, bytes)) else token_data
                     except Exception as e:
                         logger.error(f"Invalid token_data for {user_id}: {e}")
                         token_dict = {}
-                    accounts[user_id] = token_dict
+                    accounts[user_id] = FigmaToken.from_dict(token_dict)
         except Exception as e:
             logger.error(f"Error loading Figma accounts from Supabase: {e}")
             self.use_supabase = False
-            return self._load_from_file()
+            return self._load_from_local()
         return accounts
 
-    def _load_from_file(self) -> Dict[str, Dict]:
+    def _get_db(self) -> sqlite3.Connection:
+        """Open the local SQLite token store on first use."""
+        if self._db is None:
+            self._db = sqlite3.connect(TOKEN_DB, isolation_level=None, check_same_thread=False)
+            self._db.execute('PRAGMA journal_mode=WAL')
+            self._db.execute('CREATE TABLE IF NOT EXISTS tokens (user_id TEXT PRIMARY KEY, blob BLOB)')
+        return self._db
+
+    def _load_from_local(self) -> Dict[str, FigmaToken]:
         accounts = {}
         try:
-            if os.path.exists(TOKEN_FILE):
-                with open(TOKEN_FILE, 'r') as f:
-                    accounts = json.load(f)
+            with self._db_lock:
+                rows = self._get_db().execute('SELECT user_id, blob FROM tokens').fetchall()
+            accounts = {user_id: FigmaToken.from_dict(msgpack.unpackb(blob)) for user_id, blob in rows}
+            if not accounts and os.path.exists(TOKEN_FILE):
+                with open(TOKEN_FILE, 'rb') as f:
+                    accounts = {user_id: FigmaToken.from_dict(token_dict)
+                                for user_id, token_dict in orjson.loads(f.read()).items()}
+                logger.info(f"Importing {len(accounts)} Figma accounts from {TOKEN_FILE} into {TOKEN_DB}.")
+                self._save_to_local(accounts, accounts.keys())
         except Exception as e:
-            logger.error(f"Error loading Figma accounts from file: {e}")
+            logger.error(f"Error loading Figma accounts from local store: {e}")
         return accounts
 
-    def _save_to_file(self) -> None:
+    def _save_to_local(self, accounts: Dict[str, FigmaToken], user_ids: Iterable[str]) -> None:
+        try:
+            rows = [(user_id, msgpack.packb(accounts[user_id].to_dict())) for user_id in user_ids]
+            with self._db_lock:
+                self._get_db().executemany('INSERT OR REPLACE INTO tokens VALUES (?, ?)', rows)
+        except Exception as e:
+            logger.error(f"Error saving Figma accounts to local store: {e}")
+
+    def _delete_from_local(self, user_id: str) -> None:
         try:
-            with open(TOKEN_FILE, 'w') as f:
-                json.dump(self.accounts, f)
+            with self._db_lock:
+                self._get_db().execute('DELETE FROM tokens WHERE user_id = ?', (user_id,))
         except Exception as e:
-            logger.error(f"Error saving Figma accounts to file: {e}")
+            logger.error(f"Error deleting Figma account {user_id} from local store: {e}")
 
     def add_account(self, user_id: str, token_dict: Dict) -> None:
         logger.info(f"Adding/updating Figma account: {user_id}")
-        self.accounts[user_id] = token_dict
+        self.accounts[user_id] = FigmaToken.from_dict(token_dict)
         if self.use_supabase:
             try:
                 logger.info(f"Upserting Figma account {user_id} to Supabase.")
                 self.supabase.table('tokens').upsert({
                     'user_id': user_id,
                     'token_type': 'figma',
-                    'token_data': json.dumps(token_dict)
+                    'token_data': orjson.dumps(self.accounts[user_id].to_dict()).decode()
                 }, on_conflict='user_id, token_type').execute()
                 logger.info(f"Successfully upserted Figma account {user_id} to Supabase.")
             except Exception as e:
                 logger.error(f"Error saving Figma account {user_id} to Supabase: {e}", exc_info=True)
-                logger.warning(f"Falling back to saving Figma account {user_id} to local file {TOKEN_FILE}.")
-                self._save_to_file()
+                logger.warning(f"Falling back to saving Figma account {user_id} to local store {TOKEN_DB}.")
+                self._save_to_local(self.accounts, [user_id])
         else:
-            logger.info(f"Supabase not in use. Saving Figma account {user_id} to local file {TOKEN_FILE}.")
-            self._save_to_file()
+            logger.info(f"Supabase not in use. Saving Figma account {user_id} to local store {TOKEN_DB}.")
+            self._save_to_local(self.accounts, [user_id])
 
-    def get_accounts(self) -> Dict[str, Dict]:
+    def add_accounts_bulk(self, items: List[Tuple[str, Dict]]) -> None:
+        """
+        Add or update several accounts with a single Supabase upsert.
+        """
+        if not items:
+            return
+        logger.info(f"Adding/updating {len(items)} Figma accounts.")
+        for user_id, token_dict in items:
+            self.accounts[user_id] = FigmaToken.from_dict(token_dict)
+        if self.use_supabase:
+            rows = [{
+                'user_id': user_id,
+                'token_type': 'figma',
+                'token_data': orjson.dumps(self.accounts[user_id].to_dict()).decode()
+            } for user_id, _ in items]
+            try:
+                self.supabase.table('tokens').upsert(rows, on_conflict='user_id, token_type').execute()
+                logger.info(f"Successfully upserted {len(rows)} Figma accounts to Supabase.")
+            except Exception as e:
+                logger.error(f"Error saving {len(rows)} Figma accounts to Supabase: {e}", exc_info=True)
+                logger.warning(f"Falling back to saving Figma accounts to local store {TOKEN_DB}.")
+                self._save_to_local(self.accounts, [user_id for user_id, _ in items])
+        else:
+            logger.info(f"Supabase not in use. Saving Figma accounts to local store {TOKEN_DB}.")
+            self._save_to_local(self.accounts, [user_id for user_id, _ in items])
+
+    def get_accounts(self) -> Dict[str, FigmaToken]:
         return self.accounts
 
-    def get_account_credentials(self, user_id: str) -> Optional[Dict]:
+    def get_account_credentials(self, user_id: str) -> Optional[FigmaToken]:
         return self.accounts.get(user_id)
 
     def get_all_account_ids(self) -> List[str]:
@@ -108,8 +200,8 @@ class FigmaAccountManager:
             except Exception as e:
                 logger.error(f"Error deleting Figma account {user_id} from Supabase: {e}", exc_info=True)
         if not self.use_supabase or removed_from_memory:
-            logger.info(f"Updating local file {TOKEN_FILE} after removal attempt for {user_id}.")
-            self._save_to_file()
+            logger.info(f"Updating local store {TOKEN_DB} after removal attempt for {user_id}.")
+            self._delete_from_local(user_id)
         return removed_from_memory
 
     def create_auth_link_and_save_token(self, user_id: str, client_id: str, client_secret: str, redirect_uri: str, scopes: str, code: str = None):
@@ -117,35 +209,11 @@ class FigmaAccountManager:
         If code is None, returns the Figma OAuth URL for user authorization.
         If code is provided, exchanges it for tokens, saves them, and returns success info.
         """
-        import time
-        import requests
-        def start_oauth_flow():
-            params = {
-                'client_id': client_id,
-                'redirect_uri': redirect_uri,
-                'scope': scopes,
-                'response_type': 'code',
-                'state': str(int(time.time()))
-            }
-            base_url = 'https://www.figma.com/oauth'
-            return f"{base_url}?" + "&".join(f"{k}={v}" for k, v in params.items())
-        def exchange_code_for_token():
-            url = 'https://www.figma.com/api/oauth/token'
-            data = {
-                'client_id': client_id,
-                'client_secret': client_secret,
-                'redirect_uri': redirect_uri,
-                'code': code,
-                'grant_type': 'authorization_code'
-            }
-            resp = requests.post(url, data=data)
-            resp.raise_for_status()
-            return resp.json()
         if code is None:
-            url = start_oauth_flow()
+            url = build_oauth_url(client_id, redirect_uri, scopes, str(int(time.time())))
             return {"auth_url": url}
         # Exchange code for token
-        token_data = exchange_code_for_token()
+        token_data = exchange_code_for_token(client_id, client_secret, redirect_uri, code)
         expires_at = str(time.time() + int(token_data['expires_in']))
         token_dict = {
             'access_token': token_data['access_token'],
@@ -155,7 +223,7 @@ class FigmaAccountManager:
             'client_secret': client_secret,
             'scopes': scopes,
             'token_type': 'figma',
-            'token_uri': 'https://www.figma.com/api/oauth/token',
+            'token_uri': FIGMA_TOKEN_URL,
             'redirect_uri': redirect_uri
         }
         self.add_account(user_id, token_dict)
@@ -165,12 +233,12 @@ class FigmaAccountManager:
         """
         Returns the Figma OAuth URL for user authentication.
         """
-        base_url = "https://www.figma.com/oauth"
-        params = [
-            f"client_id={client_id}",
-            f"redirect_uri={redirect_uri}",
-            f"scope={scope}",
-            f"state={state}",
-            "response_type=code"
-        ]
-        return f"{base_url}?{'&'.join(params)}" 
\ No newline at end of file
+        return build_oauth_url(client_id, redirect_uri, scope, state)
+
+
+@functools.lru_cache(maxsize=1)
+def get_figma_account_manager() -> FigmaAccountManager:
+    """
+    Return the process-wide FigmaAccountManager, created on first use.
+    """
+    return FigmaAccountManager()
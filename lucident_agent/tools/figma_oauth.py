@@ -0,0 +1,54 @@
+import time
+import functools
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlencode
+
+import orjson
+import requests
+
+FIGMA_OAUTH_URL = 'https://www.figma.com/oauth'
+FIGMA_TOKEN_URL = 'https://www.figma.com/api/oauth/token'
+
+# Token requests go to www.figma.com, so they get their own keep-alive session
+_session = requests.Session()
+
+@functools.lru_cache(maxsize=64)
+def _base_oauth_fields(client_id: str, client_secret: str,
+                       redirect_uri: Optional[str] = None) -> Tuple[Tuple[str, str], ...]:
+    """Return the per-client part of a token request body as reusable form fields."""
+    fields = (('client_id', client_id), ('client_secret', client_secret))
+    if redirect_uri is not None:
+        fields += (('redirect_uri', redirect_uri),)
+    return fields
+
+def build_oauth_url(client_id: str, redirect_uri: str, scope: str, state: str) -> str:
+    """
+    Build the Figma OAuth authorization URL with a properly encoded query string.
+    """
+    params = {
+        'client_id': client_id,
+        'redirect_uri': redirect_uri,
+        'scope': scope,
+        'state': state,
+        'response_type': 'code'
+    }
+    return f"{FIGMA_OAUTH_URL}?{urlencode(params)}"
+
+def start_oauth_flow(client_id: str, client_secret: str, redirect_uri: str, scopes: str) -> str:
+    """Return the URL to start the Figma OAuth flow."""
+    return build_oauth_url(client_id, redirect_uri, scopes, str(int(time.time())))
+
+def exchange_code_for_token(client_id: str, client_secret: str, redirect_uri: str, code: str) -> Dict:
+    """Exchange authorization code for access and refresh tokens."""
+    data = _base_oauth_fields(client_id, client_secret, redirect_uri) + (
+        ('code', code), ('grant_type', 'authorization_code'))
+    resp = _session.post(FIGMA_TOKEN_URL, data=data)
+    resp.raise_for_status()
+    return orjson.loads(resp.content)
+
+def refresh_token(client_id: str, client_secret: str, refresh_token: str) -> Dict:
+    data = _base_oauth_fields(client_id, client_secret) + (
+        ('refresh_token', refresh_token), ('grant_type', 'refresh_token'))
+    resp = _session.post(FIGMA_TOKEN_URL, data=data)
+    resp.raise_for_status()
+    return orjson.loads(resp.content)
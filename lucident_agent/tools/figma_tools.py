@@ -1,65 +1,144 @@
-import requests
-from typing import Optional, Dict
-from .figma_account_manager import FigmaAccountManager
+import httpx
+import orjson
+import ijson
+import logging
+from typing import Optional, Dict, List, Tuple, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from .figma_oauth import build_oauth_url, start_oauth_flow, exchange_code_for_token, refresh_token
 import time
 import os
+import heapq
+import functools
+import threading
+from dataclasses import dataclass
+from datetime import datetime
 from dotenv import load_dotenv
 
-load_dotenv()
+logger = logging.getLogger(__name__)
 
-# --- Account Manager ---
-figma_account_manager = FigmaAccountManager()
+# --- HTTP Client ---
+HTTP_TIMEOUT = 10  # seconds
+HTTP_MAX_CONNECTIONS = 20
+# GETs that fail with these statuses are retried with exponential backoff
+RETRY_STATUSES = frozenset((429, 500, 502, 503, 504))
+MAX_RETRIES = 3
+RETRY_BACKOFF = 0.3  # seconds, doubled per attempt
+
+# Concurrent per-file requests; kept below the connection limit.
+MAX_WORKERS = 8
+
+# Read-mostly endpoints (files, projects) are cached briefly and revalidated by ETag
+RESPONSE_CACHE_TTL = 30  # seconds
+RESPONSE_CACHE_MAX_ENTRIES = 512
+
+# Top-level file fields returned by fetch_file_meta when no keys are given
+FILE_META_KEYS = ('name', 'lastModified', 'version', 'thumbnailUrl')
+
+FIGMA_FILE_URL = 'https://www.figma.com/file/'
 
 # --- Environment Variables ---
+@dataclass(frozen=True)
+class _Settings:
+    access_token: Optional[str]
+    team_id: Optional[str]
+
+@functools.lru_cache(maxsize=1)
+def _settings() -> _Settings:
+    """Read Figma settings from .env/the environment once; call _settings.cache_clear() to reload."""
+    load_dotenv()
+    return _Settings(
+        access_token=os.getenv('FIGMA_PERSONAL_ACCESS_TOKEN'),
+        team_id=os.getenv('FIGMA_TEAM_ID')
+    )
+
 def get_access_token() -> Optional[str]:
-    return os.getenv('FIGMA_PERSONAL_ACCESS_TOKEN')
+    return _settings().access_token
 
 def get_team_id() -> Optional[str]:
-    return os.getenv('FIGMA_TEAM_ID')
-
-# --- OAuth Helpers ---
-def start_oauth_flow(client_id: str, client_secret: str, redirect_uri: str, scopes: str) -> str:
-    """Return the URL to start the Figma OAuth flow."""
-    params = {
-        'client_id': client_id,
-        'redirect_uri': redirect_uri,
-        'scope': scopes,
-        'response_type': 'code',
-        'state': str(int(time.time()))
-    }
-    base_url = 'https://www.figma.com/oauth'
-    return f"{base_url}?" + "&".join(f"{k}={v}" for k, v in params.items())
-
-def exchange_code_for_token(client_id: str, client_secret: str, redirect_uri: str, code: str) -> Dict:
-    """Exchange authorization code for access and refresh tokens."""
-    url = 'https://www.figma.com/api/oauth/token'
-    data = {
-        'client_id': client_id,
-        'client_secret': client_secret,
-        'redirect_uri': redirect_uri,
-        'code': code,
-        'grant_type': 'authorization_code'
-    }
-    resp = requests.post(url, data=data)
-    resp.raise_for_status()
-    return resp.json()
-
-def refresh_token(client_id: str, client_secret: str, refresh_token: str) -> Dict:
-    url = 'https://www.figma.com/api/oauth/token'
-    data = {
-        'client_id': client_id,
-        'client_secret': client_secret,
-        'refresh_token': refresh_token,
-        'grant_type': 'refresh_token'
-    }
-    resp = requests.post(url, data=data)
-    resp.raise_for_status()
-    return resp.json()
+    return _settings().team_id
 
 # --- Authentication & File Access ---
 def get_headers(access_token: str):
     """Return headers for Figma API requests."""
-    return {'X-Figma-Token': access_token}
+    # httpx rejects None header values, so send no token header when unset
+    return {'X-Figma-Token': access_token} if access_token else {}
+
+def _json(response: httpx.Response):
+    """Decode a Figma API response body with orjson."""
+    return orjson.loads(response.content)
+
+def _error_json(response: httpx.Response):
+    """Decode a failed response, falling back to Figma's error shape for non-JSON bodies."""
+    try:
+        return _json(response)
+    except orjson.JSONDecodeError:
+        return {'status': response.status_code, 'err': response.text}
+
+_http_client: Optional[httpx.Client] = None
+_http_client_lock = threading.Lock()
+
+def _get_http_client() -> httpx.Client:
+    """Return the process-wide httpx client, creating it on first use.
+
+    With HTTP/2, concurrent requests to api.figma.com share one TLS connection.
+    """
+    global _http_client
+    with _http_client_lock:
+        if _http_client is None:
+            limits = httpx.Limits(max_connections=HTTP_MAX_CONNECTIONS,
+                                  max_keepalive_connections=HTTP_MAX_CONNECTIONS)
+            try:
+                _http_client = httpx.Client(http2=True, timeout=HTTP_TIMEOUT, limits=limits)
+            except ImportError:
+                logger.warning("HTTP/2 support unavailable (install httpx[http2]); falling back to HTTP/1.1.")
+                _http_client = httpx.Client(timeout=HTTP_TIMEOUT, limits=limits)
+        return _http_client
+
+def _api_get(url: str, headers: Dict[str, str]) -> httpx.Response:
+    """GET a Figma API URL, retrying rate-limited and transient server errors."""
+    client = _get_http_client()
+    for attempt in range(MAX_RETRIES + 1):
+        response = client.get(url, headers=headers)
+        if response.status_code not in RETRY_STATUSES or attempt == MAX_RETRIES:
+            return response
+        time.sleep(RETRY_BACKOFF * (2 ** attempt))
+    return response
+
+_response_cache: Dict[Tuple[Optional[str], str], Tuple[float, Optional[str], bytes]] = {}
+_response_cache_lock = threading.Lock()
+
+def _cached_get(url: str, ttl: int = RESPONSE_CACHE_TTL):
+    """GET a Figma API URL, reusing responses younger than ttl.
+
+    Expired entries are revalidated with If-None-Match when Figma sent an ETag,
+    so a 304 only refreshes the expiry. Only successful responses are cached; the
+    raw body is stored and decoded per call, so callers may modify what they get.
+    """
+    access_token = get_access_token()
+    cache_key = (access_token, url)
+    with _response_cache_lock:
+        cached = _response_cache.get(cache_key)
+    if cached and cached[0] > time.monotonic():
+        return orjson.loads(cached[2])
+
+    headers = get_headers(access_token)
+    if cached and cached[1]:
+        headers['If-None-Match'] = cached[1]
+    response = _api_get(url, headers)
+    if response.status_code == 304 and cached:
+        etag, content = cached[1], cached[2]
+    else:
+        if not response.is_success:
+            return _error_json(response)
+        etag, content = response.headers.get('ETag'), response.content
+
+    with _response_cache_lock:
+        _response_cache.pop(cache_key, None)
+        if len(_response_cache) >= RESPONSE_CACHE_MAX_ENTRIES:
+            # Dicts keep insertion order, so this drops the least recently stored entry
+            del _response_cache[next(iter(_response_cache))]
+        _response_cache[cache_key] = (time.monotonic() + ttl, etag, content)
+    return orjson.loads(content)
 
 def create_figma_link(file_id: str, node_id: Optional[str] = None) -> str:
     """
@@ -72,7 +151,7 @@ def create_figma_link(file_id: str, node_id: Optional[str] = None) -> str:
     Returns:
         str: URL to the Figma file or node
     """
-    base_url = f"https://www.figma.com/file/{file_id}"
+    base_url = FIGMA_FILE_URL + file_id
     if node_id:
         return f"{base_url}?node-id={node_id}"
     return base_url
@@ -87,10 +166,7 @@ def fetch_file(file_id: str):
     Returns:
         dict: The file data with an added 'link' field
     """
-    access_token = get_access_token()
-    url = f'https://api.figma.com/v1/files/{file_id}'
-    headers = get_headers(access_token)
-    response = requests.get(url, headers=headers).json()
+    response = _cached_get(f'https://api.figma.com/v1/files/{file_id}')
     
     # Add link to the file
     if 'err' not in response:
@@ -98,6 +174,50 @@ def fetch_file(file_id: str):
     
     return response
 
+def fetch_file_meta(file_id: str, keys: Sequence[str] = FILE_META_KEYS):
+    """
+    Fetch selected top-level metadata of a Figma file without loading its document tree.
+    
+    The response is stream-parsed and only scalar top-level fields named in keys
+    are kept, so large files never get fully deserialized.
+    
+    Args:
+        file_id (str): The Figma file ID
+        keys (Sequence[str]): Top-level fields to return
+        
+    Returns:
+        dict: The requested fields with an added 'link' field
+    """
+    url = f'https://api.figma.com/v1/files/{file_id}'
+    wanted = set(keys)
+    result = {}
+    events = ijson.sendable_list()
+    parser = ijson.parse_coro(events)
+    client = _get_http_client()
+    headers = get_headers(get_access_token())
+    # Retried like _api_get; the body is only parsed once a request succeeds
+    for attempt in range(MAX_RETRIES + 1):
+        if attempt:
+            time.sleep(RETRY_BACKOFF * (2 ** (attempt - 1)))
+        with client.stream('GET', url, headers=headers) as response:
+            if response.status_code in RETRY_STATUSES and attempt < MAX_RETRIES:
+                continue
+            if not response.is_success:
+                response.read()
+                return _error_json(response)
+            # Push body chunks into the parser and stop reading once every key is found
+            for chunk in response.iter_bytes():
+                parser.send(chunk)
+                for prefix, event, value in events:
+                    if prefix in wanted and event in ('string', 'number', 'boolean', 'null'):
+                        result[prefix] = value
+                del events[:]
+                if len(result) == len(wanted):
+                    break
+        break
+    result['link'] = create_figma_link(file_id)
+    return result
+
 def list_projects(team_id: str):
     """
     List all projects for a team.
@@ -108,10 +228,7 @@ def list_projects(team_id: str):
     Returns:
         dict: Projects data
     """
-    access_token = get_access_token()
-    url = f'https://api.figma.com/v1/teams/{team_id}/projects'
-    headers = get_headers(access_token)
-    return requests.get(url, headers=headers).json()
+    return _cached_get(f'https://api.figma.com/v1/teams/{team_id}/projects')
 
 def list_files(project_id: str):
     """
@@ -123,10 +240,7 @@ def list_files(project_id: str):
     Returns:
         dict: Files data with added links
     """
-    access_token = get_access_token()
-    url = f'https://api.figma.com/v1/projects/{project_id}/files'
-    headers = get_headers(access_token)
-    response = requests.get(url, headers=headers).json()
+    response = _cached_get(f'https://api.figma.com/v1/projects/{project_id}/files')
     
     # Add links to each file
     if 'err' not in response and 'files' in response:
@@ -169,19 +283,61 @@ def fetch_comments(file_id: str):
     access_token = get_access_token()
     url = f'https://api.figma.com/v1/files/{file_id}/comments'
     headers = get_headers(access_token)
-    response = requests.get(url, headers=headers).json()
+    http_response = _api_get(url, headers)
+    response = _json(http_response) if http_response.is_success else _error_json(http_response)
     
     # Add links to each comment that references a node
     if 'err' not in response and 'comments' in response:
+        base_url = FIGMA_FILE_URL + file_id
         for comment in response['comments']:
-            if 'client_meta' in comment and comment['client_meta'] and 'node_id' in comment['client_meta']:
-                node_id = comment['client_meta']['node_id']
-                comment['link'] = create_figma_link(file_id, node_id)
-            else:
-                comment['link'] = create_figma_link(file_id)
+            client_meta = comment.get('client_meta')
+            node_id = client_meta['node_id'] if client_meta and 'node_id' in client_meta else None
+            comment['link'] = f"{base_url}?node-id={node_id}" if node_id else base_url
     
     return response
 
+def _comment_timestamp(comment: Dict) -> int:
+    """Parse a comment's ISO 8601 created_at into epoch milliseconds (0 if missing or invalid)."""
+    created_at = comment.get('created_at')
+    if not created_at:
+        return 0
+    try:
+        return int(datetime.fromisoformat(created_at.replace('Z', '+00:00')).timestamp() * 1000)
+    except ValueError:
+        return 0
+
+def fetch_project_comments(project_id: str, limit: int = 5) -> List[Dict]:
+    """
+    Fetch the most recent comments across all files in a project.
+    
+    Args:
+        project_id (str): The project ID
+        limit (int): Maximum number of comments to return
+        
+    Returns:
+        list: Comments, newest first, each tagged with 'file_id' and 'file_name'
+    """
+    files_response = list_files(project_id)
+    if 'err' in files_response:
+        return []
+    files = [f for f in files_response.get('files', []) if f.get('key')]
+    if not files:
+        return []
+
+    # Comment requests are independent, so fetch them concurrently
+    with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(files))) as executor:
+        responses = list(executor.map(fetch_comments, [f['key'] for f in files]))
+
+    all_comments = []
+    for file, response in zip(files, responses):
+        for comment in response.get('comments', []):
+            comment['file_id'] = file['key']
+            comment['file_name'] = file.get('name')
+            all_comments.append(comment)
+
+    # Only the newest few are returned, so a bounded heap beats a full sort
+    return heapq.nlargest(limit, all_comments, key=_comment_timestamp)
+
 def post_comment(access_token: str, file_id: str, message: str, node_id: Optional[str] = None):
     """Post a comment, optionally linked to a node."""
     pass
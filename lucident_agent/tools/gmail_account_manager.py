@@ -1,43 +1,130 @@
+"""Gmail account credential storage in Supabase, with a local token file as fallback."""
 import os
-import json
+import orjson
+import atexit
 import logging
 import time
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Optional, List, Any, Union, Tuple
-from datetime import datetime
 from google.oauth2.credentials import Credentials
 from google.auth.transport.requests import Request
 from lucident_agent.Database import Database
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 # Constants
 TOKEN_FILE = 'gmail_tokens.json'
 TOKEN_TABLE = 'tokens'  # Using the table name from gmail_tools.py
+UPSERT_BATCH_SIZE = 50  # Buffered credential upserts sent per Supabase request
+UPSERT_FLUSH_INTERVAL = 1.0  # Seconds a buffered upsert may wait before it is sent
+FILE_SAVE_DELAY = 0.25  # Seconds token-file writes are debounced by
+MAX_WORKERS = 8  # Concurrent credential refreshes in get_credentials_many
+CREDENTIALS_CACHE_TTL = 300  # Seconds a parsed Credentials object is reused
+
+def _encode_token_data(credentials_dict: Dict[str, Any]) -> str:
+    """Serialize credentials for the token_data column as plain JSON."""
+    return orjson.dumps(credentials_dict).decode()
+
+def _decode_token_data(token_data: str) -> Dict[str, Any]:
+    """Parse a token_data value."""
+    return orjson.loads(token_data)
+
+_MISSING = object()  # Sentinel for dict.pop lookups
+
+# Managers with possibly unsent upserts, flushed at interpreter exit
+_live_managers: 'weakref.WeakSet[GmailAccountManager]' = weakref.WeakSet()
+
+def _flush_all_managers() -> None:
+    for manager in list(_live_managers):
+        manager.flush()
+        manager._do_save_to_file()
+
+atexit.register(_flush_all_managers)
+
+def _creds_signature(credentials_dict: Dict[str, Any]) -> Tuple[str, str]:
+    """Cheap fingerprint of stored credentials; changes whenever the token is refreshed."""
+    return (credentials_dict.get('expiry') or '', (credentials_dict.get('token') or '')[:16])
+
+def _creds_to_dict(creds: Credentials) -> Dict[str, Any]:
+    """Build the same dict as json.loads(creds.to_json()) without the JSON round-trip."""
+    credentials_dict = {
+        'token': creds.token,
+        'refresh_token': creds.refresh_token,
+        'token_uri': creds.token_uri,
+        'client_id': creds.client_id,
+        'client_secret': creds.client_secret,
+        'scopes': list(creds.scopes) if creds.scopes else None,
+        'rapt_token': creds.rapt_token,
+        'universe_domain': getattr(creds, 'universe_domain', None),
+        'account': getattr(creds, 'account', None),
+        # Naive UTC with a 'Z' suffix, the format from_authorized_user_info expects
+        'expiry': creds.expiry.isoformat() + 'Z' if creds.expiry else None,
+    }
+    return {key: value for key, value in credentials_dict.items() if value is not None}
 
 class GmailAccountManager:
     """Unified manager for Gmail account credentials using Supabase with file fallback."""
     
+    # Supabase client and probe result, shared by every manager in the process
+    _client_lock = threading.Lock()
+    _shared_client = None
+    _shared_ok: Optional[bool] = None
+    
     def __init__(self):
         self.use_supabase = True
         self.supabase = None
         self._init_supabase()
-        self.accounts = {}
+        # Stored accounts are loaded on first access; until then _accounts only
+        # holds accounts added in this session
+        self._accounts: Dict[str, Dict] = {}
+        self._loaded = False
+        self._load_lock = threading.Lock()
         self.default_account_id = None
-        self._load_accounts()
+        # Supabase upserts waiting to be sent as one batch, keyed by account ID
+        self._pending: Dict[str, Dict[str, str]] = {}
+        self._pending_lock = threading.Lock()
+        self._flush_timer: Optional[threading.Timer] = None
+        self._last_flush = time.monotonic() - UPSERT_FLUSH_INTERVAL
+        # Debounced token-file writes
+        self._file_dirty = False
+        self._file_lock = threading.Lock()
+        self._file_timer: Optional[threading.Timer] = None
+        # Parsed Credentials by account ID with their expiry and the stored dict's signature
+        self._creds_cache: Dict[str, Tuple[float, Tuple[str, str], Credentials]] = {}
+        # Also guards _accounts and _stale_ids, which pooled lookups update concurrently
+        self._creds_lock = threading.RLock()
+        self._refresh_locks: Dict[str, threading.Lock] = {}
+        # Accounts whose stored credentials must be re-read from Supabase
+        self._stale_ids: set = set()
+        _live_managers.add(self)
         
     def _init_supabase(self) -> None:
-        """Initialize Supabase connection."""
-        try:
-            self.supabase = Database().client
-            # Test connection
-            self.supabase.table(TOKEN_TABLE).select('*').limit(1).execute()
-            logger.info("Supabase client initialized successfully.")
-        except Exception as e:
-            logger.error(f"Error initializing Supabase: {e}")
-            self.use_supabase = False
-            logger.warning("Falling back to local file storage for Gmail tokens.")
+        """Initialize Supabase connection, probing it only once per process."""
+        cls = type(self)
+        with cls._client_lock:
+            if cls._shared_ok is None:
+                try:
+                    cls._shared_client = Database().client
+                    # Test the connection with a single-row query; accounts load lazily
+                    cls._shared_client.table(TOKEN_TABLE).select('user_id').limit(1).execute()
+                    cls._shared_ok = True
+                    logger.info("Supabase client initialized successfully.")
+                except Exception as e:
+                    logger.error(f"Error initializing Supabase: {e}")
+                    cls._shared_client = None
+                    cls._shared_ok = False
+                    logger.warning("Falling back to local file storage for Gmail tokens.")
+        self.supabase = cls._shared_client
+        self.use_supabase = cls._shared_ok
+
+    @classmethod
+    def reset_client(cls) -> None:
+        """Forget the shared Supabase client so the next manager probes again."""
+        with cls._client_lock:
+            cls._shared_client = None
+            cls._shared_ok = None
 
     def _check_supabase(self) -> bool:
         """Check if Supabase client is available."""
@@ -46,24 +133,32 @@ class GmailAccountManager:
             return False
         return True
     
+    @property
+    def accounts(self) -> Dict[str, Dict]:
+        """Account credentials by ID, loaded from storage on first access."""
+        if not self._loaded:
+            with self._load_lock:
+                if not self._loaded:
+                    accounts = self._load_accounts()
+                    with self._creds_lock:
+                        # Accounts added before the load are newer than the stored copies
+                        accounts.update(self._accounts)
+                        self._accounts = accounts
+                    self._loaded = True
+                    if self.default_account_id is None and accounts:
+                        self.default_account_id = next(iter(accounts))
+                        logger.info(f"Set {self.default_account_id} as the default account.")
+        return self._accounts
+
     def _load_accounts(self) -> Dict[str, Dict]:
         """Load accounts from Supabase or file."""
         if self.use_supabase:
             accounts = self._load_from_supabase()
             if accounts:
-                self.accounts = accounts
-                # Set default account if not already set
-                if self.default_account_id is None and self.accounts:
-                    self.default_account_id = next(iter(self.accounts))
-                    logger.info(f"Set {self.default_account_id} as the default account.")
                 return accounts
         
         # Fallback to file if Supabase failed or returned no accounts
-        accounts = self._load_from_file()
-        self.accounts = accounts
-        if self.accounts and self.default_account_id is None:
-            self.default_account_id = next(iter(self.accounts))
-        return accounts
+        return self._load_from_file()
     
     def _load_from_supabase(self) -> Dict[str, Dict]:
         """Load accounts from Supabase."""
@@ -72,18 +167,21 @@ class GmailAccountManager:
             return accounts
             
         try:
-            response = self.supabase.table(TOKEN_TABLE).select('user_id, token_data').eq('token_type', 'google').execute()
+            rows = self.supabase.table(TOKEN_TABLE).select('user_id, token_data').eq('token_type', 'google').execute().data
             
-            if response.data:
-                for record in response.data:
-                    account_id = record['user_id']
-                    try:
-                        token_data = json.loads(record['token_data'])
-                        accounts[account_id] = token_data
-                    except json.JSONDecodeError:
-                        logger.error(f"Could not parse token data for account {account_id}. Skipping.")
-                    except Exception as parse_err:
-                        logger.error(f"Error processing account details for {account_id}: {parse_err}")
+            if rows:
+                accounts = self._decode_rows_bulk(rows)
+                if accounts is None:
+                    accounts = {}
+                    for record in rows:
+                        account_id = record['user_id']
+                        try:
+                            token_data = _decode_token_data(record['token_data'])
+                            accounts[account_id] = token_data
+                        except orjson.JSONDecodeError:
+                            logger.error(f"Could not parse token data for account {account_id}. Skipping.")
+                        except Exception as parse_err:
+                            logger.error(f"Error processing account details for {account_id}: {parse_err}")
             
             logger.info(f"Loaded {len(accounts)} accounts from Supabase.")
             return accounts
@@ -93,29 +191,65 @@ class GmailAccountManager:
             self.use_supabase = False
             return {}
     
+    @staticmethod
+    def _decode_rows_bulk(rows: List[Dict[str, Any]]) -> Optional[Dict[str, Dict]]:
+        """Decode all token rows with a single orjson call over one JSON array.
+
+        Returns None if any row is malformed, so the caller can decode row by
+        row and skip only the bad records.
+        """
+        try:
+            payloads = [record['token_data'].encode() for record in rows]
+            decoded = orjson.loads(b'[' + b','.join(payloads) + b']')
+        except Exception:
+            return None
+        if len(decoded) != len(rows) or not all(isinstance(token, dict) for token in decoded):
+            return None
+        return {record['user_id']: token for record, token in zip(rows, decoded)}
+
     def _load_from_file(self) -> Dict[str, Dict]:
         """Load accounts from local file."""
         accounts = {}
         try:
-            if os.path.exists(TOKEN_FILE):
-                with open(TOKEN_FILE, 'r') as f:
-                    accounts = json.load(f)
-                logger.info(f"Loaded {len(accounts)} accounts from local file.")
-            else:
-                logger.info(f"Token file {TOKEN_FILE} does not exist. Starting with empty accounts.")
+            with open(TOKEN_FILE, 'rb') as f:
+                accounts = orjson.loads(f.read())
+            logger.info(f"Loaded {len(accounts)} accounts from local file.")
+        except FileNotFoundError:
+            logger.info(f"Token file {TOKEN_FILE} does not exist. Starting with empty accounts.")
         except Exception as e:
             logger.error(f"Error loading accounts from file: {e}")
             
         return accounts
     
     def _save_to_file(self) -> None:
-        """Save accounts to local file."""
-        try:
-            with open(TOKEN_FILE, 'w') as f:
-                json.dump(self.accounts, f)
-            logger.info(f"Saved {len(self.accounts)} accounts to local file.")
-        except Exception as e:
-            logger.error(f"Error saving accounts to file: {e}")
+        """Schedule a save of accounts to the local file, coalescing bursts of changes."""
+        with self._file_lock:
+            self._file_dirty = True
+            if self._file_timer is None:
+                self._file_timer = threading.Timer(FILE_SAVE_DELAY, self._do_save_to_file)
+                self._file_timer.daemon = True
+                self._file_timer.start()
+
+    def _do_save_to_file(self) -> None:
+        """Write accounts to the local file if there are unsaved changes."""
+        with self._file_lock:
+            if self._file_timer is not None:
+                self._file_timer.cancel()
+                self._file_timer = None
+            if not self._file_dirty:
+                return
+            self._file_dirty = False
+            try:
+                # Read accounts before writing: a pending lazy load reads this same file
+                accounts = self.accounts
+                # Write a temp file and swap it in so a crash never leaves a partial file
+                tmp_file = f"{TOKEN_FILE}.tmp"
+                with open(tmp_file, 'wb', buffering=1 << 20) as f:
+                    f.write(orjson.dumps(accounts))
+                os.replace(tmp_file, TOKEN_FILE)
+                logger.info(f"Saved {len(accounts)} accounts to local file.")
+            except Exception as e:
+                logger.error(f"Error saving accounts to file: {e}")
     
     def add_account(self, email: str, credentials_obj: Union[Credentials, Dict]) -> bool:
         """Add or update account credentials.
@@ -132,38 +266,33 @@ class GmailAccountManager:
             return False
             
         try:
-            # Convert Credentials object to JSON if needed
+            # Convert Credentials object to a dict if needed, then serialize once
             if isinstance(credentials_obj, Credentials):
-                token_json = credentials_obj.to_json()
-                credentials_dict = json.loads(token_json)
+                credentials_dict = _creds_to_dict(credentials_obj)
             else:
-                credentials_dict = credentials_obj
-                token_json = json.dumps(credentials_dict)
+                # Copy so later changes by the caller can't make the check below pass
+                credentials_dict = dict(credentials_obj)
+
+            # Nothing to persist if these exact credentials are already held
+            if self._accounts.get(email) == credentials_dict:
+                logger.debug(f"Credentials for {email} unchanged; skipping save.")
+                return True
+            token_data = _encode_token_data(credentials_dict)
             
-            # Update in-memory cache
-            self.accounts[email] = credentials_dict
+            # Update in-memory cache without forcing a load of stored accounts
+            with self._creds_lock:
+                self._accounts[email] = credentials_dict
+                self._stale_ids.discard(email)
             
-            # Set as default if it's the first account added in this session
-            if self.default_account_id is None:
+            # Set as default if it's the first account added in this session;
+            # before the first load, the default is picked when accounts load
+            if self._loaded and self.default_account_id is None:
                 self.default_account_id = email
                 logger.info(f"Set {email} as the default account.")
             
             # Save to Supabase if available
             if self._check_supabase():
-                try:
-                    # Use email as the user_id (primary key combined with token_type)
-                    data, count = self.supabase.table(TOKEN_TABLE).upsert({
-                        'user_id': email,
-                        'token_type': 'google',
-                        'token_data': token_json
-                    }, on_conflict='user_id, token_type').execute()
-                    
-                    logger.info(f"Successfully upserted credentials for {email} in Supabase.")
-                except Exception as e:
-                    logger.error(f"Error adding account {email} to Supabase: {e}", exc_info=True)
-                    logger.warning(f"Falling back to saving account {email} to local file.")
-                    self._save_to_file()
-                    return False
+                return self._queue_upsert(email, token_data)
             else:
                 # If Supabase is not available, save to file
                 self._save_to_file()
@@ -174,14 +303,78 @@ class GmailAccountManager:
             logger.error(f"Unexpected error adding account {email}: {e}", exc_info=True)
             return False
 
+    def _queue_upsert(self, email: str, token_data: str) -> bool:
+        """Buffer a credentials upsert, sending the batch once it is full or due.
+
+        An upsert after an idle period is sent right away; bursts are coalesced
+        and sent within UPSERT_FLUSH_INTERVAL seconds.
+
+        Returns:
+            bool: False only if an immediate send failed
+        """
+        # Use email as the user_id (primary key combined with token_type)
+        row = {'user_id': email, 'token_type': 'google', 'token_data': token_data}
+        with self._pending_lock:
+            self._pending[email] = row
+            due = (len(self._pending) >= UPSERT_BATCH_SIZE
+                   or time.monotonic() - self._last_flush >= UPSERT_FLUSH_INTERVAL)
+            if not due and self._flush_timer is None:
+                self._flush_timer = threading.Timer(UPSERT_FLUSH_INTERVAL, self.flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+        return self.flush() if due else True
+
+    def flush(self) -> bool:
+        """Send buffered credential upserts to Supabase in a single request.
+
+        Returns:
+            bool: True if nothing was pending or the upsert succeeded
+        """
+        with self._pending_lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            rows = list(self._pending.values())
+            self._pending.clear()
+            self._last_flush = time.monotonic()
+        if not rows:
+            return True
+        try:
+            self.supabase.table(TOKEN_TABLE).upsert(rows, on_conflict='user_id, token_type').execute()
+            logger.info(f"Successfully upserted credentials for {len(rows)} account(s) in Supabase.")
+            return True
+        except Exception as e:
+            account_ids = ', '.join(row['user_id'] for row in rows)
+            logger.error(f"Error adding account(s) {account_ids} to Supabase: {e}", exc_info=True)
+            logger.warning(f"Falling back to saving account(s) {account_ids} to local file.")
+            self._save_to_file()
+            return False
+
     def get_accounts(self) -> Dict[str, Dict[str, Any]]:
         """Get all configured accounts with their credentials."""
         return self.accounts
         
     def get_default_account(self) -> Optional[str]:
         """Get the default account ID."""
+        if self.default_account_id is None and not self._loaded:
+            # Look up a single ID instead of loading and decoding every account
+            if self.use_supabase:
+                self.default_account_id = self._fetch_first_account_id()
+            if self.default_account_id is None:
+                self.accounts  # Loading picks the default account
         return self.default_account_id
 
+    def _fetch_first_account_id(self) -> Optional[str]:
+        """Return the ID of the first stored account, as a full load would pick it."""
+        if not self._check_supabase():
+            return None
+        try:
+            rows = self.supabase.table(TOKEN_TABLE).select('user_id').eq('token_type', 'google').limit(1).execute().data
+        except Exception as e:
+            logger.error(f"Error fetching default account from Supabase: {e}")
+            return None
+        return rows[0]['user_id'] if rows else None
+
     def get_account_credentials(self, account_id: str) -> Optional[Dict]:
         """Get credentials for a specific account.
         
@@ -195,8 +388,47 @@ class GmailAccountManager:
             logger.warning("No account_id provided to get_account_credentials.")
             return None
             
+        if self.use_supabase and (account_id in self._stale_ids
+                                  or (not self._loaded and account_id not in self._accounts)):
+            # Re-checked under the lock so a concurrent invalidate() can't be lost
+            with self._creds_lock:
+                stale = account_id in self._stale_ids
+                if stale or (not self._loaded and account_id not in self._accounts):
+                    # Fetch just this account rather than loading every stored one
+                    self._prefetch_accounts([account_id], replace=stale)
+                    self._stale_ids.discard(account_id)
+        if account_id in self._accounts:
+            return self._accounts[account_id]
         return self.accounts.get(account_id)
 
+    def _fetch_rows(self, account_ids: List[str]) -> List[Dict[str, Any]]:
+        """Fetch the token rows of specific accounts in a single IN query."""
+        if not account_ids or not self._check_supabase():
+            return []
+        return self.supabase.table(TOKEN_TABLE).select('user_id, token_data').eq('token_type', 'google').in_('user_id', account_ids).execute().data or []
+
+    def _prefetch_accounts(self, account_ids: List[str], replace: bool = False) -> None:
+        """Pull the given accounts from Supabase into memory without a full load.
+
+        Accounts already in memory are kept unless replace is set.
+        """
+        try:
+            rows = self._fetch_rows(account_ids)
+        except Exception as e:
+            logger.error(f"Error fetching accounts {account_ids} from Supabase: {e}")
+            return
+        for record in rows:
+            account_id = record['user_id']
+            try:
+                token_data = _decode_token_data(record['token_data'])
+                with self._creds_lock:
+                    if replace:
+                        self._accounts[account_id] = token_data
+                    else:
+                        self._accounts.setdefault(account_id, token_data)
+            except Exception as parse_err:
+                logger.error(f"Could not parse token data for account {account_id}: {parse_err}")
+
     def get_all_account_ids(self) -> List[str]:
         """Get list of all account IDs."""
         return list(self.accounts.keys())
@@ -214,11 +446,15 @@ class GmailAccountManager:
             logger.warning("No account_id provided to remove_account.")
             return False
             
-        removed_from_memory = False
-        if account_id in self.accounts:
-            del self.accounts[account_id]
-            removed_from_memory = True
-            
+        # Drop any buffered upsert so a later flush cannot restore the account
+        with self._pending_lock:
+            self._pending.pop(account_id, None)
+        with self._creds_lock:
+            self._creds_cache.pop(account_id, None)
+            self._stale_ids.discard(account_id)
+
+        removed_from_memory = self.accounts.pop(account_id, _MISSING) is not _MISSING
+        if removed_from_memory:
             # If removing the default, reset default
             if self.default_account_id == account_id:
                 self.default_account_id = next(iter(self.accounts)) if self.accounts else None
@@ -241,6 +477,18 @@ class GmailAccountManager:
         self._save_to_file()
         
         return removed_from_memory
+
+    def _refresh_lock(self, account_id: str) -> threading.Lock:
+        """Return the lock serializing token refreshes for an account."""
+        with self._creds_lock:
+            return self._refresh_locks.setdefault(account_id, threading.Lock())
+
+    def invalidate(self, account_id: str) -> None:
+        """Drop the cached Credentials of an account and re-read it from storage on next use."""
+        with self._creds_lock:
+            self._creds_cache.pop(account_id, None)
+            if self.use_supabase:
+                self._stale_ids.add(account_id)
         
     def get_credentials(self, account_id: str) -> Optional[Credentials]:
         """Get valid Credentials object for Gmail API from storage. Handles refresh.
@@ -259,28 +507,78 @@ class GmailAccountManager:
                 logger.error(f"Account {account_id} credentials not found.")
                 return None
 
+            # Reuse the parsed Credentials while the stored token is unchanged and still valid
+            signature = _creds_signature(credentials_dict)
+            with self._creds_lock:
+                cached = self._creds_cache.get(account_id)
+            if (cached and cached[0] > time.monotonic() and cached[1] == signature
+                    and cached[2].valid):
+                return cached[2]
+
             # Create credentials object from dictionary
             creds = Credentials.from_authorized_user_info(credentials_dict)
 
             # Check if credentials need refresh
             if not creds.valid:
                 if creds.expired and creds.refresh_token:
-                    logger.info(f"Credentials for {account_id} expired. Attempting refresh.")
-                    try:
-                        creds.refresh(Request())
-                        logger.info(f"Credentials for {account_id} refreshed successfully.")
-                        # Update token in storage
-                        self.add_account(account_id, creds)
-                    except Exception as e:
-                        logger.error(f"Failed to refresh credentials for {account_id}: {e}", exc_info=True)
-                        return None
+                    # One refresh per account at a time; concurrent refreshes waste
+                    # token requests and the last writer's token wins
+                    with self._refresh_lock(account_id):
+                        # Another thread may have refreshed the token while we waited
+                        current = self._accounts.get(account_id)
+                        if current and _creds_signature(current) != signature:
+                            signature = _creds_signature(current)
+                            creds = Credentials.from_authorized_user_info(current)
+                        if not creds.valid:
+                            logger.info(f"Credentials for {account_id} expired. Attempting refresh.")
+                            try:
+                                creds.refresh(Request())
+                                logger.info(f"Credentials for {account_id} refreshed successfully.")
+                                # Update token in storage
+                                self.add_account(account_id, creds)
+                                signature = _creds_signature(self._accounts.get(account_id, {}))
+                            except Exception as e:
+                                logger.error(f"Failed to refresh credentials for {account_id}: {e}", exc_info=True)
+                                self.invalidate(account_id)
+                                return None
                 else:
                     logger.error(f"Credentials for {account_id} are invalid or expired, and no refresh token is available.")
                     return None
 
             logger.debug(f"Valid credentials obtained for {account_id}.")
+            with self._creds_lock:
+                self._creds_cache[account_id] = (time.monotonic() + CREDENTIALS_CACHE_TTL, signature, creds)
             return creds
 
         except Exception as e:
             logger.error(f"Error getting or refreshing credentials for {account_id}: {e}", exc_info=True)
-            return None 
\ No newline at end of file
+            return None
+
+    def get_credentials_for(self, account_ids: List[str]) -> Dict[str, Optional[Credentials]]:
+        """Get Credentials for a known set of accounts, fetching only their rows.
+
+        Accounts not yet in memory are pulled with one Supabase IN query instead
+        of loading every stored account.
+        """
+        if not self._loaded and self.use_supabase:
+            with self._creds_lock:
+                missing = [account_id for account_id in dict.fromkeys(account_ids) if account_id not in self._accounts]
+            self._prefetch_accounts(missing)
+        return self.get_credentials_many(account_ids)
+
+    def get_credentials_many(self, account_ids: List[str]) -> Dict[str, Optional[Credentials]]:
+        """Get valid Credentials for several accounts, refreshing expired ones concurrently.
+
+        Refreshed tokens go through add_account, so their upserts are batched.
+
+        Args:
+            account_ids: Emails/IDs of the accounts
+
+        Returns:
+            Dict mapping each account ID to its Credentials, or None if not found/invalid
+        """
+        unique_ids = list(dict.fromkeys(account_ids))
+        if not unique_ids:
+            return {}
+        with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(unique_ids))) as executor:
+            return dict(zip(unique_ids, executor.map(self.get_credentials, unique_ids)))
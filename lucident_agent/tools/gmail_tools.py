@@ -7,15 +7,18 @@ import base64
 import socket
 import webbrowser
 import logging
-import time
+import threading
+from itertools import islice
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Dict, List, Union, Any, TypedDict, Literal, Tuple
 from zoneinfo import ZoneInfo
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
 from googleapiclient.discovery import build
+import google_auth_httplib2
 from google_auth_oauthlib.flow import InstalledAppFlow
 from email.mime.text import MIMEText
-from tenacity import retry, stop_after_attempt, wait_exponential
+from tenacity import retry, stop_after_attempt, wait_exponential_jitter
 from googleapiclient.errors import HttpError
 from dotenv import load_dotenv
 from supabase import create_client, Client
@@ -24,6 +27,7 @@ from supabase import create_client, Client
 from lucident_agent.Database import Database
 # Import consolidated GmailAccountManager
 from lucident_agent.tools.gmail_account_manager import GmailAccountManager
+from lucident_agent.tools.http_transport import HttpxTransport, get_http_client
 
 # Load environment variables from .env file
 load_dotenv()
@@ -44,6 +48,17 @@ SCOPES = [
 DEFAULT_ACCOUNT = 'default'
 MAX_RETRIES = 3
 RATE_LIMIT_DELAY = 1  # seconds
+# Headers requested when messages are fetched without their bodies
+MESSAGE_METADATA_HEADERS = ['Subject', 'From', 'Date']
+TARGET_HDRS = frozenset(MESSAGE_METADATA_HEADERS)
+MAX_WORKERS = 8  # Accounts searched concurrently
+BATCH_CHUNK_SIZE = 50  # Message requests per batch; Gmail allows 100 but slows past ~50
+BATCH_MAX_WORKERS = 4  # Batch chunks executed concurrently per call
+RATE_LIMIT_BACKOFF = 5  # Seconds to wait on HTTP 429 when Gmail sends no Retry-After
+MAX_RETRY_AFTER = 60  # Cap on server-requested waits, in seconds
+MESSAGE_CACHE_MAX_ENTRIES = 2048  # Parsed message details kept in memory
+SERVICE_CACHE_MAX_ENTRIES = 64  # Built Gmail services kept, oldest evicted first
+LIST_PAGE_SIZE = 500  # Most message IDs messages.list returns per page
 
 # --- Use Database class for Supabase access ---
 try:
@@ -174,11 +189,31 @@ def find_free_port():
         s.bind(('', 0))
         return s.getsockname()[1]
 
-@retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=4, max=10))
-def execute_with_retry(request):
-    """Execute Gmail API request with retry logic."""
+def _retry_after_seconds(error: HttpError) -> float:
+    """Seconds to wait before retrying a 429, from its Retry-After header if usable."""
+    retry_after = error.resp.get('retry-after') or error.resp.get('Retry-After')
     try:
-        result = request.execute()
+        return min(max(float(retry_after), 0), MAX_RETRY_AFTER)
+    except (TypeError, ValueError):
+        return RATE_LIMIT_BACKOFF
+
+# Jittered backoff keeps concurrent batches that hit limits together from retrying in lockstep
+_backoff = wait_exponential_jitter(initial=4, max=10)
+
+def _retry_wait(retry_state) -> float:
+    """Wait as long as Gmail asks on a 429, otherwise back off with jitter."""
+    exc = retry_state.outcome.exception()
+    if isinstance(exc, HttpError) and exc.resp.status == 429:
+        return _retry_after_seconds(exc)
+    if exc is not None and "Too many concurrent requests" in str(exc):
+        return RATE_LIMIT_BACKOFF
+    return _backoff(retry_state)
+
+@retry(stop=stop_after_attempt(3), wait=_retry_wait)
+def execute_with_retry(request, http=None):
+    """Execute Gmail API request with retry logic, optionally over a specific Http."""
+    try:
+        result = request.execute(http=http)
         if result is None:
             logger.error("Gmail API request returned None")
             return None
@@ -186,20 +221,89 @@ def execute_with_retry(request):
     except HttpError as error:
         if error.resp.status in [429, 500, 503]:
             logger.warning(f"Retrying after HTTP error {error.resp.status}: {error}")
-            # Add delay for rate limit errors
-            if error.resp.status == 429:
-                time.sleep(5)  # Wait 5 seconds before retry
             raise
         logger.error(f"Gmail API error: {error}")
         return None
     except Exception as e:
         if "Too many concurrent requests" in str(e):
             logger.warning("Concurrent request limit reached, waiting before retry")
-            time.sleep(5)  # Wait 5 seconds before retry
             raise
         logger.error(f"Unexpected error in execute_with_retry: {e}")
         return None
 
+def _extract_headers(headers: List[Dict[str, str]]) -> Dict[str, str]:
+    """Pick the TARGET_HDRS out of a message's headers, stopping once all are found."""
+    found = {}
+    for header in headers:
+        name = header['name']
+        if name in TARGET_HDRS and name not in found:
+            found[name] = header['value']
+            if len(found) == len(TARGET_HDRS):
+                break
+    return found
+
+def _find_text_plain(payload: Dict[str, Any]) -> Optional[str]:
+    """Return the encoded data of the first text/plain part, searching nested multiparts."""
+    for part in payload.get('parts', ()):
+        if part.get('mimeType') == 'text/plain':
+            data = part.get('body', {}).get('data')
+            if data:
+                return data
+        if 'parts' in part:
+            data = _find_text_plain(part)
+            if data:
+                return data
+    return None
+
+def _message_body(payload: Dict[str, Any]) -> str:
+    """Decode a message's plain-text body; undecodable bytes are replaced rather than raising."""
+    if 'parts' in payload:
+        data = _find_text_plain(payload)
+    else:
+        data = payload.get('body', {}).get('data')
+    return base64.urlsafe_b64decode(data).decode('utf-8', errors='replace') if data else ""
+
+# Parsed message details keyed by (account_id, message_id), flagged with whether
+# the body was fetched. Message contents never change, so entries never go stale.
+_message_cache: Dict[Tuple[str, str], Tuple[bool, Dict[str, Any]]] = {}
+_message_cache_lock = threading.Lock()
+
+def _get_cached_messages(account_id: str, messages: List[Dict[str, str]], need_body: bool) -> Dict[str, Dict[str, Any]]:
+    """Return copies of the cached details of listed messages, keyed by message ID."""
+    found = {}
+    with _message_cache_lock:
+        for msg in messages:
+            cached = _message_cache.get((account_id, msg['id']))
+            if cached and (cached[0] or not need_body):
+                found[msg['id']] = dict(cached[1])
+    return found
+
+def _cache_message(account_id: str, details: Dict[str, Any], has_body: bool) -> None:
+    """Remember a message's parsed details, evicting the oldest entry when full."""
+    cache_key = (account_id, details['id'])
+    with _message_cache_lock:
+        _message_cache.pop(cache_key, None)
+        if len(_message_cache) >= MESSAGE_CACHE_MAX_ENTRIES:
+            del _message_cache[next(iter(_message_cache))]
+        _message_cache[cache_key] = (has_body, dict(details))
+
+def _iter_messages(service, query: Optional[str] = None, page_size: int = LIST_PAGE_SIZE):
+    """Yield message stubs ({'id', 'threadId'}) page by page, following nextPageToken.
+
+    Stops at the first page that fails or comes back empty.
+    """
+    request = service.users().messages().list(userId='me', q=query, maxResults=min(page_size, LIST_PAGE_SIZE))
+    while request is not None:
+        response = execute_with_retry(request)
+        if not response or 'messages' not in response:
+            return
+        yield from response['messages']
+        request = service.users().messages().list_next(request, response)
+
+def _new_authorized_http(credentials: Credentials) -> google_auth_httplib2.AuthorizedHttp:
+    """Return an Http authorized with the given credentials over the shared httpx client."""
+    return google_auth_httplib2.AuthorizedHttp(credentials, http=HttpxTransport(get_http_client()))
+
 def get_credentials(account_id: str) -> Optional[Credentials]:
     """Get valid credentials for Gmail API. Delegates to account_manager."""
     return account_manager.get_credentials(account_id)
@@ -220,8 +324,128 @@ def create_gmail_message_link(message_id: str, thread_id: Optional[str] = None)
         return f"https://mail.google.com/mail/u/0/#inbox/{thread_id}"
     return f"https://mail.google.com/mail/u/0/#inbox/{message_id}"
 
-def get_gmail_messages(account_id: Optional[str] = None, max_results: int = 10) -> GmailMessageResponse:
-    """Get Gmail messages using batch operations."""
+def _fetch_message_details(service, credentials: Credentials, account_id: str, messages: List[Dict[str, str]],
+                           include_body: bool) -> Tuple[List[Dict[str, Any]], List[str], Optional[Exception]]:
+    """Fetch details of listed messages in concurrent batches of at most BATCH_CHUNK_SIZE.
+
+    Returns the details in listing order, per-message error strings, and the first
+    exception a whole batch failed with (None if every batch ran).
+    """
+    # Reuse details fetched by earlier calls and only request the rest
+    cached_details = _get_cached_messages(account_id, messages, include_body)
+    to_fetch = [msg for msg in messages if msg['id'] not in cached_details]
+    # Details land in their listing position, so results keep the listing order
+    # however chunks interleave; each slot is written by exactly one callback
+    position = {msg['id']: i for i, msg in enumerate(messages)}
+    message_slots = [None] * len(messages)
+    for message_id, details in cached_details.items():
+        message_slots[position[message_id]] = details
+    batch_errors = []
+    # Chunks run concurrently, so their callbacks append errors under this lock
+    results_lock = threading.Lock()
+
+    # Define batch callback function
+    def callback(request_id, response, exception):
+        if exception:
+            # Check if this is a 404 error specifically
+            if isinstance(exception, HttpError) and exception.resp.status == 404:
+                error_msg = f"Message {request_id} not found (404): The email may have been moved or deleted"
+                logger.warning(error_msg)
+                with results_lock:
+                    batch_errors.append(error_msg)
+                # Don't treat 404 as fatal, just skip this message
+                return
+            else:
+                error_msg = f"Error fetching message {request_id}: {exception}"
+                logger.error(error_msg)
+                with results_lock:
+                    batch_errors.append(error_msg)
+                # Optionally check if exception is retryable HttpError and handle if needed
+            return
+        if response:
+            try:
+                headers = _extract_headers(response['payload']['headers'])
+                # Metadata-only responses carry no body parts
+                body = _message_body(response['payload']) if include_body else ""
+
+                # Create link to the message in Gmail UI
+                thread_id = response.get('threadId')
+                message_link = create_gmail_message_link(response['id'], thread_id)
+
+                details = {
+                    'id': response['id'],
+                    'subject': headers.get('Subject', 'No subject'),
+                    'from_': headers.get('From', 'Unknown sender'),
+                    'date': headers.get('Date', 'Unknown date'),
+                    'snippet': response.get('snippet', ''),
+                    'body': body[:500] + ('...' if len(body) > 500 else ''), # Truncate body
+                    'link': message_link
+                }
+                _cache_message(account_id, details, include_body)
+                message_slots[position[response['id']]] = details
+            except Exception as proc_err:
+                error_msg = f"Error processing message {response.get('id', '[unknown ID]')} in batch callback: {proc_err}"
+                logger.error(error_msg, exc_info=True)
+                with results_lock:
+                    batch_errors.append(error_msg)
+
+    # Split the requests into batches of at most BATCH_CHUNK_SIZE, run concurrently
+    chunks = [to_fetch[i:i + BATCH_CHUNK_SIZE] for i in range(0, len(to_fetch), BATCH_CHUNK_SIZE)]
+
+    def execute_chunk(chunk):
+        """Execute one batch with retry, returning its exception instead of raising."""
+        batch = service.new_batch_http_request()
+        for msg in chunk:
+            # Check quota per message get (Consider removing if relying solely on retry)
+            # if not quota_manager.check_quota("users.messages.get", account_id):
+            #     logger.warning(f"Quota possibly exceeded for users.messages.get on account {account_id}, skipping message {msg['id']}")
+            #     batch_errors.append(f"Quota likely exceeded before fetching message {msg['id']}")
+            #     continue # Skip adding this request if quota might be hit
+
+            if include_body:
+                get_request = service.users().messages().get(
+                    userId="me",
+                    id=msg["id"],
+                    format="full" # Fetch full details
+                )
+            else:
+                # Headers and snippet only; a fraction of the full MIME payload
+                get_request = service.users().messages().get(
+                    userId="me",
+                    id=msg["id"],
+                    format="metadata",
+                    metadataHeaders=MESSAGE_METADATA_HEADERS
+                )
+            batch.add(get_request, callback=callback, request_id=msg["id"])
+
+        # Each concurrent chunk gets its own AuthorizedHttp; connections stay pooled
+        http = _new_authorized_http(credentials) if len(chunks) > 1 else None
+        try:
+            execute_with_retry(batch, http=http)
+        except Exception as chunk_err:
+            return chunk_err
+        return None
+
+    # Execute batch requests with retry
+    if len(chunks) <= 1:
+        chunk_errors = [execute_chunk(chunk) for chunk in chunks]
+    else:
+        with ThreadPoolExecutor(max_workers=min(BATCH_MAX_WORKERS, len(chunks))) as executor:
+            chunk_errors = list(executor.map(execute_chunk, chunks))
+    message_details_list = [details for details in message_slots if details is not None]
+    batch_exec_err = next((err for err in chunk_errors if err is not None), None)
+    return message_details_list, batch_errors, batch_exec_err
+
+def get_gmail_messages(account_id: Optional[str] = None, max_results: int = 10, include_body: bool = False) -> GmailMessageResponse:
+    """Get Gmail messages using batch operations.
+
+    Args:
+        account_id: Account to read; the default account if omitted
+        max_results: Maximum number of messages to return
+        include_body: Also return each message's plain-text body (truncated to
+            500 characters). Without it only headers and snippets are downloaded
+            and 'body' is empty.
+    """
     # Determine target account early
     target_account_id = account_id or account_manager.get_default_account()
     if not target_account_id:
@@ -235,8 +459,9 @@ def get_gmail_messages(account_id: Optional[str] = None, max_results: int = 10)
         )
 
     try:
-        # Get service for account
-        service_response = get_gmail_service(target_account_id)
+        # Get service for account; the credentials also authorize per-chunk connections
+        credentials = account_manager.get_credentials(target_account_id)
+        service_response = get_gmail_service(target_account_id, credentials=credentials)
         if service_response.get('status') == 'error':
             logger.error(f"Failed to get Gmail service for {target_account_id} in get_gmail_messages.")
             return GmailMessageResponse(
@@ -249,11 +474,10 @@ def get_gmail_messages(account_id: Optional[str] = None, max_results: int = 10)
         service = service_response['service']
         actual_account_id = service_response['account'] # Use the account ID returned by get_gmail_service
 
-        # Get message list
-        request = service.users().messages().list(userId='me', maxResults=max_results)
-        results = execute_with_retry(request)
+        # Get message list, paging past the per-request limit when needed
+        messages = list(islice(_iter_messages(service, page_size=max_results), max_results))
 
-        if not results or 'messages' not in results:
+        if not messages:
             logger.info(f"No messages found for account {actual_account_id}")
             return GmailMessageResponse(
                 status="success",
@@ -263,98 +487,26 @@ def get_gmail_messages(account_id: Optional[str] = None, max_results: int = 10)
                 error_message=None
             )
 
-        messages = results['messages']
-        message_details_list = []
-        batch_errors = []
-
-        # Define batch callback function
-        def callback(request_id, response, exception):
-            nonlocal batch_errors # Allow modifying outer scope variable
-            if exception:
-                # Check if this is a 404 error specifically
-                if isinstance(exception, HttpError) and exception.resp.status == 404:
-                    error_msg = f"Message {request_id} not found (404): The email may have been moved or deleted"
-                    logger.warning(error_msg)
-                    batch_errors.append(error_msg)
-                    # Don't treat 404 as fatal, just skip this message
-                    return
-                else:
-                    error_msg = f"Error fetching message {request_id}: {exception}"
-                    logger.error(error_msg)
-                    batch_errors.append(error_msg)
-                    # Optionally check if exception is retryable HttpError and handle if needed
-                return
-            if response:
-                try:
-                    headers = {h['name']: h['value'] for h in response['payload']['headers']}
-                    body = ""
-                    if 'parts' in response['payload']:
-                        for part in response['payload']['parts']:
-                            if part['mimeType'] == 'text/plain':
-                                body_data = part['body'].get('data', '')
-                                if body_data:
-                                    body = base64.urlsafe_b64decode(body_data).decode('utf-8')
-                                    break
-                    elif 'body' in response['payload'] and 'data' in response['payload']['body']:
-                        body_data = response['payload']['body']['data']
-                        body = base64.urlsafe_b64decode(body_data).decode('utf-8')
-
-                    # Create link to the message in Gmail UI
-                    thread_id = response.get('threadId')
-                    message_link = create_gmail_message_link(response['id'], thread_id)
-
-                    message_details_list.append({
-                        'id': response['id'],
-                        'subject': headers.get('Subject', 'No subject'),
-                        'from_': headers.get('From', 'Unknown sender'),
-                        'date': headers.get('Date', 'Unknown date'),
-                        'snippet': response.get('snippet', ''),
-                        'body': body[:500] + ('...' if len(body) > 500 else ''), # Truncate body
-                        'link': message_link
-                    })
-                except Exception as proc_err:
-                    error_msg = f"Error processing message {response.get('id', '[unknown ID]')} in batch callback: {proc_err}"
-                    logger.error(error_msg, exc_info=True)
-                    batch_errors.append(error_msg)
-
-        # Add requests to batch (Consider smaller batch sizes if needed, e.g., 50 or 100)
-        batch = service.new_batch_http_request()
-        for msg in messages:
-            # Check quota per message get (Consider removing if relying solely on retry)
-            # if not quota_manager.check_quota("users.messages.get", actual_account_id):
-            #     logger.warning(f"Quota possibly exceeded for users.messages.get on account {actual_account_id}, skipping message {msg['id']}")
-            #     batch_errors.append(f"Quota likely exceeded before fetching message {msg['id']}")
-            #     continue # Skip adding this request if quota might be hit
-
-            get_request = service.users().messages().get(
-                userId="me",
-                id=msg["id"],
-                format="full" # Fetch full details
-            )
-            batch.add(get_request, callback=callback, request_id=msg["id"])
-
-        # Execute batch request with retry
-        if batch._order: # Check if batch has requests before executing
-            try:
-                 execute_with_retry(batch)
-            except Exception as batch_exec_err:
-                logger.error(f"Batch execution failed for account {actual_account_id}: {batch_exec_err}", exc_info=True)
-                # Don't treat batch errors as fatal if we have some results
-                if message_details_list:
-                    logger.info(f"Returning {len(message_details_list)} messages despite batch errors")
-                    return GmailMessageResponse(
-                        status="partial_success",
-                        account=actual_account_id,
-                        messages=message_details_list,
-                        report=f"Retrieved {len(message_details_list)} messages with some errors",
-                        error_message=f"Batch execution error: {str(batch_exec_err)}"
-                    )
-                else:
-                    # Return error for the impl function if no results at all
-                    return GmailErrorResponse(
-                        status="error",
-                        error_message=f"Batch execution failed while fetching details: {str(batch_exec_err)}"
-                    )
+        message_details_list, batch_errors, batch_exec_err = _fetch_message_details(
+            service, credentials, actual_account_id, messages, include_body)
+        if batch_exec_err is not None:
+            logger.error(f"Batch execution failed for account {actual_account_id}: {batch_exec_err}", exc_info=batch_exec_err)
+            # Don't treat batch errors as fatal if we have some results
+            if message_details_list:
+                logger.info(f"Returning {len(message_details_list)} messages despite batch errors")
+                return GmailMessageResponse(
+                    status="partial_success",
+                    account=actual_account_id,
+                    messages=message_details_list,
+                    report=f"Retrieved {len(message_details_list)} messages with some errors",
+                    error_message=f"Batch execution error: {str(batch_exec_err)}"
+                )
+            else:
+                # Return error for the impl function if no results at all
+                return GmailErrorResponse(
+                    status="error",
+                    error_message=f"Batch execution failed while fetching details: {str(batch_exec_err)}"
+                )
 
         # Categorize errors by type for better reporting
         error_summary = ""
@@ -415,12 +567,17 @@ def get_gmail_messages(account_id: Optional[str] = None, max_results: int = 10)
         )
 
 
-def get_gmail_messages_for_account(account_id: str, max_results: int = 10) -> Union[GmailMessageResponse, GmailErrorResponse]:
-    """Get recent messages from a specific Gmail account using batch operations."""
+def get_gmail_messages_for_account(account_id: str, max_results: int = 10,
+                                   include_body: bool = False) -> Union[GmailMessageResponse, GmailErrorResponse]:
+    """Get recent messages from a specific Gmail account using batch operations.
+
+    Kept as a wrapper over get_gmail_messages: anything but a full success comes
+    back as a GmailErrorResponse.
+    """
     logger.info(f"Fetching messages for account {account_id} with max_results={max_results}")
     # This function now essentially wraps get_gmail_messages
     # We pass the specific account_id directly
-    response = get_gmail_messages(account_id=account_id, max_results=max_results)
+    response = get_gmail_messages(account_id=account_id, max_results=max_results, include_body=include_body)
 
     # Convert the response format if necessary or return directly
     if response['status'] == 'success':
@@ -442,7 +599,8 @@ def search_gmail_with_query(query: str, max_results: int = 10, account_id: Optio
 
         accounts_to_search = []
         if account_id:
-            # Verify the single account exists
+            # Fetch only this account's row; the lookup below is then an in-memory hit
+            creds_by_id = account_manager.get_credentials_for([account_id])
             if account_manager.get_account_credentials(account_id):
                 accounts_to_search.append(account_id)
             else:
@@ -463,18 +621,27 @@ def search_gmail_with_query(query: str, max_results: int = 10, account_id: Optio
                     total_accounts=0
                 )
             accounts_to_search = list(all_accounts.keys())
+            # Build every account's Credentials from the rows loaded above
+            creds_by_id = account_manager.get_credentials_many(accounts_to_search)
 
+        # Tokens refreshed above were queued for upsert; send them as one batch now
+        account_manager.flush()
         logger.info(f"Accounts to search: {accounts_to_search}")
         all_results = []
         accounts_with_data = []
         total_accounts_searched = len(accounts_to_search)
 
-        # Search each account sequentially, but use batching within each account search
-        for acc_id in accounts_to_search:
+        # Accounts are independent, so search them concurrently; map keeps the
+        # results in account order so the truncation below stays deterministic
+        def search_account(acc_id):
             logger.debug(f"Searching account: {acc_id}")
             # Use the internal implementation which now uses batching
-            result = _search_gmail_impl(acc_id, search_query, max_results)
+            return _search_gmail_impl(acc_id, search_query, max_results, creds_by_id.get(acc_id))
+
+        with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(accounts_to_search))) as executor:
+            results = list(executor.map(search_account, accounts_to_search))
 
+        for acc_id, result in zip(accounts_to_search, results):
             if result["status"] == "success":
                 account_messages = result.get("messages", [])
                 if account_messages:
@@ -517,10 +684,14 @@ def search_gmail_with_query(query: str, max_results: int = 10, account_id: Optio
         )
 
 
-def _search_gmail_impl(account_id: str, query: str, max_results: int) -> Union[GmailMessageResponse, GmailErrorResponse]:
+def _search_gmail_impl(account_id: str, query: str, max_results: int,
+                       credentials: Optional[Credentials] = None) -> Union[GmailMessageResponse, GmailErrorResponse]:
     """Internal implementation of Gmail search using batch requests for message details."""
     logger.debug(f"Executing search query '{query}' for account {account_id}, max_results={max_results}")
-    service_result = get_gmail_service(account_id)
+    # The credentials also authorize the per-chunk connections of large fetches
+    if credentials is None:
+        credentials = account_manager.get_credentials(account_id)
+    service_result = get_gmail_service(account_id, credentials)
     if service_result["status"] == "error":
         # Propagate the error from get_gmail_service
         return GmailErrorResponse(
@@ -532,14 +703,9 @@ def _search_gmail_impl(account_id: str, query: str, max_results: int) -> Union[G
 
     try:
         # 1. Search for message IDs
-        list_request = service.users().messages().list(
-            userId='me',
-            q=query,
-            maxResults=max_results # Limit the number of IDs returned initially
-        )
-        results = execute_with_retry(list_request)
+        messages_ids = list(islice(_iter_messages(service, query, page_size=max_results), max_results))
 
-        if not results or 'messages' not in results:
+        if not messages_ids:
             logger.debug(f"No messages found matching query '{query}' in account {account_id}")
             return GmailMessageResponse(
                 status="success",
@@ -549,95 +715,29 @@ def _search_gmail_impl(account_id: str, query: str, max_results: int) -> Union[G
                 error_message=None
             )
 
-        messages_ids = results['messages']
         logger.debug(f"Found {len(messages_ids)} message IDs matching query in {account_id}.")
 
-        # 2. Fetch full message details using batch request
-        message_details_list = []
-        batch_errors = []
-
-        # Define batch callback function (similar to get_gmail_messages)
-        def callback(request_id, response, exception):
-            nonlocal batch_errors
-            if exception:
-                # Check if this is a 404 error specifically
-                if isinstance(exception, HttpError) and exception.resp.status == 404:
-                    error_msg = f"Message {request_id} not found (404): The email may have been moved or deleted"
-                    logger.warning(error_msg)
-                    batch_errors.append(error_msg)
-                    # Don't treat 404 as fatal, just skip this message
-                    return
-                else:
-                    error_msg = f"Error fetching message {request_id}: {exception}"
-                    logger.error(error_msg)
-                    batch_errors.append(error_msg)
-                    # Optionally check if exception is retryable HttpError and handle if needed
-                return
-            if response:
-                try:
-                    headers = {h['name']: h['value'] for h in response['payload']['headers']}
-                    body = ""
-                    if 'parts' in response['payload']:
-                        for part in response['payload']['parts']:
-                            if part['mimeType'] == 'text/plain':
-                                body_data = part['body'].get('data', '')
-                                if body_data:
-                                    body = base64.urlsafe_b64decode(body_data).decode('utf-8')
-                                    break
-                    elif 'body' in response['payload'] and 'data' in response['payload']['body']:
-                        body_data = response['payload']['body']['data']
-                        body = base64.urlsafe_b64decode(body_data).decode('utf-8')
-
-                    # Create link to the message in Gmail UI
-                    thread_id = response.get('threadId')
-                    message_link = create_gmail_message_link(response['id'], thread_id)
-
-                    message_details_list.append({
-                        'id': response['id'],
-                        'subject': headers.get('Subject', 'No subject'),
-                        'from_': headers.get('From', 'Unknown sender'),
-                        'date': headers.get('Date', 'Unknown date'),
-                        'snippet': response.get('snippet', ''),
-                        'body': body[:500] + ('...' if len(body) > 500 else ''), # Truncate body
-                        'link': message_link
-                    })
-                except Exception as proc_err:
-                    error_msg = f"Error processing message {response.get('id', '[unknown ID]')} in search batch callback: {proc_err}"
-                    logger.error(error_msg, exc_info=True)
-                    batch_errors.append(error_msg)
-
-        # Add requests to batch
-        batch = service.new_batch_http_request()
-        for msg in messages_ids:
-            get_request = service.users().messages().get(
-                userId="me",
-                id=msg["id"],
-                format="full"
-            )
-            batch.add(get_request, callback=callback, request_id=msg["id"])
-
-        # Execute batch request with retry
-        if batch._order:
-             try:
-                 execute_with_retry(batch)
-             except Exception as batch_exec_err:
-                logger.error(f"Batch execution failed during search for account {account_id}: {batch_exec_err}", exc_info=True)
-                # Don't treat batch errors as fatal if we have some results
-                if message_details_list:
-                    logger.info(f"Returning {len(message_details_list)} messages despite batch errors")
-                    return GmailMessageResponse(
-                        status="partial_success",
-                        account=account_id,
-                        messages=message_details_list,
-                        report=f"Retrieved {len(message_details_list)} messages with some errors",
-                        error_message=f"Batch execution error: {str(batch_exec_err)}"
-                    )
-                else:
-                    # Return error for the impl function if no results at all
-                    return GmailErrorResponse(
-                        status="error",
-                        error_message=f"Batch execution failed while fetching details: {str(batch_exec_err)}"
-                    )
+        # 2. Fetch full message details in batches, reusing cached ones
+        message_details_list, batch_errors, batch_exec_err = _fetch_message_details(
+            service, credentials, account_id, messages_ids, True)
+        if batch_exec_err is not None:
+            logger.error(f"Batch execution failed during search for account {account_id}: {batch_exec_err}", exc_info=batch_exec_err)
+            # Don't treat batch errors as fatal if we have some results
+            if message_details_list:
+                logger.info(f"Returning {len(message_details_list)} messages despite batch errors")
+                return GmailMessageResponse(
+                    status="partial_success",
+                    account=account_id,
+                    messages=message_details_list,
+                    report=f"Retrieved {len(message_details_list)} messages with some errors",
+                    error_message=f"Batch execution error: {str(batch_exec_err)}"
+                )
+            else:
+                # Return error for the impl function if no results at all
+                return GmailErrorResponse(
+                    status="error",
+                    error_message=f"Batch execution failed while fetching details: {str(batch_exec_err)}"
+                )
 
         # Categorize errors by type for better reporting
         error_summary = ""
@@ -819,17 +919,7 @@ def analyze_email_content(email_id: str) -> GmailAnalysisResponse:
         sender = next((header['value'] for header in headers if header['name'].lower() == 'from'), 'Unknown sender')
         
         # Extract body content
-        body = ""
-        if 'parts' in msg['payload']:
-            for part in msg['payload']['parts']:
-                if part['mimeType'] == 'text/plain':
-                    body_data = part['body'].get('data', '')
-                    if body_data:
-                        body = base64.urlsafe_b64decode(body_data).decode('utf-8')
-                        break
-        elif 'body' in msg['payload'] and 'data' in msg['payload']['body']:
-            body_data = msg['payload']['body']['data']
-            body = base64.urlsafe_b64decode(body_data).decode('utf-8')
+        body = _message_body(msg['payload'])
         
         # Analyze the content for categories
         full_content = f"{subject} {sender} {body}"
@@ -939,17 +1029,7 @@ def extract_email_metadata(email_id: str) -> GmailMetadataResponse:
                     attachment_info.append(part['filename'])
         
         # Extract body content
-        body = ""
-        if 'parts' in msg['payload']:
-            for part in msg['payload']['parts']:
-                if part['mimeType'] == 'text/plain':
-                    body_data = part['body'].get('data', '')
-                    if body_data:
-                        body = base64.urlsafe_b64decode(body_data).decode('utf-8')
-                        break
-        elif 'body' in msg['payload'] and 'data' in msg['payload']['body']:
-            body_data = msg['payload']['body']['data']
-            body = base64.urlsafe_b64decode(body_data).decode('utf-8')
+        body = _message_body(msg['payload'])
         
         # Create the full content for analysis
         full_content = f"{subject} {sender} {body}"
@@ -1180,17 +1260,7 @@ def check_upcoming_deadlines() -> GmailDeadlineResponse:
             date = next((h['value'] for h in headers if h['name'].lower() == 'date'), 'Unknown date')
             
             # Extract body
-            body = ""
-            if 'parts' in msg['payload']:
-                for part in msg['payload']['parts']:
-                    if part['mimeType'] == 'text/plain':
-                        body_data = part['body'].get('data', '')
-                        if body_data:
-                            body = base64.urlsafe_b64decode(body_data).decode('utf-8')
-                            break
-            elif 'body' in msg['payload'] and 'data' in msg['payload']['body']:
-                body_data = msg['payload']['body']['data']
-                body = base64.urlsafe_b64decode(body_data).decode('utf-8')
+            body = _message_body(msg['payload'])
             
             # Find deadline-related content in the email
             content = f"{subject} {body}".lower()
@@ -1277,6 +1347,7 @@ def remove_gmail_account(account_id: str) -> GmailAccountResponse:
         )
     # Use the manager method
     removed = account_manager.remove_account(account_id)
+    invalidate_gmail_service(account_id)
     if removed:
         return GmailAccountResponse(
             status="success",
@@ -1455,9 +1526,42 @@ def _authenticate_and_store_new_account(manager: GmailAccountManager) -> Tuple[b
 # --- End New Auth Flow ---
 
 
+# Built services keyed by account_id, each tagged with the Credentials it was built
+# from. They run over the thread-safe shared httpx transport, so one service per
+# account serves every thread. A refresh yields new Credentials, forcing a rebuild.
+_service_cache: Dict[str, Tuple[Credentials, Any]] = {}
+_service_cache_lock = threading.Lock()
+
+def _get_cached_service(account_id: str, credentials: Credentials) -> Any:
+    """Return the Gmail service for an account, building it if needed."""
+    with _service_cache_lock:
+        cached = _service_cache.get(account_id)
+    if cached and cached[0] is credentials:
+        logger.debug(f"Using cached Gmail service for account {account_id}.")
+        return cached[1]
+    # Services are cached here, so the discovery file cache would only add disk I/O
+    http = _new_authorized_http(credentials)
+    service = build('gmail', 'v1', http=http, cache_discovery=False)
+    with _service_cache_lock:
+        _service_cache.pop(account_id, None)
+        while len(_service_cache) >= SERVICE_CACHE_MAX_ENTRIES:
+            del _service_cache[next(iter(_service_cache))]
+        _service_cache[account_id] = (credentials, service)
+    logger.info(f"Successfully built Gmail service for {account_id}")
+    return service
+
+def invalidate_gmail_service(account_id: str) -> None:
+    """Drop cached Gmail services for an account so the next call rebuilds them."""
+    with _service_cache_lock:
+        _service_cache.pop(account_id, None)
+
 # Gmail functionality (modified get_gmail_service)
-def get_gmail_service(account_id: Optional[str] = None) -> GmailServiceResponse:
-    """Get Gmail service for specified account using credentials from account manager."""
+def get_gmail_service(account_id: Optional[str] = None, credentials: Optional[Credentials] = None) -> GmailServiceResponse:
+    """Get Gmail service for specified account using credentials from account manager.
+
+    Callers that already hold valid credentials for the account can pass them
+    to skip the lookup.
+    """
     try:
         # Determine the target account ID
         target_account_id = account_id or account_manager.get_default_account()
@@ -1471,8 +1575,9 @@ def get_gmail_service(account_id: Optional[str] = None) -> GmailServiceResponse:
             )
 
         logger.info(f"Getting Gmail service for account: {target_account_id}")
-        # Get credentials using the account manager
-        credentials = account_manager.get_credentials(target_account_id)
+        # Get credentials using the account manager unless the caller supplied them
+        if credentials is None:
+            credentials = account_manager.get_credentials(target_account_id)
 
         if not credentials:
             # get_credentials logs the specific error
@@ -1483,9 +1588,8 @@ def get_gmail_service(account_id: Optional[str] = None) -> GmailServiceResponse:
                 account=target_account_id
             )
 
-        # Build the service
-        service = build('gmail', 'v1', credentials=credentials)
-        logger.info(f"Successfully built Gmail service for {target_account_id}")
+        # Reuse the account's service while the credentials are unchanged
+        service = _get_cached_service(target_account_id, credentials)
         return GmailServiceResponse(
             status="success",
             error_message=None,
@@ -0,0 +1,63 @@
+import logging
+import threading
+from typing import Optional
+
+import httplib2
+import httpx
+
+logger = logging.getLogger(__name__)
+
+HTTP_TIMEOUT = 60  # seconds
+HTTP_MAX_KEEPALIVE_CONNECTIONS = 8
+
+class HttpxTransport:
+    """httplib2-compatible transport backed by a shared HTTP/2 httpx client.
+
+    googleapiclient and google-auth-httplib2 only call ``request()`` and a few
+    attributes, so this lets concurrent Google API calls from different threads
+    multiplex over one connection to googleapis.com instead of opening a new
+    HTTP/1.1 connection per in-flight request.
+    """
+
+    def __init__(self, client: httpx.Client):
+        self.client = client
+        self.timeout = HTTP_TIMEOUT
+        self.follow_redirects = True
+        self.redirect_codes = frozenset({300, 301, 302, 303, 307, 308})
+        self.connections = {}
+
+    def request(self, uri, method="GET", body=None, headers=None, redirections=5, connection_type=None, **kwargs):
+        # redirections=0 disables redirects as in httplib2; otherwise the shared
+        # client's redirect limit (httpx max_redirects) applies instead of the count
+        response = self.client.request(method, uri, content=body, headers=headers, timeout=self.timeout,
+                                       follow_redirects=bool(redirections))
+        info = {key: value for key, value in response.headers.items() if key != "content-encoding"}
+        info["status"] = str(response.status_code)
+        # httpx has already decoded the body, mirror httplib2 which strips the encoding header
+        return httplib2.Response(info), response.content
+
+    def close(self):
+        # The underlying client is shared across services; it lives for the whole process.
+        pass
+
+_http_client: Optional[httpx.Client] = None
+_http_client_lock = threading.Lock()
+
+def get_http_client() -> httpx.Client:
+    """Return the process-wide httpx client, creating it on first use."""
+    global _http_client
+    with _http_client_lock:
+        if _http_client is None:
+            try:
+                _http_client = httpx.Client(
+                    http2=True,
+                    follow_redirects=True,
+                    limits=httpx.Limits(max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS),
+                )
+            except ImportError:
+                logger.warning("HTTP/2 support unavailable (install httpx[http2]); falling back to HTTP/1.1.")
+                _http_client = httpx.Client(
+                    follow_redirects=True,
+                    limits=httpx.Limits(max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS),
+                )
+        return _http_client
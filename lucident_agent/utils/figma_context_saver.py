@@ -2,7 +2,7 @@ import sys
 import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
 
-from lucident_agent.tools.figma_account_manager import FigmaAccountManager
+from lucident_agent.tools.figma_account_manager import get_figma_account_manager
 from lucident_agent.Database import Database
 import requests
 import logging
@@ -14,7 +14,6 @@ logger = logging.getLogger(__name__)
 
 load_dotenv()
 db = Database().client
-figma_account_manager = FigmaAccountManager()
 
 # Helper to get user info from Figma API
 def get_figma_user_info(access_token):
@@ -50,9 +49,10 @@ def get_figma_files(project_id: str, access_token: str):
 
 def format_figma_users_markdown():
     lines = []
+    figma_account_manager = get_figma_account_manager()
     for user_id in figma_account_manager.get_all_account_ids():
         creds = figma_account_manager.get_account_credentials(user_id)
-        access_token = creds.get("access_token")
+        access_token = creds.access_token
         user_info = get_figma_user_info(access_token)
         if user_info:
             lines.append(f"*{user_info.get('handle', user_id)}*")
@@ -71,9 +71,10 @@ def format_figma_projects_markdown():
         logger.warning("FIGMA_TEAM_ID not found in .env")
         return "No team ID configured"
         
+    figma_account_manager = get_figma_account_manager()
     for user_id in figma_account_manager.get_all_account_ids():
         creds = figma_account_manager.get_account_credentials(user_id)
-        access_token = creds.get("access_token")
+        access_token = creds.access_token
         projects = get_figma_projects(access_token, team_id)
         lines.append(f"**Team {team_id}**")
         if projects: